@@ -1,16 +1,98 @@
 #!/usr/bin/env python3
+import importlib.metadata
+import importlib.util
+import json
+import re
 import subprocess
 import sys
 import os
 
+REQUIREMENT_PATTERN = re.compile(r"^([A-Za-z0-9_.\-]+)\s*(==|>=)\s*([0-9][0-9A-Za-z.]*)")
+
+def _pip_env():
+    """Environment for pip runs, sharing a wheel cache between dev installs"""
+    return {
+        **os.environ,
+        "PIP_CACHE_DIR": os.path.expanduser("~/.cache/worldd-pip"),
+        "PIP_PREFER_BINARY": "1",
+    }
+
+def _version_tuple(version):
+    """Leading numeric release components of a version string"""
+    parts = []
+    for part in version.split('.'):
+        match = re.match(r"\d+", part)
+        if not match:
+            break
+        parts.append(int(match.group()))
+    return tuple(parts)
+
+def _is_editable_installed(name):
+    """Check whether the distribution is installed in development mode"""
+    try:
+        direct_url = importlib.metadata.distribution(name).read_text("direct_url.json")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    if not direct_url:
+        return False
+    return json.loads(direct_url).get("dir_info", {}).get("editable", False)
+
+def _requirements_satisfied():
+    """Check requirements.txt against installed distributions without pip"""
+    try:
+        with open("requirements.txt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return False
+
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        match = REQUIREMENT_PATTERN.match(line)
+        if not match:
+            # Anything more complex than name==ver / name>=ver is left to pip
+            return False
+        name, operator, required = match.groups()
+        try:
+            installed = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        if operator == "==" and installed != required:
+            return False
+        if operator == ">=" and _version_tuple(installed) < _version_tuple(required):
+            return False
+
+    return _is_editable_installed("world-simulation")
+
 def install_dev():
     """Install the package in development mode"""
+    if _requirements_satisfied():
+        print("Development installation already up to date.")
+        print("You can now run the game with: python -m src.main")
+        return
+
     try:
-        # Install dependencies
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        
-        # Install package in development mode
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-e", "."])
+        args = [sys.executable, "-m", "pip", "--disable-pip-version-check",
+                "install", "--no-compile", "-r", "requirements.txt", "-e", "."]
+
+        if os.environ.get("CI"):
+            args.append("--quiet")
+
+        # Build the editable install against the current environment when
+        # setuptools is already available instead of an isolated build venv
+        if importlib.util.find_spec("setuptools") is not None:
+            args.append("--no-build-isolation")
+
+        # Install dependencies and the package in development mode in a
+        # single pip run so dependencies are resolved only once
+        subprocess.run(args, check=True, env=_pip_env(),
+                       stdout=sys.stdout, stderr=subprocess.STDOUT)
+
+        # Byte-compile the game sources on all cores up front instead of
+        # leaving pip or the first game launch to do it serially
+        subprocess.run([sys.executable, "-m", "compileall", "-q", "-j", "0", "src"],
+                       check=True)
         
         print("Development installation successful!")
         print("You can now run the game with: python -m src.main")
@@ -20,4 +102,4 @@ def install_dev():
         sys.exit(1)
 
 if __name__ == "__main__":
-    install_dev() 
\ No newline at end of file
+    install_dev() 
@@ -2,13 +2,16 @@
 World Simulation Game Package
 """
 
-from . import constants
-from . import game
-from . import world
-from . import ui
-from . import entities
-from . import systems
+import importlib
 
 __version__ = '0.1.0'
 
-__all__ = ['constants', 'game', 'world', 'ui', 'entities', 'systems'] 
\ No newline at end of file
+__all__ = ['constants', 'game', 'world', 'ui', 'entities', 'systems']
+
+def __getattr__(name):
+    """Import subpackages on first access instead of at package import"""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,118 @@
 """Game constants and configuration"""
-import os
 import pygame
-import math
-from typing import Dict, List, Tuple, Callable
+import random
+import sys
+import numpy as np
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Final, List, NamedTuple, Optional, Tuple
 
-# Initialize pygame for font support
-pygame.init()
-if not pygame.font.get_init():
-    pygame.font.init()
+# Spec records for the read-only tables below. Field access is a plain
+# attribute load instead of a string-keyed dict lookup.
+class SeasonSpec(NamedTuple):
+    base_temp: int
+    growth_mod: float
+    precipitation: float
+    day_length: int
+    color: Tuple[int, int, int]
+
+class EntityEffects(NamedTuple):
+    mood: float
+    energy: float
+
+class LightningSpec(NamedTuple):
+    frequency: float  # Lightning strikes per second
+    intensity: float
+    duration: float  # Duration of flash in seconds
+
+class WindEffectsSpec(NamedTuple):
+    intensity: float
+    direction_change_rate: float  # Direction changes per second
+    sound_volume: float
+
+class WeatherGraphics(NamedTuple):
+    sky_color: Tuple[int, int, int]
+    cloud_color: Tuple[int, int, int]
+    sun_intensity: float
+    shadow_intensity: float
+    particle_effects: bool
+    lightning: Optional[LightningSpec] = None
+    wind_effects: Optional[WindEffectsSpec] = None
+
+class WeatherSpec(NamedTuple):
+    description: str
+    temperature_mod: int
+    wind_speed: float
+    humidity: float
+    precipitation: float
+    darkness: float
+    fog: float
+    particle_rate: int
+    particle_color: Optional[Tuple[int, int, int]]
+    duration: Tuple[int, int]
+    max_wind: float
+    possible_seasons: Tuple[str, ...]
+    probability: float
+    season_probability_mod: Dict[str, float]
+    particle_count: int
+    overlay_alpha: float
+    status_effects: Tuple[str, ...]
+    visibility: float
+    movement_speed: float
+    entity_effects: EntityEffects
+    graphics: WeatherGraphics
+
+    def to_dict(self) -> Dict:
+        """Nested plain-dict form of the spec, e.g. for serialization"""
+        data = self._asdict()
+        data['entity_effects'] = self.entity_effects._asdict()
+        graphics = self.graphics._asdict()
+        for key in ('lightning', 'wind_effects'):
+            if graphics[key] is None:
+                del graphics[key]
+            else:
+                graphics[key] = graphics[key]._asdict()
+        data['graphics'] = graphics
+        return data
+
+class BiomeSpec(NamedTuple):
+    color: Tuple[int, int, int]
+    walkable: bool
+    base_fertility: float
+    moisture_retention: float
+    temperature_mod: int
+    features: Tuple[str, ...]
+    resources: Tuple[str, ...]
+
+class EntityStateSpec(NamedTuple):
+    name: str
+    icon: str
+    energy_cost: float
+
+class EntityNeedSpec(NamedTuple):
+    name: str
+    icon: str
+    decay_rate: float
+    critical_threshold: float
+
+class InteractionSpec(NamedTuple):
+    name: str
+    icon: str
+    duration: float
+    social_impact: float
+
+class MoodSpec(NamedTuple):
+    icon: str
+    color: Tuple[int, int, int]
+    social_bonus: float
+
+class HumanTypeSpec(NamedTuple):
+    sprite: str
+    speed: float
+    vision_range: int
+    intelligence: float
+    starting_skills: Dict[str, float]
 
 # Window settings
 WINDOW_WIDTH = 1280
@@ -42,294 +147,315 @@ TIME_SPEEDS = {
     'ultra': 5.0
 }
 
-# World dimensions
-WORLD_WIDTH = 1000
-WORLD_HEIGHT = 1000
-CHUNK_SIZE = 32
-TILE_SIZE = 32
-WORLD_CHUNKS_X = WORLD_WIDTH // (CHUNK_SIZE * TILE_SIZE)
-WORLD_CHUNKS_Y = WORLD_HEIGHT // (CHUNK_SIZE * TILE_SIZE)
-
 # Seasons and their properties
 SEASONS = {
-    'spring': {
-        'base_temp': 15,
-        'growth_mod': 1.2,
-        'precipitation': 0.6,
-        'day_length': 12,
-        'color': (124, 252, 0)
-    },
-    'summer': {
-        'base_temp': 25,
-        'growth_mod': 1.0,
-        'precipitation': 0.3,
-        'day_length': 14,
-        'color': (255, 255, 0)
-    },
-    'autumn': {
-        'base_temp': 10,
-        'growth_mod': 0.8,
-        'precipitation': 0.7,
-        'day_length': 10,
-        'color': (255, 140, 0)
-    },
-    'winter': {
-        'base_temp': 0,
-        'growth_mod': 0.4,
-        'precipitation': 0.8,
-        'day_length': 8,
-        'color': (255, 250, 250)
-    }
+    'spring': SeasonSpec(
+        base_temp=15,
+        growth_mod=1.2,
+        precipitation=0.6,
+        day_length=12,
+        color=(124, 252, 0)
+    ),
+    'summer': SeasonSpec(
+        base_temp=25,
+        growth_mod=1.0,
+        precipitation=0.3,
+        day_length=14,
+        color=(255, 255, 0)
+    ),
+    'autumn': SeasonSpec(
+        base_temp=10,
+        growth_mod=0.8,
+        precipitation=0.7,
+        day_length=10,
+        color=(255, 140, 0)
+    ),
+    'winter': SeasonSpec(
+        base_temp=0,
+        growth_mod=0.4,
+        precipitation=0.8,
+        day_length=8,
+        color=(255, 250, 250)
+    )
 }
 
 # Weather types and their properties
 WEATHER_TYPES = {
-    'clear': {
-        'description': 'Clear sunny weather',
-        'temperature_mod': 5,
-        'wind_speed': 0.2,
-        'humidity': 0.3,
-        'precipitation': 0,
-        'darkness': 0,
-        'fog': 0,
-        'particle_rate': 0,
-        'particle_color': None,
-        'duration': (1800, 3600),  # 30-60 minutes
-        'max_wind': 2.0,
-        'possible_seasons': ['spring', 'summer', 'autumn'],
-        'probability': 0.4,
-        'season_probability_mod': {
+    'clear': WeatherSpec(
+        description='Clear sunny weather',
+        temperature_mod=5,
+        wind_speed=0.2,
+        humidity=0.3,
+        precipitation=0,
+        darkness=0,
+        fog=0,
+        particle_rate=0,
+        particle_color=None,
+        duration=(1800, 3600),  # 30-60 minutes
+        max_wind=2.0,
+        possible_seasons=('spring', 'summer', 'autumn'),
+        probability=0.4,
+        season_probability_mod={
             'summer': 1.5,
             'winter': 0.5
         },
-        'particle_count': 0,
-        'overlay_alpha': 0,
-        'status_effects': [],
-        'visibility': 1.0,
-        'movement_speed': 1.0,
-        'entity_effects': {
-            'mood': 0.1,  # Slight mood boost
-            'energy': 0.05  # Slight energy boost
-        },
-        'graphics': {
-            'sky_color': (135, 206, 235),  # Sky blue
-            'cloud_color': (255, 255, 255),
-            'sun_intensity': 1.0,
-            'shadow_intensity': 1.0,
-            'particle_effects': False
-        }
-    },
-    'cloudy': {
-        'description': 'Overcast with clouds',
-        'temperature_mod': -2,
-        'wind_speed': 0.4,
-        'humidity': 0.6,
-        'precipitation': 0,
-        'darkness': 0.2,
-        'fog': 0.1,
-        'particle_rate': 0,
-        'particle_color': None,
-        'duration': (1200, 2400),  # 20-40 minutes
-        'max_wind': 3.0,
-        'possible_seasons': ['spring', 'summer', 'autumn', 'winter'],
-        'probability': 0.3,
-        'season_probability_mod': {
+        particle_count=0,
+        overlay_alpha=0,
+        status_effects=(),
+        visibility=1.0,
+        movement_speed=1.0,
+        entity_effects=EntityEffects(
+            mood=0.1,  # Slight mood boost
+            energy=0.05  # Slight energy boost
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(135, 206, 235),  # Sky blue
+            cloud_color=(255, 255, 255),
+            sun_intensity=1.0,
+            shadow_intensity=1.0,
+            particle_effects=False
+        )
+    ),
+    'cloudy': WeatherSpec(
+        description='Overcast with clouds',
+        temperature_mod=-2,
+        wind_speed=0.4,
+        humidity=0.6,
+        precipitation=0,
+        darkness=0.2,
+        fog=0.1,
+        particle_rate=0,
+        particle_color=None,
+        duration=(1200, 2400),  # 20-40 minutes
+        max_wind=3.0,
+        possible_seasons=('spring', 'summer', 'autumn', 'winter'),
+        probability=0.3,
+        season_probability_mod={
             'autumn': 1.3,
             'spring': 1.2
         },
-        'particle_count': 0,
-        'overlay_alpha': 0.2,
-        'status_effects': [],
-        'visibility': 0.8,
-        'movement_speed': 1.0,
-        'entity_effects': {
-            'mood': -0.05,  # Slight mood decrease
-            'energy': 0
-        },
-        'graphics': {
-            'sky_color': (169, 169, 169),  # Dark gray
-            'cloud_color': (128, 128, 128),
-            'sun_intensity': 0.6,
-            'shadow_intensity': 0.7,
-            'particle_effects': False
-        }
-    },
-    'rain': {
-        'description': 'Steady rainfall',
-        'temperature_mod': -5,
-        'wind_speed': 0.6,
-        'humidity': 0.9,
-        'precipitation': 0.5,
-        'darkness': 0.4,
-        'fog': 0.2,
-        'particle_rate': 100,
-        'particle_color': (200, 200, 255),
-        'duration': (600, 1800),  # 10-30 minutes
-        'max_wind': 4.0,
-        'possible_seasons': ['spring', 'summer', 'autumn'],
-        'probability': 0.2,
-        'season_probability_mod': {
+        particle_count=0,
+        overlay_alpha=0.2,
+        status_effects=(),
+        visibility=0.8,
+        movement_speed=1.0,
+        entity_effects=EntityEffects(
+            mood=-0.05,  # Slight mood decrease
+            energy=0
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(169, 169, 169),  # Dark gray
+            cloud_color=(128, 128, 128),
+            sun_intensity=0.6,
+            shadow_intensity=0.7,
+            particle_effects=False
+        )
+    ),
+    'rain': WeatherSpec(
+        description='Steady rainfall',
+        temperature_mod=-5,
+        wind_speed=0.6,
+        humidity=0.9,
+        precipitation=0.5,
+        darkness=0.4,
+        fog=0.2,
+        particle_rate=100,
+        particle_color=(200, 200, 255),
+        duration=(600, 1800),  # 10-30 minutes
+        max_wind=4.0,
+        possible_seasons=('spring', 'summer', 'autumn'),
+        probability=0.2,
+        season_probability_mod={
             'spring': 1.5,
             'winter': 0.2
         },
-        'particle_count': 100,
-        'overlay_alpha': 0.4,
-        'status_effects': ['wet'],
-        'visibility': 0.6,
-        'movement_speed': 0.8,
-        'entity_effects': {
-            'mood': -0.1,  # Mood decrease
-            'energy': -0.05  # Slight energy decrease
-        },
-        'graphics': {
-            'sky_color': (105, 105, 105),  # Dim gray
-            'cloud_color': (82, 82, 82),
-            'sun_intensity': 0.3,
-            'shadow_intensity': 0.4,
-            'particle_effects': True
-        }
-    },
-    'storm': {
-        'description': 'Thunderstorm with heavy rain',
-        'temperature_mod': -8,
-        'wind_speed': 1.0,
-        'humidity': 1.0,
-        'precipitation': 1.0,
-        'darkness': 0.7,
-        'fog': 0.3,
-        'particle_rate': 200,
-        'particle_color': (180, 180, 255),
-        'duration': (300, 900),  # 5-15 minutes
-        'max_wind': 8.0,
-        'possible_seasons': ['spring', 'summer'],
-        'probability': 0.1,
-        'season_probability_mod': {
+        particle_count=100,
+        overlay_alpha=0.4,
+        status_effects=('wet',),
+        visibility=0.6,
+        movement_speed=0.8,
+        entity_effects=EntityEffects(
+            mood=-0.1,  # Mood decrease
+            energy=-0.05  # Slight energy decrease
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(105, 105, 105),  # Dim gray
+            cloud_color=(82, 82, 82),
+            sun_intensity=0.3,
+            shadow_intensity=0.4,
+            particle_effects=True
+        )
+    ),
+    'storm': WeatherSpec(
+        description='Thunderstorm with heavy rain',
+        temperature_mod=-8,
+        wind_speed=1.0,
+        humidity=1.0,
+        precipitation=1.0,
+        darkness=0.7,
+        fog=0.3,
+        particle_rate=200,
+        particle_color=(180, 180, 255),
+        duration=(300, 900),  # 5-15 minutes
+        max_wind=8.0,
+        possible_seasons=('spring', 'summer'),
+        probability=0.1,
+        season_probability_mod={
             'summer': 1.3,
             'winter': 0
         },
-        'particle_count': 200,
-        'overlay_alpha': 0.6,
-        'status_effects': ['wet', 'scared'],
-        'visibility': 0.3,
-        'movement_speed': 0.6,
-        'entity_effects': {
-            'mood': -0.2,  # Significant mood decrease
-            'energy': -0.1  # Energy decrease
-        },
-        'graphics': {
-            'sky_color': (47, 79, 79),  # Dark slate gray
-            'cloud_color': (44, 62, 80),
-            'sun_intensity': 0.1,
-            'shadow_intensity': 0.2,
-            'particle_effects': True,
-            'lightning': {
-                'frequency': 0.1,  # Lightning strikes per second
-                'intensity': 1.0,
-                'duration': 0.2  # Duration of flash in seconds
-            }
-        }
-    },
-    'snow': {
-        'description': 'Gentle snowfall',
-        'temperature_mod': -10,
-        'wind_speed': 0.3,
-        'humidity': 0.7,
-        'precipitation': 0.4,
-        'darkness': 0.3,
-        'fog': 0.4,
-        'particle_rate': 50,
-        'particle_color': (255, 255, 255),
-        'duration': (1200, 2400),  # 20-40 minutes
-        'max_wind': 2.0,
-        'possible_seasons': ['winter'],
-        'probability': 0.3,
-        'season_probability_mod': {
+        particle_count=200,
+        overlay_alpha=0.6,
+        status_effects=('wet', 'scared'),
+        visibility=0.3,
+        movement_speed=0.6,
+        entity_effects=EntityEffects(
+            mood=-0.2,  # Significant mood decrease
+            energy=-0.1  # Energy decrease
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(47, 79, 79),  # Dark slate gray
+            cloud_color=(44, 62, 80),
+            sun_intensity=0.1,
+            shadow_intensity=0.2,
+            particle_effects=True,
+            lightning=LightningSpec(
+                frequency=0.1,  # Lightning strikes per second
+                intensity=1.0,
+                duration=0.2  # Duration of flash in seconds
+            )
+        )
+    ),
+    'snow': WeatherSpec(
+        description='Gentle snowfall',
+        temperature_mod=-10,
+        wind_speed=0.3,
+        humidity=0.7,
+        precipitation=0.4,
+        darkness=0.3,
+        fog=0.4,
+        particle_rate=50,
+        particle_color=(255, 255, 255),
+        duration=(1200, 2400),  # 20-40 minutes
+        max_wind=2.0,
+        possible_seasons=('winter',),
+        probability=0.3,
+        season_probability_mod={
             'winter': 2.0,
             'summer': 0
         },
-        'particle_count': 50,
-        'overlay_alpha': 0.3,
-        'status_effects': ['cold'],
-        'visibility': 0.7,
-        'movement_speed': 0.7,
-        'entity_effects': {
-            'mood': 0.05,  # Slight mood boost (scenic)
-            'energy': -0.1  # Energy decrease due to cold
-        },
-        'graphics': {
-            'sky_color': (220, 220, 220),  # Light gray
-            'cloud_color': (192, 192, 192),
-            'sun_intensity': 0.5,
-            'shadow_intensity': 0.6,
-            'particle_effects': True
-        }
-    },
-    'blizzard': {
-        'description': 'Heavy snowstorm with strong winds',
-        'temperature_mod': -15,
-        'wind_speed': 0.9,
-        'humidity': 0.8,
-        'precipitation': 0.8,
-        'darkness': 0.6,
-        'fog': 0.7,
-        'particle_rate': 150,
-        'particle_color': (255, 255, 255),
-        'duration': (600, 1800),  # 10-30 minutes
-        'max_wind': 7.0,
-        'possible_seasons': ['winter'],
-        'probability': 0.1,
-        'season_probability_mod': {
+        particle_count=50,
+        overlay_alpha=0.3,
+        status_effects=('cold',),
+        visibility=0.7,
+        movement_speed=0.7,
+        entity_effects=EntityEffects(
+            mood=0.05,  # Slight mood boost (scenic)
+            energy=-0.1  # Energy decrease due to cold
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(220, 220, 220),  # Light gray
+            cloud_color=(192, 192, 192),
+            sun_intensity=0.5,
+            shadow_intensity=0.6,
+            particle_effects=True
+        )
+    ),
+    'blizzard': WeatherSpec(
+        description='Heavy snowstorm with strong winds',
+        temperature_mod=-15,
+        wind_speed=0.9,
+        humidity=0.8,
+        precipitation=0.8,
+        darkness=0.6,
+        fog=0.7,
+        particle_rate=150,
+        particle_color=(255, 255, 255),
+        duration=(600, 1800),  # 10-30 minutes
+        max_wind=7.0,
+        possible_seasons=('winter',),
+        probability=0.1,
+        season_probability_mod={
             'winter': 1.5,
             'summer': 0
         },
-        'particle_count': 150,
-        'overlay_alpha': 0.5,
-        'status_effects': ['frozen', 'scared'],
-        'visibility': 0.2,
-        'movement_speed': 0.4,
-        'entity_effects': {
-            'mood': -0.2,  # Significant mood decrease
-            'energy': -0.2  # Significant energy decrease
-        },
-        'graphics': {
-            'sky_color': (200, 200, 200),  # Light gray
-            'cloud_color': (169, 169, 169),
-            'sun_intensity': 0.2,
-            'shadow_intensity': 0.3,
-            'particle_effects': True,
-            'wind_effects': {
-                'intensity': 1.0,
-                'direction_change_rate': 0.2,  # Direction changes per second
-                'sound_volume': 0.8
-            }
-        }
-    }
+        particle_count=150,
+        overlay_alpha=0.5,
+        status_effects=('frozen', 'scared'),
+        visibility=0.2,
+        movement_speed=0.4,
+        entity_effects=EntityEffects(
+            mood=-0.2,  # Significant mood decrease
+            energy=-0.2  # Significant energy decrease
+        ),
+        graphics=WeatherGraphics(
+            sky_color=(200, 200, 200),  # Light gray
+            cloud_color=(169, 169, 169),
+            sun_intensity=0.2,
+            shadow_intensity=0.3,
+            particle_effects=True,
+            wind_effects=WindEffectsSpec(
+                intensity=1.0,
+                direction_change_rate=0.2,  # Direction changes per second
+                sound_volume=0.8
+            )
+        )
+    )
 }
 
 # Season order for progression
 SEASON_ORDER = ['spring', 'summer', 'autumn', 'winter']
 
 # Weather effects
-def rain_effect(screen: pygame.Surface):
+_EFFECT_RNG = np.random.default_rng()
+_RAIN_LENGTHS = (5, 8, 11, 14)
+_RAIN_ALPHAS = np.linspace(50, 150, 8, dtype=int).tolist()
+_SNOW_SIZES = (2, 3, 4)
+_SNOW_ALPHAS = np.linspace(50, 200, 8, dtype=int).tolist()
+_EFFECT_SPRITES: Dict[str, List[pygame.Surface]] = {}
+
+def _get_effect_sprites(kind: str) -> List[pygame.Surface]:
+    """Get the pre-rendered particle sprites for 'rain' or 'snow', building them on first use"""
+    sprites = _EFFECT_SPRITES.get(kind)
+    if sprites is None:
+        sprites = []
+        if kind == 'rain':
+            # Indexed by length_index * len(_RAIN_ALPHAS) + alpha_index
+            for length in _RAIN_LENGTHS:
+                for alpha in _RAIN_ALPHAS:
+                    sprite = pygame.Surface((length // 2 + 1, length + 1), pygame.SRCALPHA)
+                    pygame.draw.line(sprite, (200, 200, 255, alpha), (0, 0), (length // 2, length), 1)
+                    sprites.append(sprite)
+        else:
+            # Indexed by size_index * len(_SNOW_ALPHAS) + alpha_index
+            for size in _SNOW_SIZES:
+                for alpha in _SNOW_ALPHAS:
+                    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(sprite, (255, 255, 255, alpha), (size, size), size)
+                    sprites.append(sprite)
+        _EFFECT_SPRITES[kind] = sprites
+    return sprites
+
+def rain_effect(screen: pygame.Surface, count: int = 100):
     """Draw rain effect"""
-    for _ in range(100):
-        x = random.randint(0, screen.get_width())
-        y = random.randint(0, screen.get_height())
-        length = random.randint(5, 15)
-        alpha = random.randint(50, 150)
-        color = (200, 200, 255, alpha)
-        end_pos = (x + length//2, y + length)
-        pygame.draw.line(screen, color, (x, y), end_pos, 1)
-
-def snow_effect(screen: pygame.Surface):
+    sprites = _get_effect_sprites('rain')
+    width, height = screen.get_size()
+    xs = _EFFECT_RNG.integers(0, width + 1, count).tolist()
+    ys = _EFFECT_RNG.integers(0, height + 1, count).tolist()
+    kinds = _EFFECT_RNG.integers(0, len(sprites), count).tolist()
+    screen.blits([(sprites[kind], (x, y)) for kind, x, y in zip(kinds, xs, ys)], False)
+
+def snow_effect(screen: pygame.Surface, count: int = 50):
     """Draw snow effect"""
-    for _ in range(50):
-        x = random.randint(0, screen.get_width())
-        y = random.randint(0, screen.get_height())
-        size = random.randint(2, 4)
-        alpha = random.randint(50, 200)
-        color = (255, 255, 255, alpha)
-        pygame.draw.circle(screen, color, (x, y), size)
+    sprites = _get_effect_sprites('snow')
+    width, height = screen.get_size()
+    xs = _EFFECT_RNG.integers(0, width + 1, count)
+    ys = _EFFECT_RNG.integers(0, height + 1, count)
+    kinds = _EFFECT_RNG.integers(0, len(sprites), count)
+    # Sprites are centered on the flake, so offset by the flake's radius
+    radii = np.array(_SNOW_SIZES)[kinds // len(_SNOW_ALPHAS)]
+    screen.blits([(sprites[kind], (x, y)) for kind, x, y in
+                  zip(kinds.tolist(), (xs - radii).tolist(), (ys - radii).tolist())], False)
 
 # Entity types and their properties
 ENTITY_TYPES = {
@@ -380,203 +506,6 @@ ENTITY_TYPES = {
     }
 }
 
-# Entity states and behaviors
-ENTITY_STATES = {
-    'idle': {
-        'description': 'Entity is not actively engaged in any task',
-        'animation': 'idle',
-        'movement_speed': 1.0,
-        'energy_cost': 0.1,
-        'thought_types': ['random', 'need', 'social'],
-        'duration_range': (5, 15),
-        'interruption_chance': 0.8,
-        'state_effects': {
-            'stress': -0.1,  # Slight stress reduction
-            'energy': 0.05  # Slight energy recovery
-        },
-        'transitions': ['walk', 'work', 'interact', 'rest']
-    },
-    'walk': {
-        'description': 'Entity is moving to a destination',
-        'animation': 'walk',
-        'movement_speed': 1.2,
-        'energy_cost': 0.2,
-        'thought_types': ['environment', 'goal', 'social'],
-        'duration_range': (10, 30),
-        'interruption_chance': 0.4,
-        'state_effects': {
-            'energy': -0.1,
-            'health': 0.05  # Light exercise benefit
-        },
-        'transitions': ['idle', 'run', 'interact', 'work']
-    },
-    'run': {
-        'description': 'Entity is moving quickly',
-        'animation': 'run',
-        'movement_speed': 2.0,
-        'energy_cost': 0.4,
-        'thought_types': ['urgent', 'danger', 'goal'],
-        'duration_range': (5, 15),
-        'interruption_chance': 0.2,
-        'state_effects': {
-            'energy': -0.3,
-            'health': 0.1,
-            'stress': 0.2
-        },
-        'transitions': ['walk', 'idle', 'rest']
-    },
-    'work': {
-        'description': 'Entity is performing a task',
-        'animation': 'work',
-        'movement_speed': 0.8,
-        'energy_cost': 0.3,
-        'thought_types': ['work', 'goal', 'need'],
-        'duration_range': (20, 60),
-        'interruption_chance': 0.3,
-        'state_effects': {
-            'energy': -0.2,
-            'stress': 0.1,
-            'satisfaction': 0.2
-        },
-        'transitions': ['idle', 'rest', 'interact']
-    },
-    'rest': {
-        'description': 'Entity is recovering energy',
-        'animation': 'rest',
-        'movement_speed': 0.0,
-        'energy_cost': -0.3,  # Negative cost means energy recovery
-        'thought_types': ['relaxed', 'memory', 'creative'],
-        'duration_range': (30, 120),
-        'interruption_chance': 0.5,
-        'state_effects': {
-            'energy': 0.3,
-            'stress': -0.2,
-            'health': 0.1
-        },
-        'transitions': ['idle', 'sleep']
-    },
-    'sleep': {
-        'description': 'Entity is sleeping',
-        'animation': 'sleep',
-        'movement_speed': 0.0,
-        'energy_cost': -0.5,
-        'thought_types': ['dream'],
-        'duration_range': (240, 480),
-        'interruption_chance': 0.1,
-        'state_effects': {
-            'energy': 0.5,
-            'stress': -0.3,
-            'health': 0.2,
-            'memory': 0.1  # Memory consolidation
-        },
-        'transitions': ['idle', 'rest']
-    },
-    'interact': {
-        'description': 'Entity is interacting with another entity',
-        'animation': 'interact',
-        'movement_speed': 0.5,
-        'energy_cost': 0.2,
-        'thought_types': ['social', 'emotional', 'goal'],
-        'duration_range': (10, 30),
-        'interruption_chance': 0.4,
-        'state_effects': {
-            'social': 0.3,
-            'stress': -0.1,
-            'mood': 0.2
-        },
-        'transitions': ['idle', 'walk', 'work']
-    },
-    'craft': {
-        'description': 'Entity is crafting items',
-        'animation': 'craft',
-        'movement_speed': 0.3,
-        'energy_cost': 0.3,
-        'thought_types': ['work', 'creative', 'goal'],
-        'duration_range': (30, 90),
-        'interruption_chance': 0.2,
-        'state_effects': {
-            'energy': -0.2,
-            'satisfaction': 0.3,
-            'skill': 0.1
-        },
-        'transitions': ['idle', 'rest', 'work']
-    },
-    'gather': {
-        'description': 'Entity is gathering resources',
-        'animation': 'gather',
-        'movement_speed': 0.7,
-        'energy_cost': 0.25,
-        'thought_types': ['work', 'environment', 'goal'],
-        'duration_range': (15, 45),
-        'interruption_chance': 0.3,
-        'state_effects': {
-            'energy': -0.2,
-            'satisfaction': 0.2,
-            'skill': 0.05
-        },
-        'transitions': ['idle', 'walk', 'rest']
-    },
-    'fight': {
-        'description': 'Entity is engaged in combat',
-        'animation': 'fight',
-        'movement_speed': 1.5,
-        'energy_cost': 0.5,
-        'thought_types': ['danger', 'survival', 'emotional'],
-        'duration_range': (5, 20),
-        'interruption_chance': 0.1,
-        'state_effects': {
-            'energy': -0.4,
-            'stress': 0.4,
-            'health': -0.2
-        },
-        'transitions': ['run', 'idle', 'rest']
-    }
-}
-
-# Entity needs and their properties
-ENTITY_NEEDS = {
-    'hunger': {
-        'decay_rate': 0.1,  # Units per second
-        'critical_threshold': 20,
-        'death_threshold': 0,
-        'restore_rate': 10,  # Units per food item
-        'affects_mood': True,
-        'affects_energy': True
-    },
-    'thirst': {
-        'decay_rate': 0.15,
-        'critical_threshold': 15,
-        'death_threshold': 0,
-        'restore_rate': 15,
-        'affects_mood': True,
-        'affects_energy': True
-    },
-    'energy': {
-        'decay_rate': 0.05,
-        'critical_threshold': 10,
-        'death_threshold': -1,  # Can't die from lack of energy
-        'restore_rate': 5,  # Units per rest action
-        'affects_mood': True,
-        'affects_speed': True
-    },
-    'social': {
-        'decay_rate': 0.03,
-        'critical_threshold': 30,
-        'death_threshold': -1,
-        'restore_rate': 8,
-        'affects_mood': True,
-        'affects_productivity': True
-    },
-    'comfort': {
-        'decay_rate': 0.02,
-        'critical_threshold': 40,
-        'death_threshold': -1,
-        'restore_rate': 12,
-        'affects_mood': True,
-        'affects_rest_quality': True
-    }
-}
-
 # Resource types
 RESOURCE_TYPES = {
     'wood': {
@@ -717,173 +646,315 @@ RESOURCE_TYPES = {
 
 # Biome definitions with complete properties
 BIOMES = {
-    'ocean': {
-        'color': (0, 105, 148),
-        'walkable': False,
-        'base_fertility': 0.0,
-        'moisture_retention': 1.0,
-        'temperature_mod': -2,
-        'features': ['coral_reef', 'seaweed'],
-        'resources': ['fish', 'seashell']
-    },
-    'frozen_ocean': {
-        'color': (200, 230, 255),
-        'walkable': True,
-        'base_fertility': 0.0,
-        'moisture_retention': 0.8,
-        'temperature_mod': -10,
-        'features': ['ice_sheet'],
-        'resources': ['ice']
-    },
-    'beach': {
-        'color': (238, 214, 175),
-        'walkable': True,
-        'base_fertility': 0.2,
-        'moisture_retention': 0.3,
-        'temperature_mod': 0,
-        'features': ['palm_tree', 'seashells'],
-        'resources': ['sand', 'seashell']
-    },
-    'snowy_beach': {
-        'color': (230, 230, 240),
-        'walkable': True,
-        'base_fertility': 0.1,
-        'moisture_retention': 0.4,
-        'temperature_mod': -5,
-        'features': ['ice_formation'],
-        'resources': ['ice', 'sand']
-    },
-    'mountains': {
-        'color': (120, 120, 120),
-        'walkable': True,
-        'base_fertility': 0.3,
-        'moisture_retention': 0.4,
-        'temperature_mod': -8,
-        'features': ['rock_formation', 'cave'],
-        'resources': ['stone', 'ore']
-    },
-    'snowy_mountains': {
-        'color': (200, 200, 210),
-        'walkable': True,
-        'base_fertility': 0.1,
-        'moisture_retention': 0.5,
-        'temperature_mod': -12,
-        'features': ['ice_cave', 'snow_drift'],
-        'resources': ['ice', 'stone']
-    },
-    'rainforest_mountains': {
-        'color': (80, 120, 80),
-        'walkable': True,
-        'base_fertility': 0.7,
-        'moisture_retention': 0.9,
-        'temperature_mod': -4,
-        'features': ['waterfall', 'vine_covered_rocks'],
-        'resources': ['stone', 'herbs']
-    },
-    'tundra': {
-        'color': (221, 221, 228),
-        'walkable': True,
-        'base_fertility': 0.2,
-        'moisture_retention': 0.3,
-        'temperature_mod': -10,
-        'features': ['frozen_pond', 'snow_drift'],
-        'resources': ['ice', 'berry']
-    },
-    'snowy_forest': {
-        'color': (200, 210, 200),
-        'walkable': True,
-        'base_fertility': 0.4,
-        'moisture_retention': 0.6,
-        'temperature_mod': -8,
-        'features': ['evergreen_tree', 'snow_drift'],
-        'resources': ['wood', 'berry']
-    },
-    'desert': {
-        'color': (238, 218, 130),
-        'walkable': True,
-        'base_fertility': 0.1,
-        'moisture_retention': 0.1,
-        'temperature_mod': 10,
-        'features': ['cactus', 'sand_dune'],
-        'resources': ['sand', 'cactus']
-    },
-    'rainforest': {
-        'color': (34, 139, 34),
-        'walkable': True,
-        'base_fertility': 1.0,
-        'moisture_retention': 1.0,
-        'temperature_mod': 3,
-        'features': ['giant_tree', 'vine_canopy'],
-        'resources': ['wood', 'fruit', 'herbs']
-    },
-    'savanna': {
-        'color': (177, 209, 110),
-        'walkable': True,
-        'base_fertility': 0.5,
-        'moisture_retention': 0.3,
-        'temperature_mod': 5,
-        'features': ['acacia_tree', 'tall_grass'],
-        'resources': ['wood', 'grass']
-    },
-    'plains': {
-        'color': (164, 225, 99),
-        'walkable': True,
-        'base_fertility': 0.7,
-        'moisture_retention': 0.4,
-        'temperature_mod': 0,
-        'features': ['flower_patch', 'tall_grass'],
-        'resources': ['grass', 'flower']
-    },
-    'forest': {
-        'color': (34, 139, 34),
-        'walkable': True,
-        'base_fertility': 0.8,
-        'moisture_retention': 0.7,
-        'temperature_mod': -2,
-        'features': ['tree_cluster', 'mushroom_ring'],
-        'resources': ['wood', 'mushroom', 'berry']
-    },
-    'swamp': {
-        'color': (71, 108, 108),
-        'walkable': True,
-        'base_fertility': 0.6,
-        'moisture_retention': 0.9,
-        'temperature_mod': -1,
-        'features': ['willow_tree', 'mud_pool'],
-        'resources': ['wood', 'herb', 'mushroom']
-    }
+    'ocean': BiomeSpec(
+        color=(0, 105, 148),
+        walkable=False,
+        base_fertility=0.0,
+        moisture_retention=1.0,
+        temperature_mod=-2,
+        features=('coral_reef', 'seaweed'),
+        resources=('fish', 'seashell')
+    ),
+    'frozen_ocean': BiomeSpec(
+        color=(200, 230, 255),
+        walkable=True,
+        base_fertility=0.0,
+        moisture_retention=0.8,
+        temperature_mod=-10,
+        features=('ice_sheet',),
+        resources=('ice',)
+    ),
+    'beach': BiomeSpec(
+        color=(238, 214, 175),
+        walkable=True,
+        base_fertility=0.2,
+        moisture_retention=0.3,
+        temperature_mod=0,
+        features=('palm_tree', 'seashells'),
+        resources=('sand', 'seashell')
+    ),
+    'snowy_beach': BiomeSpec(
+        color=(230, 230, 240),
+        walkable=True,
+        base_fertility=0.1,
+        moisture_retention=0.4,
+        temperature_mod=-5,
+        features=('ice_formation',),
+        resources=('ice', 'sand')
+    ),
+    'mountains': BiomeSpec(
+        color=(120, 120, 120),
+        walkable=True,
+        base_fertility=0.3,
+        moisture_retention=0.4,
+        temperature_mod=-8,
+        features=('rock_formation', 'cave'),
+        resources=('stone', 'ore')
+    ),
+    'snowy_mountains': BiomeSpec(
+        color=(200, 200, 210),
+        walkable=True,
+        base_fertility=0.1,
+        moisture_retention=0.5,
+        temperature_mod=-12,
+        features=('ice_cave', 'snow_drift'),
+        resources=('ice', 'stone')
+    ),
+    'rainforest_mountains': BiomeSpec(
+        color=(80, 120, 80),
+        walkable=True,
+        base_fertility=0.7,
+        moisture_retention=0.9,
+        temperature_mod=-4,
+        features=('waterfall', 'vine_covered_rocks'),
+        resources=('stone', 'herbs')
+    ),
+    'tundra': BiomeSpec(
+        color=(221, 221, 228),
+        walkable=True,
+        base_fertility=0.2,
+        moisture_retention=0.3,
+        temperature_mod=-10,
+        features=('frozen_pond', 'snow_drift'),
+        resources=('ice', 'berry')
+    ),
+    'snowy_forest': BiomeSpec(
+        color=(200, 210, 200),
+        walkable=True,
+        base_fertility=0.4,
+        moisture_retention=0.6,
+        temperature_mod=-8,
+        features=('evergreen_tree', 'snow_drift'),
+        resources=('wood', 'berry')
+    ),
+    'desert': BiomeSpec(
+        color=(238, 218, 130),
+        walkable=True,
+        base_fertility=0.1,
+        moisture_retention=0.1,
+        temperature_mod=10,
+        features=('cactus', 'sand_dune'),
+        resources=('sand', 'cactus')
+    ),
+    'rainforest': BiomeSpec(
+        color=(34, 139, 34),
+        walkable=True,
+        base_fertility=1.0,
+        moisture_retention=1.0,
+        temperature_mod=3,
+        features=('giant_tree', 'vine_canopy'),
+        resources=('wood', 'fruit', 'herbs')
+    ),
+    'savanna': BiomeSpec(
+        color=(177, 209, 110),
+        walkable=True,
+        base_fertility=0.5,
+        moisture_retention=0.3,
+        temperature_mod=5,
+        features=('acacia_tree', 'tall_grass'),
+        resources=('wood', 'grass')
+    ),
+    'plains': BiomeSpec(
+        color=(164, 225, 99),
+        walkable=True,
+        base_fertility=0.7,
+        moisture_retention=0.4,
+        temperature_mod=0,
+        features=('flower_patch', 'tall_grass'),
+        resources=('grass', 'flower')
+    ),
+    'forest': BiomeSpec(
+        color=(34, 139, 34),
+        walkable=True,
+        base_fertility=0.8,
+        moisture_retention=0.7,
+        temperature_mod=-2,
+        features=('tree_cluster', 'mushroom_ring'),
+        resources=('wood', 'mushroom', 'berry')
+    ),
+    'swamp': BiomeSpec(
+        color=(71, 108, 108),
+        walkable=True,
+        base_fertility=0.6,
+        moisture_retention=0.9,
+        temperature_mod=-1,
+        features=('willow_tree', 'mud_pool'),
+        resources=('wood', 'herb', 'mushroom')
+    )
 }
 
-# Biome vegetation definitions
-BIOME_VEGETATION = {
-    'water': ['seaweed', 'coral'],
-    'beach': ['palm_trees', 'beach_grass'],
-    'mountain': ['mountain_flowers', 'alpine_grass', 'small_trees'],
-    'snow': ['snow_grass', 'evergreen_trees'],
-    'tundra': ['tundra_grass', 'arctic_flowers', 'small_bushes'],
-    'plains': ['tall_grass', 'wildflowers', 'scattered_trees'],
-    'forest': ['oak_trees', 'pine_trees', 'mushrooms', 'ferns'],
-    'jungle': ['tropical_trees', 'vines', 'exotic_flowers'],
-    'desert': ['cactus', 'desert_brush', 'desert_flowers'],
-    'savanna': ['acacia_trees', 'savanna_grass', 'thorny_bushes']
-}
+# Structure-of-arrays views of the tables above. Row i of every column
+# belongs to the entry with enum value i, so per-entity updates can gather
+# a whole column with one fancy index (e.g. WEATHER_TEMP_MOD[weather_ids]).
+def _spec_column(table, field: str, dtype) -> np.ndarray:
+    """Pack one field of every spec in a table into a read-only array"""
+    column = np.array([getattr(spec, field) for spec in table.values()], dtype=dtype)
+    column.flags.writeable = False
+    return column
+
+SeasonId = IntEnum('SeasonId', [name.upper() for name in SEASON_ORDER], start=0)
+WeatherId = IntEnum('WeatherId', [name.upper() for name in WEATHER_TYPES], start=0)
+BiomeId = IntEnum('BiomeId', [name.upper() for name in BIOMES], start=0)
+
+# Season specs by SeasonId, matching TimeSystem.season indices
+SEASON_SPECS: Tuple[SeasonSpec, ...] = tuple(SEASONS[name] for name in SEASON_ORDER)
+NUM_SEASONS = len(SEASON_SPECS)
+NEXT_SEASON_ID = np.roll(np.arange(NUM_SEASONS, dtype=np.uint8), -1)
+NEXT_SEASON_ID.flags.writeable = False
+NEXT_SEASON_NAME = tuple(SEASON_ORDER[(season_id + 1) % NUM_SEASONS] for season_id in range(NUM_SEASONS))
+
+SEASON_BASE_TEMP = _spec_column(SEASONS, 'base_temp', np.float32)
+SEASON_GROWTH_MOD = _spec_column(SEASONS, 'growth_mod', np.float32)
+SEASON_PRECIPITATION = _spec_column(SEASONS, 'precipitation', np.float32)
+SEASON_DAY_LENGTH = _spec_column(SEASONS, 'day_length', np.float32)
+
+WEATHER_TEMP_MOD = _spec_column(WEATHER_TYPES, 'temperature_mod', np.float32)
+WEATHER_WIND_SPEED = _spec_column(WEATHER_TYPES, 'wind_speed', np.float32)
+WEATHER_HUMIDITY = _spec_column(WEATHER_TYPES, 'humidity', np.float32)
+WEATHER_PRECIPITATION = _spec_column(WEATHER_TYPES, 'precipitation', np.float32)
+WEATHER_DARKNESS = _spec_column(WEATHER_TYPES, 'darkness', np.float32)
+WEATHER_FOG = _spec_column(WEATHER_TYPES, 'fog', np.float32)
+WEATHER_MAX_WIND = _spec_column(WEATHER_TYPES, 'max_wind', np.float32)
+WEATHER_VISIBILITY = _spec_column(WEATHER_TYPES, 'visibility', np.float32)
+WEATHER_MOVEMENT_SPEED = _spec_column(WEATHER_TYPES, 'movement_speed', np.float32)
+WEATHER_OVERLAY_ALPHA = _spec_column(WEATHER_TYPES, 'overlay_alpha', np.float32)
+WEATHER_PARTICLE_COUNT = _spec_column(WEATHER_TYPES, 'particle_count', np.int32)
+WEATHER_PROBABILITY = _spec_column(WEATHER_TYPES, 'probability', np.float32)
+WEATHER_MOOD = np.array([spec.entity_effects.mood for spec in WEATHER_TYPES.values()], dtype=np.float32)
+WEATHER_MOOD.flags.writeable = False
+WEATHER_ENERGY = np.array([spec.entity_effects.energy for spec in WEATHER_TYPES.values()], dtype=np.float32)
+WEATHER_ENERGY.flags.writeable = False
+
+def _build_season_prob_mod_mat() -> np.ndarray:
+    """Build seasonal probability multipliers as [WeatherId, SeasonId], 1.0 where unset"""
+    matrix = np.ones((len(WEATHER_TYPES), len(SEASON_ORDER)), dtype=np.float32)
+    for weather_id, spec in enumerate(WEATHER_TYPES.values()):
+        for season, mod in spec.season_probability_mod.items():
+            matrix[weather_id, SeasonId[season.upper()]] = mod
+    matrix.flags.writeable = False
+    return matrix
+
+SEASON_PROB_MOD_MAT = _build_season_prob_mod_mat()
+
+# Bit i of POSSIBLE_SEASONS_MASK[weather_id] is set if SeasonId i allows that weather
+POSSIBLE_SEASONS_MASK = np.array([
+    sum(1 << SeasonId[season.upper()] for season in spec.possible_seasons)
+    for spec in WEATHER_TYPES.values()
+], dtype=np.uint8)
+POSSIBLE_SEASONS_MASK.flags.writeable = False
+
+BIOME_WALKABLE = _spec_column(BIOMES, 'walkable', np.bool_)
+BIOME_BASE_FERTILITY = _spec_column(BIOMES, 'base_fertility', np.float32)
+BIOME_MOISTURE_RETENTION = _spec_column(BIOMES, 'moisture_retention', np.float32)
+BIOME_TEMP_MOD = _spec_column(BIOMES, 'temperature_mod', np.float32)
+
+# RGB lookup tables for rendering: LUT[ids] turns a grid of ids into pixels
+BIOME_ID = {name: i for i, name in enumerate(BIOMES)}
+BIOME_COLOR_LUT = _spec_column(BIOMES, 'color', np.uint8)
+WEATHER_SKY_LUT = np.array([spec.graphics.sky_color for spec in WEATHER_TYPES.values()], dtype=np.uint8)
+WEATHER_SKY_LUT.flags.writeable = False
+WEATHER_CLOUD_LUT = np.array([spec.graphics.cloud_color for spec in WEATHER_TYPES.values()], dtype=np.uint8)
+WEATHER_CLOUD_LUT.flags.writeable = False
+
+def colorize_biomes(biome_ids: np.ndarray, lut: np.ndarray = BIOME_COLOR_LUT) -> np.ndarray:
+    """Map a grid of BiomeIds to an (..., 3) uint8 RGB image with one gather"""
+    return lut[biome_ids]
+
+def _build_resources_by_biome() -> Dict[str, Tuple[str, ...]]:
+    """Invert RESOURCE_TYPES[...]['biomes'] into biome -> resource names"""
+    by_biome = {name: [] for name in BIOMES}
+    for resource, spec in RESOURCE_TYPES.items():
+        for biome in spec.get('biomes', ()):
+            by_biome.setdefault(biome, []).append(resource)
+    return {biome: tuple(resources) for biome, resources in by_biome.items()}
+
+# Resources that can spawn in each biome. The per-biome-id arrays hold
+# indices into RESOURCE_NAMES and their cumulative spawn frequencies, so a
+# weighted pick is one np.searchsorted.
+RESOURCE_NAMES = tuple(RESOURCE_TYPES)
+RESOURCES_BY_BIOME = _build_resources_by_biome()
+BIOME_ID_RESOURCES = [
+    np.array([RESOURCE_NAMES.index(resource) for resource in RESOURCES_BY_BIOME[biome]], dtype=np.intp)
+    for biome in BIOMES
+]
+RESOURCE_FREQ_CUM_BY_BIOME = [
+    np.cumsum([RESOURCE_TYPES[resource].get('frequency', 0.0) for resource in RESOURCES_BY_BIOME[biome]],
+              dtype=np.float64)
+    for biome in BIOMES
+]
+
+# Full-screen tint surfaces, built on first use once a display exists
+_WEATHER_OVERLAYS: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+
+def get_weather_overlay(weather: str, size: Tuple[int, int]) -> pygame.Surface:
+    """Get the cached sky-tinted overlay for a weather at the given surface size"""
+    key = (weather, size)
+    overlay = _WEATHER_OVERLAYS.get(key)
+    if overlay is None:
+        spec = WEATHER_TYPES[weather]
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((*spec.graphics.sky_color, int(spec.overlay_alpha * 255)))
+        _WEATHER_OVERLAYS[key] = overlay
+    return overlay
+
+def _build_season_weather_table() -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Build (weather ids, cumulative weights) for every season"""
+    table = {}
+    for season_id in SeasonId:
+        weights = WEATHER_PROBABILITY * SEASON_PROB_MOD_MAT[:, season_id]
+        weather_ids = np.flatnonzero((POSSIBLE_SEASONS_MASK >> season_id) & 1)
+        table[SEASON_ORDER[season_id]] = (weather_ids, np.cumsum(weights[weather_ids], dtype=np.float64))
+    return table
+
+_SEASON_WEATHER_TABLE = _build_season_weather_table()
+_WEATHER_NAMES = tuple(WEATHER_TYPES)
+
+def sample_weather(season: str, rng=None) -> str:
+    """Pick a weather for the season, weighted by its seasonal probability"""
+    weather_ids, cumulative = _SEASON_WEATHER_TABLE.get(season, ((), ()))
+    if not len(weather_ids) or cumulative[-1] <= 0:
+        return 'clear'
+    if rng is None:
+        rng = random
+    index = int(np.searchsorted(cumulative, rng.random() * cumulative[-1], side='right'))
+    return _WEATHER_NAMES[weather_ids[min(index, len(weather_ids) - 1)]]
 
-# Initialize pygame font system
-pygame.font.init()
-
-# Font definitions with proper Font objects
-FONTS = {
-    'title': pygame.font.Font(None, 48),  # Large title font
-    'subtitle': pygame.font.Font(None, 36),  # Subtitle font
-    'normal': pygame.font.Font(None, 24),  # Normal text
-    'small': pygame.font.Font(None, 18),  # Small text
-    'tiny': pygame.font.Font(None, 14),  # Tiny text for details
-    'ui': pygame.font.Font(None, 20),  # UI elements
-    'button': pygame.font.Font(None, 22),  # Button text
-    'debug': pygame.font.Font(None, 16),  # Debug information
-    'emoji': pygame.font.Font(None, 24)  # For emoji characters
+# Font sizes by name. Font objects are created on first use by load_font()
+# so importing this module does not initialize pygame.
+FONT_SIZES = {
+    'title': 64,  # Large title font
+    'subtitle': 36,  # Subtitle font
+    'normal': 32,  # Normal text
+    'small': 24,  # Small text
+    'tiny': 16,  # Tiny text for details
+    'ui': 20,  # UI elements
+    'button': 28,  # Button text
+    'debug': 16,  # Debug information
+    'emoji': 24  # For emoji characters
 }
 
+FontId = IntEnum('FontId', [name.upper() for name in FONT_SIZES], start=0)
+
+_FONTS_TUPLE: Optional[Tuple[pygame.font.Font, ...]] = None
+
+@lru_cache(maxsize=32)
+def load_font(size: int) -> pygame.font.Font:
+    """Get the default font at a pixel size, initializing the font system on first use"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(None, size)
+
+def get_fonts() -> Tuple[pygame.font.Font, ...]:
+    """Get all fonts indexed by FontId"""
+    global _FONTS_TUPLE
+    if _FONTS_TUPLE is None:
+        _FONTS_TUPLE = tuple(load_font(size) for size in FONT_SIZES.values())
+    return _FONTS_TUPLE
+
+def get_font(name: str) -> pygame.font.Font:
+    """Get the named font, loading only that size"""
+    return load_font(FONT_SIZES[name])
+
 # Font styles for different text types
 FONT_STYLES = {
     'title': {
@@ -900,45 +971,100 @@ FONT_STYLES = {
         'shadow_offset': 1,
         'glow_radius': 3,
         'outline_width': 1
+    },
+    'shadow': {
+        'shadow_offset': 1,
+        'glow_radius': 0,
+        'outline_width': 0
     }
 }
 
+@lru_cache(maxsize=256)
+def render_styled(text: str, font_id: int, color: Tuple[int, ...], style: str = 'shadow') -> pygame.Surface:
+    """Render text with a FONT_STYLES glow, outline and drop shadow, cached by arguments.
+
+    The text is drawn at (pad, pad) where pad = max(glow_radius, outline_width),
+    so blit the result at (x - pad, y - pad). Callers must not draw on it.
+    """
+    font = get_fonts()[font_id]
+    params = FONT_STYLES[style]
+    shadow_offset = params['shadow_offset']
+    glow_radius = params['glow_radius']
+    outline_width = params['outline_width']
+    pad = max(glow_radius, outline_width)
+    
+    text_surface = font.render(text, True, color)
+    width, height = text_surface.get_size()
+    result = pygame.Surface((width + pad * 2 + shadow_offset, height + pad * 2 + shadow_offset), pygame.SRCALPHA)
+    
+    # Glow: faint copies of the text spread out to glow_radius
+    if glow_radius:
+        glow_surface = font.render(text, True, color[:3])
+        for radius in range(glow_radius, 0, -1):
+            glow_surface.set_alpha(max(10, 60 // radius))
+            for dx, dy in ((-radius, 0), (radius, 0), (0, -radius), (0, radius)):
+                result.blit(glow_surface, (pad + dx, pad + dy))
+                
+    # Drop shadow
+    shadow_surface = font.render(text, True, (0, 0, 0))
+    if shadow_offset:
+        result.blit(shadow_surface, (pad + shadow_offset, pad + shadow_offset))
+        
+    # Outline: the shadow glyphs stamped around the text
+    for offset in range(1, outline_width + 1):
+        for dx, dy in ((-offset, 0), (offset, 0), (0, -offset), (0, offset)):
+            result.blit(shadow_surface, (pad + dx, pad + dy))
+            
+    result.blit(text_surface, (pad, pad))
+    return result
+
+@lru_cache(maxsize=32)
+def _emoji_font(size: int) -> pygame.font.Font:
+    """Get the emoji font at a pixel size, falling back to the default font"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    try:
+        return pygame.font.SysFont('segoe ui emoji', size)
+    except Exception:
+        return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=256)
+def render_emoji(emoji: str, size: int, color: Tuple[int, ...] = (0, 0, 0)) -> pygame.Surface:
+    """Render an emoji sprite once per (emoji, size, color); callers must not draw on the result"""
+    surface = _emoji_font(size).render(emoji, True, color)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
 # UI Colors
 UI_COLORS = {
     # Panel colors
-    'panel_bg': (30, 30, 40, 180),  # Dark blue-gray with transparency
-    'panel_border': (60, 60, 80),  # Lighter blue-gray
-    'panel_glow': (100, 150, 255, 30),  # Soft blue glow
+    'panel_bg': (40, 44, 52, 200),  # Dark background with some transparency
+    'panel_border': (61, 66, 77),
+    'panel_glow': (229, 192, 123, 40),  # Semi-transparent gold glow for panels
     'panel_header': (40, 40, 50),  # Slightly lighter than background
     
     # Text colors
-    'text_normal': (220, 220, 220),  # Light gray
-    'text_highlight': (255, 255, 255),  # Pure white
-    'text_dim': (150, 150, 150),  # Dimmed text
+    'text_normal': (171, 178, 191),  # Light gray text
+    'text_highlight': (229, 192, 123),  # Gold highlight
+    'text_dim': (120, 125, 135),  # Dimmed text
     'text_warning': (255, 200, 0),  # Yellow warning
-    'text_error': (255, 80, 80),  # Red error
+    'text_error': (224, 108, 117),  # Soft red for errors
     'text_success': (100, 255, 100),  # Green success
     
     # Button colors
-    'button_bg': (60, 60, 80),  # Base button color
-    'button_hover': (80, 80, 100),  # Lighter when hovered
-    'button_active': (100, 100, 120),  # Even lighter when pressed
-    'button_disabled': (40, 40, 50),  # Darker when disabled
-    'button_text': (220, 220, 220),  # Button text color
-    'button_glow': (100, 150, 255, 30),  # Button glow effect
+    'button_bg': (55, 59, 69),
+    'button_hover': (71, 77, 89),
+    'button_active': (82, 89, 103),
+    'button_disabled': (40, 43, 51),  # Even darker when disabled
+    'button_text': (171, 178, 191),  # Same as text_normal
+    'button_glow': (229, 192, 123, 40),  # Semi-transparent gold glow
     
     # Slider colors
     'slider_track': (40, 40, 50),  # Slider background
     'slider_track_hover': (50, 50, 60),  # Slider background when hovered
     'slider_fill': (100, 150, 255),  # Filled portion of slider
-    'text_normal': (200, 200, 200),
-    'text_highlight': (255, 255, 255),
     'text_dark': (100, 100, 100),
-    'panel_bg': (40, 44, 52, 200),  # Dark background with some transparency
-    'panel_border': (61, 66, 77),
-    'button_bg': (60, 60, 60),
-    'button_hover': (80, 80, 80),
-    'button_active': (100, 100, 100),
     'minimap_bg': (30, 30, 30),
     'minimap_water': (64, 128, 255),
     'minimap_grass': (64, 200, 64),
@@ -950,13 +1076,6 @@ UI_COLORS = {
     'minimap_entity': (255, 200, 150),
     'minimap_player': (255, 255, 0),
     'minimap_viewport': (255, 255, 255),
-    'panel_bg': (40, 44, 52, 200),  # Dark background with some transparency
-    'panel_border': (61, 66, 77),
-    'panel_glow': (229, 192, 123, 40),  # Semi-transparent gold glow for panels
-    'text_normal': (171, 178, 191),  # Light gray text
-    'text_highlight': (229, 192, 123),  # Gold highlight
-    'text_error': (224, 108, 117),  # Soft red for errors
-    'text_dim': (120, 125, 135),  # Dimmed text
     'text_shadow': (0, 0, 0, 160),  # Semi-transparent black for text shadows
     'text_outline': (0, 0, 0),  # Black for text outlines
     'text_glow': (229, 192, 123, 40),  # Semi-transparent gold for text glow
@@ -964,15 +1083,9 @@ UI_COLORS = {
     'title_shadow': (0, 0, 0, 180),  # Darker shadow for title text
     'title_glow': (229, 192, 123, 60),  # Stronger gold glow for title
     'background': (30, 33, 39),  # Dark background color
-    'button_bg': (55, 59, 69),
-    'button_hover': (71, 77, 89),
-    'button_active': (82, 89, 103),
     'button_normal': (55, 59, 69),  # Same as button_bg
     'button_pressed': (45, 49, 57),  # Darker when pressed
-    'button_disabled': (40, 43, 51),  # Even darker when disabled
     'button_border': (61, 66, 77),  # Same as panel_border
-    'button_text': (171, 178, 191),  # Same as text_normal
-    'button_glow': (229, 192, 123, 40),  # Semi-transparent gold glow
     'glow': (229, 192, 123),  # Gold color for glowing effects
     'shadow': (0, 0, 0, 60),  # Semi-transparent black for shadows
     'progress_bar': (40, 44, 52),  # Dark background matching panel_bg
@@ -990,18 +1103,38 @@ UI_COLORS = {
     'tooltip_border': (61, 66, 77)
 }
 
+# Alpha variants of the palette that button styles use, packed with
+# UI_COLORS into one RGBA table indexed by ColorId
+_DERIVED_COLORS = {
+    'button_glow_hover': (*UI_COLORS['button_glow'][:3], 60),
+    'button_glow_dim': (*UI_COLORS['button_glow'][:3], 20),
+    'clear': (0, 0, 0, 0)
+}
+
+ColorId = IntEnum('ColorId', [name.upper() for name in (*UI_COLORS, *_DERIVED_COLORS)], start=0)
+COLOR_LUT = np.empty((len(UI_COLORS) + len(_DERIVED_COLORS), 4), dtype=np.uint8)
+COLOR_LUT[:, 3] = 255
+for _color_id, _color in enumerate((*UI_COLORS.values(), *_DERIVED_COLORS.values())):
+    COLOR_LUT[_color_id, :len(_color)] = _color
+COLOR_LUT.flags.writeable = False
+
+@lru_cache(maxsize=None)
+def get_color(color_id: int) -> bytes:
+    """Get a packed RGBA palette entry, accepted anywhere pygame takes a color"""
+    return COLOR_LUT[color_id].tobytes()
+
 # Enhanced button styles with maximum visual quality
 BUTTON_STYLES = {
     'normal': {
         'bg_color': UI_COLORS['button_normal'],
-        'border_color': UI_COLORS['button_border'],
+        'border_color': UI_COLORS['panel_border'],
         'text_color': UI_COLORS['text_normal'],
-        'glow_color': UI_COLORS['button_glow'],
+        'glow_color': ColorId.BUTTON_GLOW,
         'shadow_color': UI_COLORS['shadow'],
         'border_width': 2,
         'border_radius': 10,
         'padding': 10,
-        'font': FONTS['normal'],
+        'font': 'normal',
         'shadow_offset': 2,
         'glow_radius': 10,
         'transition_speed': 0.2,
@@ -1009,29 +1142,29 @@ BUTTON_STYLES = {
     },
     'hover': {
         'bg_color': UI_COLORS['button_hover'],
-        'border_color': UI_COLORS['button_border'],
+        'border_color': UI_COLORS['text_highlight'],
         'text_color': UI_COLORS['text_highlight'],
-        'glow_color': (*UI_COLORS['button_glow'][:3], 60),
-        'shadow_color': UI_COLORS['shadow'],
+        'glow_color': ColorId.BUTTON_GLOW,
+        'shadow_color': (0, 0, 0, 80),
         'border_width': 2,
         'border_radius': 10,
         'padding': 10,
-        'font': FONTS['normal'],
+        'font': 'normal',
         'shadow_offset': 3,
         'glow_radius': 15,
-        'transition_speed': 0.15,
+        'transition_speed': 0.2,
         'pulse_effect': True
     },
     'pressed': {
         'bg_color': UI_COLORS['button_pressed'],
-        'border_color': UI_COLORS['button_border'],
+        'border_color': UI_COLORS['text_dim'],
         'text_color': UI_COLORS['text_normal'],
-        'glow_color': (*UI_COLORS['button_glow'][:3], 20),
-        'shadow_color': UI_COLORS['shadow'],
+        'glow_color': ColorId.CLEAR,
+        'shadow_color': (0, 0, 0, 100),
         'border_width': 2,
         'border_radius': 10,
         'padding': 10,
-        'font': FONTS['normal'],
+        'font': 'normal',
         'shadow_offset': 1,
         'glow_radius': 5,
         'transition_speed': 0.1,
@@ -1039,17 +1172,17 @@ BUTTON_STYLES = {
     },
     'disabled': {
         'bg_color': UI_COLORS['button_disabled'],
-        'border_color': UI_COLORS['button_border'],
+        'border_color': UI_COLORS['text_dim'],
         'text_color': UI_COLORS['text_dim'],
-        'glow_color': None,
-        'shadow_color': UI_COLORS['shadow'],
+        'glow_color': ColorId.CLEAR,
+        'shadow_color': (0, 0, 0, 40),
         'border_width': 1,
         'border_radius': 10,
         'padding': 10,
-        'font': FONTS['normal'],
+        'font': 'normal',
         'shadow_offset': 1,
         'glow_radius': 0,
-        'transition_speed': 0.2,
+        'transition_speed': 0.3,
         'pulse_effect': False
     }
 }
@@ -1063,6 +1196,7 @@ SCREEN_STATES = {
     'SETTINGS': 'settings',
     'OPTIONS': 'options'
 }
+assert len(set(SCREEN_STATES.values())) == len(SCREEN_STATES), "SCREEN_STATES values must be unique"
 
 # Camera settings
 CAMERA_MOVE_SPEED = 500
@@ -1093,14 +1227,6 @@ MAX_THOUGHTS = 10
 THOUGHT_DURATION = 5.0
 THOUGHT_INTERVAL = 2.0
 
-THOUGHT_TYPES = {
-    'need': {'priority': 3, 'duration': 5.0},
-    'social': {'priority': 2, 'duration': 8.0},
-    'goal': {'priority': 1, 'duration': 15.0},
-    'memory': {'priority': 1, 'duration': 10.0},
-    'environment': {'priority': 2, 'duration': 6.0}
-}
-
 # Thought categories
 THOUGHT_CATEGORIES = [
     'needs',      # Basic needs like hunger, thirst, rest
@@ -1237,107 +1363,9 @@ EMOTION_SYSTEM_SETTINGS = {
     }
 }
 
-# Mood system
-MOODS = {
-    'joyful': {
-        'color': (255, 223, 128),  # Bright yellow
-        'glow_color': (255, 223, 128, 100),
-        'particle_color': (255, 223, 128),
-        'thought_boost': 1.2,  # Boost to thought generation
-        'energy_boost': 1.1,  # Boost to energy regeneration
-        'social_boost': 1.2,  # Boost to social interactions
-        'productivity_boost': 1.1,  # Boost to work efficiency
-        'duration_range': (300, 600),  # Duration range in seconds
-        'contagion_radius': 150,  # How far the mood spreads
-        'contagion_strength': 0.3,  # How strongly it affects others
-        'weather_resistance': 1.2,  # Resistance to negative weather effects
-        'stress_resistance': 1.2,  # Resistance to stress
-        'memory_boost': 1.1,  # Better memory formation
-        'learning_boost': 1.2,  # Better skill learning
-        'creativity_boost': 1.3,  # Boost to creative activities
-        'expressions': ['smile', 'laugh', 'dance'],  # Possible expressions
-        'thought_types': ['positive', 'creative', 'social']  # Common thought types
-    },
-    'content': {
-        'color': (173, 216, 230),  # Light blue
-        'glow_color': (173, 216, 230, 80),
-        'particle_color': (173, 216, 230),
-        'thought_boost': 1.1,
-        'energy_boost': 1.0,
-        'social_boost': 1.1,
-        'productivity_boost': 1.2,
-        'duration_range': (600, 1200),
-        'contagion_radius': 100,
-        'contagion_strength': 0.2,
-        'weather_resistance': 1.1,
-        'stress_resistance': 1.1,
-        'memory_boost': 1.2,
-        'learning_boost': 1.1,
-        'creativity_boost': 1.1,
-        'expressions': ['smile', 'nod', 'relax'],
-        'thought_types': ['productive', 'planning', 'curious']
-    },
-    'neutral': {
-        'color': (200, 200, 200),  # Gray
-        'glow_color': (200, 200, 200, 60),
-        'particle_color': (200, 200, 200),
-        'thought_boost': 1.0,
-        'energy_boost': 1.0,
-        'social_boost': 1.0,
-        'productivity_boost': 1.0,
-        'duration_range': (900, 1800),
-        'contagion_radius': 50,
-        'contagion_strength': 0.1,
-        'weather_resistance': 1.0,
-        'stress_resistance': 1.0,
-        'memory_boost': 1.0,
-        'learning_boost': 1.0,
-        'creativity_boost': 1.0,
-        'expressions': ['neutral', 'observe', 'think'],
-        'thought_types': ['analytical', 'observant', 'practical']
-    },
-    'sad': {
-        'color': (128, 128, 255),  # Blue
-        'glow_color': (128, 128, 255, 70),
-        'particle_color': (128, 128, 255),
-        'thought_boost': 0.9,
-        'energy_boost': 0.9,
-        'social_boost': 0.8,
-        'productivity_boost': 0.9,
-        'duration_range': (300, 900),
-        'contagion_radius': 120,
-        'contagion_strength': 0.25,
-        'weather_resistance': 0.9,
-        'stress_resistance': 0.8,
-        'memory_boost': 1.1,  # Sometimes better at remembering in sad moods
-        'learning_boost': 0.9,
-        'creativity_boost': 1.1,  # Can be more creative when sad
-        'expressions': ['frown', 'sigh', 'slump'],
-        'thought_types': ['reflective', 'emotional', 'introspective']
-    },
-    'tired': {
-        'color': (169, 169, 169),  # Dark gray
-        'glow_color': (169, 169, 169, 50),
-        'particle_color': (169, 169, 169),
-        'thought_boost': 0.8,
-        'energy_boost': 0.7,
-        'social_boost': 0.9,
-        'productivity_boost': 0.8,
-        'duration_range': (200, 600),
-        'contagion_radius': 80,
-        'contagion_strength': 0.15,
-        'weather_resistance': 0.8,
-        'stress_resistance': 0.7,
-        'memory_boost': 0.8,
-        'learning_boost': 0.8,
-        'creativity_boost': 0.9,
-        'expressions': ['yawn', 'stretch', 'rest'],
-        'thought_types': ['basic', 'rest', 'comfort']
-    }
-}
-
-# Personality system
-PERSONALITY_TRAITS = {
+# Personality system: per-trait effect multipliers and behaviour. PERSONALITY_TRAITS
+# (the trait ranges used when rolling a personality) is defined further down.
+PERSONALITY_TRAIT_PROFILES = {
     'openness': {
         'description': 'Openness to experience, creativity, and intellectual curiosity',
         'effects': {
@@ -1459,39 +1487,26 @@ STATUS_EFFECTS = {
     }
 }
 
-# Add missing imports
-import random 
-
-# Human types and attributes
-HUMAN_TYPES = {
-    'villager': {
-        'sprite': '👨',
-        'speed': 2.0,
-        'size': TILE_SIZE,
-        'vision_range': 8,
-        'intelligence': 1.0,
-        'starting_skills': {
-            'farming': 1,
-            'crafting': 1,
-            'gathering': 1,
-            'social': 1
-        },
-        'biomes': ['plains', 'forest', 'savanna']
-    },
-    'merchant': {
-        'sprite': '🧔',
-        'speed': 1.8,
-        'size': TILE_SIZE,
-        'vision_range': 10,
-        'intelligence': 1.2,
-        'starting_skills': {
-            'trading': 2,
-            'social': 2,
-            'negotiation': 2
-        },
-        'biomes': ['plains', 'forest', 'savanna', 'beach']
-    }
-}
+# Status effect columns by StatusId. A duration of -1 (permanent) becomes inf,
+# so ticking durations is a plain subtraction and permanent effects never expire.
+StatusId = IntEnum('StatusId', [name.upper() for name in STATUS_EFFECTS], start=0)
+STATUS_DURATION = np.array([effect['duration'] if effect['duration'] > 0 else np.inf
+                            for effect in STATUS_EFFECTS.values()], dtype=np.float32)
+STATUS_ENERGY_DELTA = np.array([effect.get('energy_regen', 0) - effect.get('energy_drain', 0)
+                                for effect in STATUS_EFFECTS.values()], dtype=np.float32)
+STATUS_HEALTH_DELTA = np.array([-effect.get('health_drain', 0) for effect in STATUS_EFFECTS.values()],
+                               dtype=np.float32)
+STATUS_MOOD_DELTA = np.array([effect.get('mood_boost', 0) + effect.get('mood_penalty', 0)
+                              for effect in STATUS_EFFECTS.values()], dtype=np.float32)
+STATUS_SPEED_MULT = np.array([effect.get('speed_penalty', 1.0) for effect in STATUS_EFFECTS.values()],
+                             dtype=np.float32)
+STATUS_WORK_MULT = np.array([effect.get('work_efficiency', 1.0) for effect in STATUS_EFFECTS.values()],
+                            dtype=np.float32)
+STATUS_CREATIVITY_MULT = np.array([effect.get('creativity_boost', 1.0) for effect in STATUS_EFFECTS.values()],
+                                  dtype=np.float32)
+for _column in (STATUS_DURATION, STATUS_ENERGY_DELTA, STATUS_HEALTH_DELTA, STATUS_MOOD_DELTA,
+                STATUS_SPEED_MULT, STATUS_WORK_MULT, STATUS_CREATIVITY_MULT):
+    _column.flags.writeable = False
 
 # Animal types and their properties
 ANIMAL_TYPES = {
@@ -1663,40 +1678,6 @@ ANIMAL_STATES = {
     }
 }
 
-# Plant types and their properties
-PLANT_TYPES = {
-    'tree': {
-        'sprite': '🌳',
-        'max_size': 3.0,
-        'growth_rate': 0.05,
-        'reproduction_rate': 0.01,
-        'resource_value': 20,
-        'provides_shelter': True,
-        'seasonal_behavior': True,
-        'biomes': ['forest', 'plains', 'savanna']
-    },
-    'bush': {
-        'sprite': '🌿',
-        'max_size': 1.5,
-        'growth_rate': 0.08,
-        'reproduction_rate': 0.02,
-        'resource_value': 10,
-        'provides_shelter': False,
-        'seasonal_behavior': True,
-        'biomes': ['plains', 'forest', 'savanna']
-    },
-    'flower': {
-        'sprite': '🌸',
-        'max_size': 1.0,
-        'growth_rate': 0.15,
-        'reproduction_rate': 0.03,
-        'resource_value': 5,
-        'provides_shelter': False,
-        'seasonal_behavior': True,
-        'biomes': ['plains', 'forest', 'savanna']
-    }
-}
-
 # Biome vegetation mapping
 BIOME_VEGETATION = {
     'forest': ['tree', 'bush', 'flower', 'grass'],
@@ -1709,7 +1690,19 @@ BIOME_VEGETATION = {
     'plains': ['grass', 'flower', 'bush']
 }
 
-# Graphics settings
+# Vegetation presence as one bit per plant name, indexed by BiomeId, so world
+# generation can test a whole biome grid at once:
+# BIOME_VEGETATION_MASK[biome_ids] & VEGETATION_BIT['tree']
+VEGETATION_NAMES = tuple(dict.fromkeys(plant for plants in BIOME_VEGETATION.values() for plant in plants))
+VEGETATION_BIT = {name: 1 << i for i, name in enumerate(VEGETATION_NAMES)}
+BIOME_VEGETATION_MASK = np.zeros(len(BIOME_ID), dtype=np.uint8)
+for _biome, _plants in BIOME_VEGETATION.items():
+    if _biome in BIOME_ID:
+        for _plant in _plants:
+            BIOME_VEGETATION_MASK[BIOME_ID[_biome]] |= VEGETATION_BIT[_plant]
+BIOME_VEGETATION_MASK.flags.writeable = False
+
+# Graphics quality presets
 GRAPHICS_QUALITY = {
     'ultra': {
         'particle_count': 1000,
@@ -1719,9 +1712,16 @@ GRAPHICS_QUALITY = {
         'weather_effects': True,
         'animation_quality': 'high',
         'texture_quality': 'high',
-        'reflection_quality': 'high',
+        'reflection_quality': 2,
         'particle_detail': 'high',
-        'lighting_quality': 'high'
+        'lighting_quality': 'high',
+        'shadow_quality': 3,
+        'animation_frames': 8,
+        'texture_size': 2,
+        'bloom_effect': True,
+        'motion_blur': True,
+        'dynamic_lighting': True,
+        'vegetation_density': 1.0
     },
     'high': {
         'particle_count': 500,
@@ -1731,21 +1731,35 @@ GRAPHICS_QUALITY = {
         'weather_effects': True,
         'animation_quality': 'high',
         'texture_quality': 'high',
-        'reflection_quality': 'medium',
+        'reflection_quality': 1,
         'particle_detail': 'medium',
-        'lighting_quality': 'high'
+        'lighting_quality': 'high',
+        'shadow_quality': 2,
+        'animation_frames': 6,
+        'texture_size': 1,
+        'bloom_effect': True,
+        'motion_blur': False,
+        'dynamic_lighting': True,
+        'vegetation_density': 0.8
     },
     'medium': {
         'particle_count': 250,
         'glow_effects': True,
         'shadows': True,
-        'antialiasing': False,
+        'antialiasing': True,
         'weather_effects': True,
         'animation_quality': 'medium',
         'texture_quality': 'medium',
-        'reflection_quality': 'low',
+        'reflection_quality': 0,
         'particle_detail': 'low',
-        'lighting_quality': 'medium'
+        'lighting_quality': 'medium',
+        'shadow_quality': 1,
+        'animation_frames': 4,
+        'texture_size': 1,
+        'bloom_effect': False,
+        'motion_blur': False,
+        'dynamic_lighting': False,
+        'vegetation_density': 0.6
     },
     'low': {
         'particle_count': 100,
@@ -1755,19 +1769,19 @@ GRAPHICS_QUALITY = {
         'weather_effects': False,
         'animation_quality': 'low',
         'texture_quality': 'low',
-        'reflection_quality': 'off',
+        'reflection_quality': 0,
         'particle_detail': 'minimal',
-        'lighting_quality': 'low'
+        'lighting_quality': 'low',
+        'shadow_quality': 0,
+        'animation_frames': 2,
+        'texture_size': 0,
+        'bloom_effect': False,
+        'motion_blur': False,
+        'dynamic_lighting': False,
+        'vegetation_density': 0.4
     }
 }
 
-# Display flags for maximum graphics quality
-DISPLAY_FLAGS = (
-    pygame.HWSURFACE |  # Hardware surface for faster blitting
-    pygame.DOUBLEBUF |  # Double buffering for smoother updates
-    pygame.SCALED      # Allow for resolution scaling
-)
-
 # Visual Effects settings
 VISUAL_EFFECTS = {
     'rain': {
@@ -1804,12 +1818,12 @@ ENTITY_INTERACTION_DISTANCE = 50
 ACTIVE_CHUNKS_RADIUS = 3
 WORLD_SEED = None  # Will be randomly generated if None
 
-# Debug settings
-DEBUG_MODE = __debug__
-SHOW_FPS = True
-SHOW_HITBOXES = False
-SHOW_PATHS = False
-SHOW_CHUNKS = False
+# Debug settings. Check them as `if __debug__ and SHOW_FPS:` so running with
+# python -O compiles the whole debug branch away.
+SHOW_FPS: Final[bool] = True
+SHOW_HITBOXES: Final[bool] = False
+SHOW_PATHS: Final[bool] = False
+SHOW_CHUNKS: Final[bool] = False
 
 # Biome colors and properties
 BIOME_COLORS = {
@@ -1829,231 +1843,134 @@ BIOME_COLORS = {
     'snowy_forest': (190, 214, 190)
 }
 
-# Graphics quality presets
-GRAPHICS_QUALITY = {
-    'ultra': {
-        'particle_count': 1000,
-        'shadow_quality': 3,
-        'animation_frames': 8,
-        'texture_size': 2,
-        'antialiasing': True,
-        'bloom_effect': True,
-        'motion_blur': True,
-        'weather_effects': True,
-        'dynamic_lighting': True,
-        'reflection_quality': 2,
-        'vegetation_density': 1.0
-    },
-    'high': {
-        'particle_count': 500,
-        'shadow_quality': 2,
-        'animation_frames': 6,
-        'texture_size': 1,
-        'antialiasing': True,
-        'bloom_effect': True,
-        'motion_blur': False,
-        'weather_effects': True,
-        'dynamic_lighting': True,
-        'reflection_quality': 1,
-        'vegetation_density': 0.8
-    },
-    'medium': {
-        'particle_count': 250,
-        'shadow_quality': 1,
-        'animation_frames': 4,
-        'texture_size': 1,
-        'antialiasing': True,
-        'bloom_effect': False,
-        'motion_blur': False,
-        'weather_effects': True,
-        'dynamic_lighting': False,
-        'reflection_quality': 0,
-        'vegetation_density': 0.6
-    },
-    'low': {
-        'particle_count': 100,
-        'shadow_quality': 0,
-        'animation_frames': 2,
-        'texture_size': 0,
-        'antialiasing': False,
-        'bloom_effect': False,
-        'motion_blur': False,
-        'weather_effects': False,
-        'dynamic_lighting': False,
-        'reflection_quality': 0,
-        'vegetation_density': 0.4
-    }
-}
-
-# Screen states
-SCREEN_STATES = {
-    'main_menu': 'main_menu',
-    'game': 'game',
-    'pause': 'pause',
-    'options': 'options',
-    'world_gen': 'world_gen'
-}
-
-# Button styles with enhanced visual effects
-BUTTON_STYLES = {
-    'normal': {
-        'border_radius': 10,
-        'border_width': 2,
-        'border_color': UI_COLORS['panel_border'],
-        'glow_color': UI_COLORS['button_glow'],
-        'shadow_color': (0, 0, 0, 60),
-        'shadow_offset': 2,
-        'transition_speed': 0.2,
-        'pulse_effect': True
-    },
-    'hover': {
-        'border_radius': 10,
-        'border_width': 2,
-        'border_color': UI_COLORS['text_highlight'],
-        'glow_color': UI_COLORS['button_glow'],
-        'shadow_color': (0, 0, 0, 80),
-        'shadow_offset': 3,
-        'transition_speed': 0.2,
-        'pulse_effect': True
-    },
-    'pressed': {
-        'border_radius': 10,
-        'border_width': 2,
-        'border_color': UI_COLORS['text_dim'],
-        'glow_color': (0, 0, 0, 0),
-        'shadow_color': (0, 0, 0, 100),
-        'shadow_offset': 1,
-        'transition_speed': 0.1,
-        'pulse_effect': False
-    },
-    'disabled': {
-        'border_radius': 10,
-        'border_width': 1,
-        'border_color': UI_COLORS['text_dim'],
-        'glow_color': (0, 0, 0, 0),
-        'shadow_color': (0, 0, 0, 40),
-        'shadow_offset': 1,
-        'transition_speed': 0.3,
-        'pulse_effect': False
-    }
-}
-
-# Initialize fonts
-FONTS = {
-    'title': pygame.font.Font(None, 64),
-    'normal': pygame.font.Font(None, 32),
-    'small': pygame.font.Font(None, 24),
-    'tiny': pygame.font.Font(None, 16),
-    'button': pygame.font.Font(None, 28)
-} 
-
 # Entity interaction types
 INTERACTION_TYPES = {
-    'talk': {
-        'name': 'Talk',
-        'icon': '💬',
-        'duration': 5,
-        'social_impact': 0.1
-    },
-    'trade': {
-        'name': 'Trade',
-        'icon': '💰',
-        'duration': 10,
-        'social_impact': 0.2
-    },
-    'help': {
-        'name': 'Help',
-        'icon': '🤝',
-        'duration': 15,
-        'social_impact': 0.3
-    },
-    'teach': {
-        'name': 'Teach',
-        'icon': '📚',
-        'duration': 20,
-        'social_impact': 0.25
-    },
-    'play': {
-        'name': 'Play',
-        'icon': '🎮',
-        'duration': 10,
-        'social_impact': 0.15
-    }
+    'talk': InteractionSpec(
+        name='Talk',
+        icon='💬',
+        duration=5,
+        social_impact=0.1
+    ),
+    'trade': InteractionSpec(
+        name='Trade',
+        icon='💰',
+        duration=10,
+        social_impact=0.2
+    ),
+    'help': InteractionSpec(
+        name='Help',
+        icon='🤝',
+        duration=15,
+        social_impact=0.3
+    ),
+    'teach': InteractionSpec(
+        name='Teach',
+        icon='📚',
+        duration=20,
+        social_impact=0.25
+    ),
+    'play': InteractionSpec(
+        name='Play',
+        icon='🎮',
+        duration=10,
+        social_impact=0.15
+    )
 }
 
+InteractionId = IntEnum('InteractionId', [name.upper() for name in INTERACTION_TYPES], start=0)
+INTERACTION_DURATION = _spec_column(INTERACTION_TYPES, 'duration', np.float32)
+INTERACTION_SOCIAL_IMPACT = _spec_column(INTERACTION_TYPES, 'social_impact', np.float32)
+
 # Entity states
 ENTITY_STATES = {
-    'idle': {
-        'name': 'Idle',
-        'icon': '💤',
-        'energy_cost': 0
-    },
-    'moving': {
-        'name': 'Moving',
-        'icon': '🚶',
-        'energy_cost': 0.5
-    },
-    'working': {
-        'name': 'Working',
-        'icon': '⚒️',
-        'energy_cost': 1.0
-    },
-    'resting': {
-        'name': 'Resting',
-        'icon': '😴',
-        'energy_cost': -1.0
-    },
-    'socializing': {
-        'name': 'Socializing',
-        'icon': '👥',
-        'energy_cost': 0.3
-    },
-    'eating': {
-        'name': 'Eating',
-        'icon': '🍽️',
-        'energy_cost': -0.5
-    },
-    'sleeping': {
-        'name': 'Sleeping',
-        'icon': '💤',
-        'energy_cost': -2.0
-    }
+    'idle': EntityStateSpec(
+        name='Idle',
+        icon='💤',
+        energy_cost=0
+    ),
+    'moving': EntityStateSpec(
+        name='Moving',
+        icon='🚶',
+        energy_cost=0.5
+    ),
+    'working': EntityStateSpec(
+        name='Working',
+        icon='⚒️',
+        energy_cost=1.0
+    ),
+    'resting': EntityStateSpec(
+        name='Resting',
+        icon='😴',
+        energy_cost=-1.0
+    ),
+    'socializing': EntityStateSpec(
+        name='Socializing',
+        icon='👥',
+        energy_cost=0.3
+    ),
+    'eating': EntityStateSpec(
+        name='Eating',
+        icon='🍽️',
+        energy_cost=-0.5
+    ),
+    'sleeping': EntityStateSpec(
+        name='Sleeping',
+        icon='💤',
+        energy_cost=-2.0
+    )
 }
 
+# Per-state columns indexed by EntityStateId, for updating many entities at once
+EntityStateId = IntEnum('EntityStateId', [name.upper() for name in ENTITY_STATES], start=0)
+STATE_ENERGY_COST = _spec_column(ENTITY_STATES, 'energy_cost', np.float32)
+
 # Entity needs
 ENTITY_NEEDS = {
-    'hunger': {
-        'name': 'Hunger',
-        'icon': '🍖',
-        'decay_rate': 0.1,
-        'critical_threshold': 20
-    },
-    'thirst': {
-        'name': 'Thirst',
-        'icon': '💧',
-        'decay_rate': 0.15,
-        'critical_threshold': 15
-    },
-    'energy': {
-        'name': 'Energy',
-        'icon': '⚡',
-        'decay_rate': 0.05,
-        'critical_threshold': 10
-    },
-    'social': {
-        'name': 'Social',
-        'icon': '👥',
-        'decay_rate': 0.03,
-        'critical_threshold': 25
-    },
-    'comfort': {
-        'name': 'Comfort',
-        'icon': '🛋️',
-        'decay_rate': 0.02,
-        'critical_threshold': 30
-    }
+    'hunger': EntityNeedSpec(
+        name='Hunger',
+        icon='🍖',
+        decay_rate=0.1,
+        critical_threshold=20
+    ),
+    'thirst': EntityNeedSpec(
+        name='Thirst',
+        icon='💧',
+        decay_rate=0.15,
+        critical_threshold=15
+    ),
+    'energy': EntityNeedSpec(
+        name='Energy',
+        icon='⚡',
+        decay_rate=0.05,
+        critical_threshold=10
+    ),
+    'social': EntityNeedSpec(
+        name='Social',
+        icon='👥',
+        decay_rate=0.03,
+        critical_threshold=25
+    ),
+    'comfort': EntityNeedSpec(
+        name='Comfort',
+        icon='🛋️',
+        decay_rate=0.02,
+        critical_threshold=30
+    )
 }
 
+# Per-need columns indexed by EntityNeedId, e.g. needs -= NEED_DECAY_RATE * dt
+# over an (entities, needs) array
+EntityNeedId = IntEnum('EntityNeedId', [name.upper() for name in ENTITY_NEEDS], start=0)
+NEED_DECAY_RATE = _spec_column(ENTITY_NEEDS, 'decay_rate', np.float32)
+NEED_CRITICAL = _spec_column(ENTITY_NEEDS, 'critical_threshold', np.float32)
+
+# Per-second need change for an entity in each state (EntityStateId x EntityNeedId):
+# every need decays at its rate and energy also pays the state's energy cost,
+# so resting and sleeping (negative cost) restore it
+STATE_NEED_DELTA = np.tile(-NEED_DECAY_RATE, (len(ENTITY_STATES), 1))
+STATE_NEED_DELTA[:, EntityNeedId.ENERGY] -= STATE_ENERGY_COST
+STATE_NEED_DELTA.flags.writeable = False
+
 # Personality traits
 PERSONALITY_TRAITS = {
     'openness': (0, 1),
@@ -2065,33 +1982,101 @@ PERSONALITY_TRAITS = {
 
 # Moods
 MOODS = {
-    'happy': {
-        'icon': '😊',
-        'color': (50, 205, 50),
-        'social_bonus': 0.2
-    },
-    'content': {
-        'icon': '😌',
-        'color': (135, 206, 235),
-        'social_bonus': 0.1
-    },
-    'neutral': {
-        'icon': '😐',
-        'color': (200, 200, 200),
-        'social_bonus': 0
-    },
-    'sad': {
-        'icon': '😢',
-        'color': (100, 149, 237),
-        'social_bonus': -0.1
-    },
-    'angry': {
-        'icon': '😠',
-        'color': (220, 20, 60),
-        'social_bonus': -0.2
-    }
+    'happy': MoodSpec(
+        icon='😊',
+        color=(50, 205, 50),
+        social_bonus=0.2
+    ),
+    'content': MoodSpec(
+        icon='😌',
+        color=(135, 206, 235),
+        social_bonus=0.1
+    ),
+    'neutral': MoodSpec(
+        icon='😐',
+        color=(200, 200, 200),
+        social_bonus=0
+    ),
+    'sad': MoodSpec(
+        icon='😢',
+        color=(100, 149, 237),
+        social_bonus=-0.1
+    ),
+    'angry': MoodSpec(
+        icon='😠',
+        color=(220, 20, 60),
+        social_bonus=-0.2
+    )
 }
 
+# Structure-of-arrays views of the mood, trait and animal tables, with rows
+# ordered like the dicts so e.g. ANIMAL_SPEED[animal_ids] gathers a column
+def _dict_column(table, field: str, dtype) -> np.ndarray:
+    """Pack one field of every entry in a dict table into a read-only array"""
+    column = np.array([entry[field] for entry in table.values()], dtype=dtype)
+    column.flags.writeable = False
+    return column
+
+class MoodTable(NamedTuple):
+    social_bonus: np.ndarray
+    color_rgba: np.ndarray
+
+MoodId = IntEnum('MoodId', [name.upper() for name in MOODS], start=0)
+MOOD_NAME_TO_ID = {name: i for i, name in enumerate(MOODS)}
+MOOD_COLOR_RGBA = np.array([(*mood.color, 255) for mood in MOODS.values()], dtype=np.uint8)
+MOOD_COLOR_RGBA.flags.writeable = False
+MOOD_COLORS = MOOD_COLOR_RGBA[:, :3]  # (N, 3) view that Surface.fill accepts directly
+MOOD_TABLE = MoodTable(
+    social_bonus=_spec_column(MOODS, 'social_bonus', np.float32),
+    color_rgba=MOOD_COLOR_RGBA
+)
+
+# Personality traits are (min, max) ranges; one row per TraitId
+TraitId = IntEnum('TraitId', [name.upper() for name in PERSONALITY_TRAITS], start=0)
+TRAIT_RANGES = np.array(list(PERSONALITY_TRAITS.values()), dtype=np.float32)
+TRAIT_RANGES.flags.writeable = False
+TRAIT_NAMES = tuple(PERSONALITY_TRAITS)
+TRAIT_LOW = TRAIT_RANGES[:, 0]
+TRAIT_HIGH = TRAIT_RANGES[:, 1]
+
+# Effect multipliers from PERSONALITY_TRAIT_PROFILES as a TraitId x EffectId
+# matrix; effects a trait does not list are neutral (1.0)
+EffectId = IntEnum('EffectId', [effect.upper() for name in PERSONALITY_TRAITS
+                                for effect in PERSONALITY_TRAIT_PROFILES[name]['effects']], start=0)
+PERSONALITY_EFFECT_MATRIX = np.ones((len(TraitId), len(EffectId)), dtype=np.float32)
+for _trait_id, _name in enumerate(PERSONALITY_TRAITS):
+    for _effect, _multiplier in PERSONALITY_TRAIT_PROFILES[_name]['effects'].items():
+        PERSONALITY_EFFECT_MATRIX[_trait_id, EffectId[_effect.upper()]] = _multiplier
+PERSONALITY_EFFECT_MATRIX.flags.writeable = False
+
+AnimalId = IntEnum('AnimalId', [name.upper() for name in ANIMAL_TYPES], start=0)
+ANIMAL_SPEED = _dict_column(ANIMAL_TYPES, 'speed', np.float32)
+ANIMAL_SIZE = _dict_column(ANIMAL_TYPES, 'size', np.float32)
+ANIMAL_VISION_RANGE = _dict_column(ANIMAL_TYPES, 'vision_range', np.float32)
+ANIMAL_DAMAGE = _dict_column(ANIMAL_TYPES, 'damage', np.float32)
+ANIMAL_HEALTH = _dict_column(ANIMAL_TYPES, 'health', np.float32)
+ANIMAL_MAX_ENERGY = _dict_column(ANIMAL_TYPES, 'max_energy', np.float32)
+
+@lru_cache(maxsize=8)
+def get_animal_sprites(size: int) -> Tuple[pygame.Surface, ...]:
+    """Get pre-rendered animal sprites indexed by AnimalId"""
+    return tuple(render_emoji(animal['sprite'], size) for animal in ANIMAL_TYPES.values())
+
+# (min, max) behaviour durations by BehaviorId, sampled for many animals at once
+BehaviorId = IntEnum('BehaviorId', [name.upper() for name in ANIMAL_BEHAVIORS], start=0)
+BEHAVIOR_DURATION_LO = np.array([behavior['duration'][0] for behavior in ANIMAL_BEHAVIORS.values()],
+                                dtype=np.float32)
+BEHAVIOR_DURATION_HI = np.array([behavior['duration'][1] for behavior in ANIMAL_BEHAVIORS.values()],
+                                dtype=np.float32)
+BEHAVIOR_DURATION_LO.flags.writeable = False
+BEHAVIOR_DURATION_HI.flags.writeable = False
+_DURATION_RNG = np.random.default_rng()
+
+def sample_behavior_durations(behavior_ids: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Draw one uniform duration per entry of behavior_ids in a single call"""
+    rng = rng or _DURATION_RNG
+    return rng.uniform(BEHAVIOR_DURATION_LO[behavior_ids], BEHAVIOR_DURATION_HI[behavior_ids])
+
 # Thought types
 THOUGHT_TYPES = {
     'need': {
@@ -2116,39 +2101,174 @@ THOUGHT_TYPES = {
     }
 }
 
+# Thought types in decreasing priority, so the first one that applies is the
+# highest-priority thought without a max() over the dict
+THOUGHT_NAMES = tuple(sorted(THOUGHT_TYPES, key=lambda name: -THOUGHT_TYPES[name]['priority']))
+THOUGHT_PRIORITY = np.array([THOUGHT_TYPES[name]['priority'] for name in THOUGHT_NAMES],
+                            dtype=np.float32)
+THOUGHT_PRIORITY.flags.writeable = False
+
 # Human types
 HUMAN_TYPES = {
-    'villager': {
-        'sprite': '👤',
-        'speed': 2.0,
-        'vision_range': 8,
-        'intelligence': 1.0,
-        'starting_skills': {
+    'villager': HumanTypeSpec(
+        sprite='👤',
+        speed=2.0,
+        vision_range=8,
+        intelligence=1.0,
+        starting_skills={
             'farming': 0.2,
             'crafting': 0.2,
             'social': 0.5
         }
-    },
-    'merchant': {
-        'sprite': '👨‍💼',
-        'speed': 1.8,
-        'vision_range': 10,
-        'intelligence': 1.2,
-        'starting_skills': {
+    ),
+    'merchant': HumanTypeSpec(
+        sprite='👨\u200d💼',
+        speed=1.8,
+        vision_range=10,
+        intelligence=1.2,
+        starting_skills={
             'trading': 0.6,
             'social': 0.7,
             'negotiation': 0.5
         }
-    },
-    'farmer': {
-        'sprite': '👨‍🌾',
-        'speed': 1.5,
-        'vision_range': 6,
-        'intelligence': 0.9,
-        'starting_skills': {
+    ),
+    'farmer': HumanTypeSpec(
+        sprite='👨\u200d🌾',
+        speed=1.5,
+        vision_range=6,
+        intelligence=0.9,
+        starting_skills={
             'farming': 0.7,
             'nature': 0.6,
             'crafting': 0.3
         }
-    }
-}
\ No newline at end of file
+    )
+}
+
+HumanId = IntEnum('HumanId', [name.upper() for name in HUMAN_TYPES], start=0)
+HUMAN_SPEED = _spec_column(HUMAN_TYPES, 'speed', np.float32)
+HUMAN_VISION = _spec_column(HUMAN_TYPES, 'vision_range', np.float32)
+HUMAN_INTELLIGENCE = _spec_column(HUMAN_TYPES, 'intelligence', np.float32)
+
+# Dense HumanId x skill matrix of starting skills; skills a type does not list are 0
+SKILL_NAMES = tuple(dict.fromkeys(skill for human in HUMAN_TYPES.values()
+                                  for skill in human.starting_skills))
+SKILL_INDEX = MappingProxyType({name: i for i, name in enumerate(SKILL_NAMES)})
+STARTING_SKILLS = np.zeros((len(HUMAN_TYPES), len(SKILL_NAMES)), dtype=np.float32)
+for _row, _human in enumerate(HUMAN_TYPES.values()):
+    for _skill, _level in _human.starting_skills.items():
+        STARTING_SKILLS[_row, SKILL_INDEX[_skill]] = _level
+STARTING_SKILLS.flags.writeable = False
+
+def _freeze(value):
+    """Recursively turn dicts into read-only views, lists into tuples and intern strings"""
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return value._replace(**{field: _freeze(getattr(value, field)) for field in value._fields})
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(key) if isinstance(key, str) else key: _freeze(item)
+                                 for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+# Read-only views of the shared tables so accidental writes raise; every key
+# and string field is interned so name/icon comparisons hit the identity check
+WEATHER_TYPES = _freeze(WEATHER_TYPES)
+BIOMES = _freeze(BIOMES)
+SEASONS = _freeze(SEASONS)
+ENTITY_STATES = _freeze(ENTITY_STATES)
+ENTITY_NEEDS = _freeze(ENTITY_NEEDS)
+UI_COLORS = _freeze(UI_COLORS)
+TIME_SPEEDS = _freeze(TIME_SPEEDS)
+ENTITY_TYPES = _freeze(ENTITY_TYPES)
+RESOURCE_TYPES = _freeze(RESOURCE_TYPES)
+BIOME_VEGETATION = _freeze(BIOME_VEGETATION)
+FONT_SIZES = _freeze(FONT_SIZES)
+FONT_STYLES = _freeze(FONT_STYLES)
+BUTTON_STYLES = _freeze(BUTTON_STYLES)
+SCREEN_STATES = _freeze(SCREEN_STATES)
+CAMERA_SETTINGS = _freeze(CAMERA_SETTINGS)
+THOUGHT_TYPES = _freeze(THOUGHT_TYPES)
+THOUGHT_COMPLEXITY_LEVELS = _freeze(THOUGHT_COMPLEXITY_LEVELS)
+THOUGHT_SYSTEM_SETTINGS = _freeze(THOUGHT_SYSTEM_SETTINGS)
+EMOTION_SYSTEM_SETTINGS = _freeze(EMOTION_SYSTEM_SETTINGS)
+MOODS = _freeze(MOODS)
+PERSONALITY_TRAITS = _freeze(PERSONALITY_TRAITS)
+PERSONALITY_TRAIT_PROFILES = _freeze(PERSONALITY_TRAIT_PROFILES)
+STATUS_EFFECTS = _freeze(STATUS_EFFECTS)
+HUMAN_TYPES = _freeze(HUMAN_TYPES)
+ANIMAL_TYPES = _freeze(ANIMAL_TYPES)
+PLANT_TYPES = _freeze(PLANT_TYPES)
+ANIMAL_BEHAVIORS = _freeze(ANIMAL_BEHAVIORS)
+ANIMAL_STATES = _freeze(ANIMAL_STATES)
+GRAPHICS_QUALITY = _freeze(GRAPHICS_QUALITY)
+VISUAL_EFFECTS = _freeze(VISUAL_EFFECTS)
+BIOME_COLORS = _freeze(BIOME_COLORS)
+INTERACTION_TYPES = _freeze(INTERACTION_TYPES)
+
+# Reverse lookups built once so consumers never scan the tables by position
+TIME_SPEED_NAMES = tuple(TIME_SPEEDS)
+TIME_SPEED_INDEX = MappingProxyType({speed: i for i, speed in enumerate(TIME_SPEEDS.values())})
+STATE_INDEX = MappingProxyType({name: i for i, name in enumerate(ENTITY_STATES)})
+NEED_INDEX = MappingProxyType({name: i for i, name in enumerate(ENTITY_NEEDS)})
+HUMAN_INDEX = MappingProxyType({name: i for i, name in enumerate(HUMAN_TYPES)})
+MOOD_BY_COLOR = MappingProxyType({mood.color: name for name, mood in MOODS.items()})
+
+# Icons are only needed when drawing, so the renderer reads them from these
+# instead of pulling whole spec records into the per-tick code
+INTERACTION_ICONS = MappingProxyType({name: spec.icon for name, spec in INTERACTION_TYPES.items()})
+STATE_ICONS = MappingProxyType({name: spec.icon for name, spec in ENTITY_STATES.items()})
+NEED_ICONS = MappingProxyType({name: spec.icon for name, spec in ENTITY_NEEDS.items()})
+MOOD_ICONS = MappingProxyType({name: mood.icon for name, mood in MOODS.items()})
+
+__all__ = (
+    'SeasonSpec', 'EntityEffects', 'LightningSpec', 'WindEffectsSpec',
+    'WeatherGraphics', 'WeatherSpec', 'BiomeSpec', 'EntityStateSpec', 'EntityNeedSpec',
+    'InteractionSpec', 'MoodSpec', 'HumanTypeSpec',
+    'WINDOW_WIDTH', 'WINDOW_HEIGHT', 'WINDOW_TITLE', 'DISPLAY_FLAGS', 'TARGET_FPS',
+    'FRAME_LENGTH', 'VSYNC', 'WORLD_WIDTH', 'WORLD_HEIGHT', 'CHUNK_SIZE', 'TILE_SIZE',
+    'WORLD_CHUNKS_X', 'WORLD_CHUNKS_Y', 'TIME_SCALE', 'SEASON_LENGTH', 'DAY_LENGTH',
+    'TIME_SPEEDS', 'SEASONS', 'WEATHER_TYPES', 'SEASON_ORDER', 'rain_effect',
+    'snow_effect', 'ENTITY_TYPES', 'ENTITY_STATES', 'ENTITY_NEEDS', 'RESOURCE_TYPES',
+    'BIOMES', 'SeasonId', 'WeatherId', 'BiomeId', 'SEASON_SPECS', 'NUM_SEASONS',
+    'NEXT_SEASON_ID', 'NEXT_SEASON_NAME',
+    'SEASON_BASE_TEMP', 'SEASON_GROWTH_MOD', 'SEASON_PRECIPITATION',
+    'SEASON_DAY_LENGTH', 'WEATHER_TEMP_MOD', 'WEATHER_WIND_SPEED', 'WEATHER_HUMIDITY',
+    'WEATHER_PRECIPITATION', 'WEATHER_DARKNESS', 'WEATHER_FOG', 'WEATHER_MAX_WIND',
+    'WEATHER_VISIBILITY', 'WEATHER_MOVEMENT_SPEED', 'WEATHER_OVERLAY_ALPHA',
+    'WEATHER_PARTICLE_COUNT', 'WEATHER_PROBABILITY', 'WEATHER_MOOD', 'WEATHER_ENERGY',
+    'SEASON_PROB_MOD_MAT', 'POSSIBLE_SEASONS_MASK', 'BIOME_WALKABLE',
+    'BIOME_BASE_FERTILITY', 'BIOME_MOISTURE_RETENTION', 'BIOME_TEMP_MOD', 'BIOME_ID',
+    'BIOME_COLOR_LUT', 'WEATHER_SKY_LUT', 'WEATHER_CLOUD_LUT', 'RESOURCE_NAMES',
+    'RESOURCES_BY_BIOME', 'BIOME_ID_RESOURCES', 'RESOURCE_FREQ_CUM_BY_BIOME',
+    'get_weather_overlay', 'sample_weather', 'BIOME_VEGETATION', 'FONT_SIZES', 'FontId',
+    'load_font', 'get_fonts', 'get_font', 'FONT_STYLES', 'render_styled', 'UI_COLORS',
+    'BUTTON_STYLES', 'SCREEN_STATES', 'CAMERA_MOVE_SPEED', 'CAMERA_ZOOM_SPEED',
+    'MIN_ZOOM', 'MAX_ZOOM', 'CAMERA_SETTINGS', 'MAX_THOUGHTS', 'THOUGHT_DURATION',
+    'THOUGHT_INTERVAL', 'THOUGHT_TYPES', 'THOUGHT_CATEGORIES',
+    'THOUGHT_COMPLEXITY_LEVELS', 'THOUGHT_SYSTEM_SETTINGS', 'EMOTION_SYSTEM_SETTINGS',
+    'MOODS', 'PERSONALITY_TRAITS', 'STATUS_EFFECTS', 'HUMAN_TYPES', 'ANIMAL_TYPES',
+    'PLANT_TYPES', 'ANIMAL_BEHAVIORS', 'ANIMAL_STATES', 'GRAPHICS_QUALITY',
+    'VISUAL_EFFECTS', 'MAX_ENTITIES', 'ENTITY_VIEW_DISTANCE',
+    'ENTITY_INTERACTION_DISTANCE', 'ACTIVE_CHUNKS_RADIUS', 'WORLD_SEED',
+    'SHOW_FPS', 'SHOW_HITBOXES', 'SHOW_PATHS', 'SHOW_CHUNKS', 'BIOME_COLORS',
+    'INTERACTION_TYPES', 'EntityStateId', 'STATE_ENERGY_COST', 'MoodTable', 'MoodId',
+    'MOOD_NAME_TO_ID', 'MOOD_COLOR_RGBA', 'MOOD_TABLE', 'TraitId', 'TRAIT_RANGES',
+    'AnimalId', 'ANIMAL_SPEED', 'ANIMAL_SIZE', 'ANIMAL_VISION_RANGE', 'ANIMAL_DAMAGE',
+    'ANIMAL_HEALTH', 'ANIMAL_MAX_ENERGY', 'ColorId', 'COLOR_LUT', 'get_color',
+    'PERSONALITY_TRAIT_PROFILES', 'EffectId', 'PERSONALITY_EFFECT_MATRIX', 'BehaviorId',
+    'BEHAVIOR_DURATION_LO', 'BEHAVIOR_DURATION_HI', 'sample_behavior_durations',
+    'render_emoji', 'get_animal_sprites', 'colorize_biomes', 'VEGETATION_NAMES',
+    'VEGETATION_BIT', 'BIOME_VEGETATION_MASK', 'StatusId', 'STATUS_DURATION',
+    'STATUS_ENERGY_DELTA', 'STATUS_HEALTH_DELTA', 'STATUS_MOOD_DELTA',
+    'STATUS_SPEED_MULT', 'STATUS_WORK_MULT', 'STATUS_CREATIVITY_MULT', 'EntityNeedId',
+    'NEED_DECAY_RATE', 'NEED_CRITICAL', 'HumanId', 'HUMAN_SPEED', 'HUMAN_VISION',
+    'HUMAN_INTELLIGENCE', 'TIME_SPEED_NAMES', 'TIME_SPEED_INDEX', 'STATE_INDEX',
+    'NEED_INDEX', 'HUMAN_INDEX', 'MOOD_BY_COLOR', 'InteractionId',
+    'INTERACTION_DURATION', 'INTERACTION_SOCIAL_IMPACT', 'INTERACTION_ICONS',
+    'STATE_ICONS', 'NEED_ICONS', 'MOOD_ICONS', 'MOOD_COLORS', 'TRAIT_NAMES', 'TRAIT_LOW',
+    'TRAIT_HIGH', 'SKILL_NAMES', 'SKILL_INDEX', 'STARTING_SKILLS', 'STATE_NEED_DELTA',
+    'THOUGHT_NAMES', 'THOUGHT_PRIORITY'
+)
@@ -1,25 +1,190 @@
 import pygame
-import random
 import traceback
 import math
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from ..constants import (
-    ENTITY_TYPES, TILE_SIZE, STATUS_EFFECTS,
-    WEATHER_EFFECTS, BIOMES
+    ENTITY_TYPES, ANIMAL_TYPES, TILE_SIZE, STATUS_EFFECTS,
+    WEATHER_TYPES, BIOME_ID, render_emoji
 )
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional (the "fast" extra)
+    njit = prange = None
+
+# Column indices into AnimalSystem.needs
+HUNGER, THIRST, REST, SAFETY = range(4)
+
+# Per-second growth of each need; safety is recomputed from threats instead
+_NEED_RATES = np.array([2.0, 3.0, 1.5, 0.0], dtype=np.float32)
+
+# Behavior states, stored as int8 codes in AnimalSystem.state
+ANIMAL_STATES = ('idle', 'moving', 'hunting', 'fleeing', 'resting', 'drinking', 'returning_home')
+_STATE_CODES = {name: code for code, name in enumerate(ANIMAL_STATES)}
+IDLE, MOVING, HUNTING, FLEEING, RESTING, DRINKING, RETURNING_HOME = range(len(ANIMAL_STATES))
+
+# Active-time preference codes stored in AnimalSystem.preferred_time
+PREFERRED_TIMES = ('any', 'day', 'night')
+ANY_TIME, DAY_TIME, NIGHT_TIME = range(len(PREFERRED_TIMES))
+
+# Tiles with a biome missing from BIOME_ID get an id no preference mask has set
+_UNKNOWN_BIOME = len(BIOME_ID)
+
+def _biome_mask(names: Tuple[str, ...]) -> int:
+    """Bitmask with bit BIOME_ID[name] set for each known biome name"""
+    mask = 0
+    for name in names:
+        if name in BIOME_ID:
+            mask |= 1 << BIOME_ID[name]
+    return mask
+
+@lru_cache(maxsize=64)
+def _bar_surface(width: int, height: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Solid bar of one color; partial bars blit a sub-area of it"""
+    surface = pygame.Surface((width, height))
+    surface.fill(color)
+    return surface
+
+@lru_cache(maxsize=256)
+def _scaled_sprite(sprite: pygame.Surface, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """Scale and tint an image sprite once per (sprite, size, color); callers must not draw on the result"""
+    scaled = pygame.transform.scale(sprite, (size, size))
+    scaled.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+    return scaled
+
+class Threat(NamedTuple):
+    type: str
+    danger_level: float
+    source: Optional['Animal'] = None
+
+# Threats without a source are the same every time, so they are shared
+_WEATHER_THREAT = Threat('weather', 0.7)
+_TERRAIN_THREAT = Threat('terrain', 0.5)
+
+# Status effects an animal can carry; effect i is bit 1 << i of AnimalSystem.status_flags
+ANIMAL_EFFECTS = ('injured',) + tuple(STATUS_EFFECTS)
+INJURED = 1 << ANIMAL_EFFECTS.index('injured')
+_EFFECT_BITS = np.left_shift(1, np.arange(len(ANIMAL_EFFECTS), dtype=np.uint32), dtype=np.uint32)
+
+# Only the shared STATUS_EFFECTS get an indicator above the sprite
+_INDICATOR_MASK = int(_EFFECT_BITS[[ANIMAL_EFFECTS.index(name) for name in STATUS_EFFECTS]].sum())
+
+# Known food and water sources are (k, 2) arrays of positions
+_NO_SOURCES = np.zeros((0, 2))
+_NO_SOURCES.flags.writeable = False
+
+def _sources_within(known: np.ndarray, x: float, y: float, range_sq: float) -> np.ndarray:
+    """Rows of known within range_sq (squared distance) of (x, y)"""
+    dx = known[:, 0] - x
+    dy = known[:, 1] - y
+    return known[dx * dx + dy * dy <= range_sq]
+
+def _merge_sources(known: np.ndarray, found: List[Tuple[float, float]]) -> np.ndarray:
+    """Append the positions in found that are not already rows of known"""
+    seen = set(map(tuple, known.tolist()))
+    fresh = [pos for pos in dict.fromkeys(found) if pos not in seen]
+    return np.vstack([known, fresh]) if fresh else known
+
+# Attack damage per damage class; an animal's class is fixed when it spawns
+_DAMAGE_CLASSES = ('wolf', 'bear')
+_DAMAGE_BY_CLASS = np.array([20.0, 25.0, 30.0])
+
+def _damage_class(animal_type: str) -> int:
+    """Index into _DAMAGE_BY_CLASS: 1 + the first class named in the type, else 0"""
+    for i, name in enumerate(_DAMAGE_CLASSES):
+        if name in animal_type:
+            return i + 1
+    return 0
+
+# Species without a color in ANIMAL_TYPES are drawn untinted
+_DEFAULT_TINT = (255, 255, 255)
+
+# Cell keys are cell_x * _GRID_STRIDE + cell_y, so one column of cells is one key range
+_GRID_STRIDE = 1 << 32
+
+# Energy spent per second of movement in each state
+_MOVE_ENERGY_COST = np.full(len(ANIMAL_STATES), 0.5)
+_MOVE_ENERGY_COST[FLEEING] *= 2
+_MOVE_ENERGY_COST[HUNTING] *= 1.5
+
+def _integrate_movement_numpy(pos, vel, step, width, height, energy, state, dt):
+    pos += vel * step[:, None]
+    np.clip(pos[:, 0], 0, width, out=pos[:, 0])
+    np.clip(pos[:, 1], 0, height, out=pos[:, 1])
+    
+    moving = vel.any(axis=1)
+    energy[moving] -= dt * _MOVE_ENERGY_COST[state[moving]]
+    np.maximum(energy, 0, out=energy)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _integrate_movement(pos, vel, step, width, height, energy, state, dt):
+        for i in prange(pos.shape[0]):
+            pos[i, 0] = min(max(pos[i, 0] + vel[i, 0] * step[i], 0.0), width)
+            pos[i, 1] = min(max(pos[i, 1] + vel[i, 1] * step[i], 0.0), height)
+            if vel[i, 0] != 0.0 or vel[i, 1] != 0.0:
+                energy[i] -= dt * _MOVE_ENERGY_COST[state[i]]
+            energy[i] = max(energy[i], 0.0)
+else:
+    _integrate_movement = _integrate_movement_numpy
+
+def _decide_behaviors_numpy(safety, preferred_time, is_day, rest, energy, thirst, has_water,
+                            hunger, is_predator, has_prey, has_food, far_from_home, roll, out_state):
+    hungry = hunger > 70
+    out_state[:] = np.select(
+        [safety > 50,
+         (preferred_time == (NIGHT_TIME if is_day else DAY_TIME)),
+         (rest > 80) | (energy < 20),
+         (thirst > 80) & has_water,
+         hungry & is_predator & has_prey,
+         hungry & ~is_predator & has_food,
+         far_from_home,
+         roll < 0.3],
+        [FLEEING, RESTING, RESTING, DRINKING, HUNTING, MOVING, RETURNING_HOME, IDLE],
+        MOVING
+    )
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _decide_behaviors(safety, preferred_time, is_day, rest, energy, thirst, has_water,
+                          hunger, is_predator, has_prey, has_food, far_from_home, roll, out_state):
+        for i in prange(out_state.shape[0]):
+            if safety[i] > 50:
+                out_state[i] = FLEEING
+            elif ((preferred_time[i] == DAY_TIME and not is_day) or
+                  (preferred_time[i] == NIGHT_TIME and is_day)):
+                out_state[i] = RESTING
+            elif rest[i] > 80 or energy[i] < 20:
+                out_state[i] = RESTING
+            elif thirst[i] > 80 and has_water[i]:
+                out_state[i] = DRINKING
+            elif hunger[i] > 70 and is_predator[i] and has_prey[i]:
+                out_state[i] = HUNTING
+            elif hunger[i] > 70 and not is_predator[i] and has_food[i]:
+                out_state[i] = MOVING
+            elif far_from_home[i]:
+                out_state[i] = RETURNING_HOME
+            elif roll[i] < 0.3:
+                out_state[i] = IDLE
+            else:
+                out_state[i] = MOVING
+else:
+    _decide_behaviors = _decide_behaviors_numpy
+
 class Animal:
     def __init__(self, world, pos: Tuple[float, float], animal_type: str):
         """Initialize animal entity with advanced features"""
         try:
-            print(f"Creating {animal_type} at position {pos}")
             self.world = world
-            self.x, self.y = pos
             self.type = animal_type
             self.id = f"animal_{id(self)}"  # Unique identifier
             
-            # Get base properties from entity types
+            # Get base properties from entity types; the species entry
+            # supplies the sprite, tint and predator/prey behavior
             self.properties = ENTITY_TYPES['animal'].copy()
+            species = ANIMAL_TYPES[animal_type]
             
             # Basic attributes
             self.speed = self.properties['speed']
@@ -27,695 +192,816 @@ class Animal:
             self.vision_range = self.properties['specs']['vision_range']
             self.interaction_range = self.properties['specs']['interaction_range']
             
-            # Core stats
-            self.health = self.properties['specs']['max_health']
-            self.max_health = self.properties['specs']['max_health']
-            self.energy = self.properties['specs']['max_energy']
-            self.max_energy = self.properties['specs']['max_energy']
+            # Squared ranges so range checks can skip the square root
+            self.vision_radius = self.vision_range * TILE_SIZE
+            self.vision_sq = self.vision_radius ** 2
+            self.interaction_range_sq = self.interaction_range ** 2
             
-            # Needs
-            self.needs = {
-                'hunger': 0,
-                'thirst': 0,
-                'rest': 0,
-                'safety': 0
-            }
+            # Position, velocity, core stats, needs and state live in the
+            # world's AnimalSystem columns; this object holds its row index
+            self.system = getattr(world, 'animal_system', None)
+            if self.system is None:
+                self.system = world.animal_system = AnimalSystem(world)
+            self.idx = self.system.add(self, pos,
+                                       self.properties['specs']['max_health'],
+                                       self.properties['specs']['max_energy'])
             
             # Behavior
-            self.state = 'idle'
             self.target_pos = None
-            self.velocity = [0, 0]
             self.wander_timer = 0
-            self.wander_interval = random.uniform(3.0, 8.0)
-            self.behavior_cooldown = 0
-            self.last_behavior_change = 0
-            
-            # Status effects
-            self.status_effects: Dict[str, Dict] = {}
+            self.wander_interval = self.system.rng.uniform(3.0, 8.0)
             
             # Characteristics
-            self.is_predator = 'predator' in animal_type.lower()
+            self.is_predator = species['behavior'] == 'predator'
             self.is_prey = not self.is_predator
             self.is_hostile = self.is_predator
-            self.preferred_biomes = self._determine_preferred_biomes()
-            self.preferred_time = random.choice(['day', 'night', 'any'])
+            self.preferred_biome_mask = self._determine_preferred_biomes()
+            self.preferred_time = PREFERRED_TIMES[self.system.rng.integers(len(PREFERRED_TIMES))]
+            self.system.is_predator[self.idx] = self.is_predator
+            self.system.vision_radius[self.idx] = self.vision_radius
+            self.system.preferred_time[self.idx] = PREFERRED_TIMES.index(self.preferred_time)
+            self.system.damage_class[self.idx] = _damage_class(animal_type)
             
             # Memory and awareness
-            self.known_food_sources = []
-            self.known_water_sources = []
+            self.known_food_xy = _NO_SOURCES
+            self.known_water_xy = _NO_SOURCES
             self.known_threats = []
             self.home_location = pos
             
             # Sprite/emoji
-            self.sprite = self.properties['sprite']
-            self.color = self.properties['color']
-            
-            print(f"{animal_type} created successfully with characteristics: predator={self.is_predator}, preferred_time={self.preferred_time}")
+            self.sprite = species.get('sprite', self.properties['sprite'])
+            self.color = species.get('color', _DEFAULT_TINT)
             
         except Exception as e:
             print(f"Error creating animal: {e}")
             traceback.print_exc()
             
+    @property
+    def x(self) -> float:
+        return self.system.pos[self.idx, 0]
+        
+    @x.setter
+    def x(self, value: float):
+        self.system.pos[self.idx, 0] = value
+        
+    @property
+    def y(self) -> float:
+        return self.system.pos[self.idx, 1]
+        
+    @y.setter
+    def y(self, value: float):
+        self.system.pos[self.idx, 1] = value
+        
+    @property
+    def velocity(self) -> np.ndarray:
+        return self.system.vel[self.idx]
+        
+    @velocity.setter
+    def velocity(self, value):
+        self.system.vel[self.idx] = value
+        
+    @property
+    def health(self) -> float:
+        return self.system.health[self.idx]
+        
+    @health.setter
+    def health(self, value: float):
+        self.system.health[self.idx] = value
+        
+    @property
+    def max_health(self) -> float:
+        return self.system.max_health[self.idx]
+        
+    @property
+    def energy(self) -> float:
+        return self.system.energy[self.idx]
+        
+    @energy.setter
+    def energy(self, value: float):
+        self.system.energy[self.idx] = value
+        
+    @property
+    def max_energy(self) -> float:
+        return self.system.max_energy[self.idx]
+        
+    @property
+    def needs(self) -> np.ndarray:
+        return self.system.needs[self.idx]
+        
+    @property
+    def state(self) -> str:
+        return ANIMAL_STATES[self.system.state[self.idx]]
+        
+    @state.setter
+    def state(self, value: str):
+        self.system.state[self.idx] = _STATE_CODES[value]
+        
+    @property
+    def behavior_cooldown(self) -> float:
+        return self.system.behavior_cooldown[self.idx]
+        
+    @property
+    def last_behavior_change(self) -> float:
+        return self.system.last_behavior_change[self.idx]
+        
     def update(self, dt: float):
-        """Update animal state with enhanced features"""
-        try:
-            # Update needs
-            self._update_needs(dt)
-            
-            # Update status effects
-            self._update_status_effects(dt)
-            
-            # Update behavior and decision making
+        """Advance this animal; the first row's call steps the whole AnimalSystem once"""
+        if self.idx == 0:
+            self.system.update(dt)
+            
+    def _prepare_tick(self, dt: float):
+        """Per-animal work before AnimalSystem picks new behaviors"""
+        # Safety need based on environment and threats
+        self.needs[SAFETY] = min(100, 20 * self._count_threats())
+        
+        self.wander_timer += dt
+        
+    def _finish_tick(self, dt: float, act: bool):
+        """Per-animal work after AnimalSystem picks new behaviors"""
+        # Execute current behavior unless still on behavior cooldown
+        if act:
             self._update_behavior(dt)
             
-            # Update movement and physics
-            self._update_movement(dt)
-            
-            # Update memory and awareness
-            self._update_awareness(dt)
-            
-        except Exception as e:
-            print(f"Error updating animal: {e}")
-            traceback.print_exc()
-            
+        # Terrain modifier for the batched movement step
+        self.system.speed_modifier[self.idx] = self._get_speed_modifier()
+        
+        # Update memory and awareness
+        self._update_awareness(dt)
+        
     def draw(self, surface: pygame.Surface, camera_pos: Tuple[float, float], zoom: float, effects: Dict = None):
         """Draw animal entity with enhanced visuals"""
         try:
-            # Calculate screen position
-            screen_x = (self.x - camera_pos[0]) * zoom
-            screen_y = (self.y - camera_pos[1]) * zoom
-            
-            # Apply visual effects based on status
-            color = self._get_display_color(effects)
-            
-            # Draw animal sprite/emoji with effects
-            if isinstance(self.sprite, str):  # Emoji fallback
-                font = pygame.font.SysFont('segoe ui emoji', int(TILE_SIZE * zoom))
-                text = font.render(self.sprite, True, color)
-                surface.blit(text, (screen_x, screen_y))
-            else:  # Image sprite
-                scaled_size = (int(self.size * zoom), int(self.size * zoom))
-                scaled_sprite = pygame.transform.scale(self.sprite, scaled_size)
-                # Apply color tint
-                tinted_sprite = self._apply_color_tint(scaled_sprite, color)
-                surface.blit(tinted_sprite, (screen_x, screen_y))
-                
-            # Draw status indicators
-            self._draw_status_indicators(surface, (screen_x, screen_y), zoom)
-            
-            # Draw health bar
-            self._draw_health_bar(surface, (screen_x, screen_y), zoom)
+            blit_sequence = []
+            self._collect_draw(blit_sequence,
+                               (self.x - camera_pos[0]) * zoom,
+                               (self.y - camera_pos[1]) * zoom,
+                               zoom, effects)
+            surface.blits(blit_sequence, doreturn=False)
             
         except Exception as e:
             print(f"Error drawing animal: {e}")
             traceback.print_exc()
             
-    def _update_needs(self, dt: float):
-        """Update animal needs"""
-        try:
-            # Increase needs over time
-            self.needs['hunger'] = min(100, self.needs['hunger'] + dt * 2)
-            self.needs['thirst'] = min(100, self.needs['thirst'] + dt * 3)
-            self.needs['rest'] = min(100, self.needs['rest'] + dt * 1.5)
-            
-            # Safety need based on environment and threats
-            threats = self._assess_threats()
-            self.needs['safety'] = min(100, 20 * len(threats))
-            
-            # Apply need effects
-            if self.needs['hunger'] > 80 or self.needs['thirst'] > 80:
-                self.health = max(0, self.health - dt * 5)
-                
-            if self.needs['rest'] > 90:
-                self.energy = max(0, self.energy - dt * 3)
-                
-        except Exception as e:
-            print(f"Error updating animal needs: {e}")
-            traceback.print_exc()
+    def _collect_draw(self, blit_sequence: List[tuple], screen_x: float, screen_y: float,
+                      zoom: float, effects: Dict = None):
+        """Append this animal's sprite, status indicators and bars to a Surface.blits sequence"""
+        # Apply visual effects based on status
+        color = self._get_display_color(effects)
+        
+        # Draw animal sprite/emoji with effects
+        if isinstance(self.sprite, str):  # Emoji fallback
+            text = render_emoji(self.sprite, int(TILE_SIZE * zoom), color)
+            blit_sequence.append((text, (screen_x, screen_y)))
+        else:  # Image sprite, scaled and tinted through the cache
+            tinted_sprite = _scaled_sprite(self.sprite, int(self.size * zoom), color)
+            blit_sequence.append((tinted_sprite, (screen_x, screen_y)))
+            
+        # Draw status indicators
+        self._draw_status_indicators(blit_sequence, (screen_x, screen_y), zoom)
+        
+        # Draw health bar
+        self._draw_health_bar(blit_sequence, (screen_x, screen_y), zoom)
             
     def _update_behavior(self, dt: float):
-        """Update animal behavior with enhanced decision making"""
-        try:
-            # Update timers
-            self.wander_timer += dt
-            self.behavior_cooldown = max(0, self.behavior_cooldown - dt)
-            
-            # Only change behavior if cooldown is done
-            if self.behavior_cooldown > 0:
-                return
-                
-            # Check if current behavior should change
-            current_time = self.world.time
-            if current_time - self.last_behavior_change > 5.0:  # Minimum 5 seconds between changes
-                new_state = self._decide_behavior()
-                if new_state != self.state:
-                    self.state = new_state
-                    self.last_behavior_change = current_time
-                    self.behavior_cooldown = random.uniform(2.0, 5.0)
-                    
-            # Execute current behavior
-            if self.state == 'idle':
-                if self.wander_timer >= self.wander_interval:
-                    self.wander_timer = 0
-                    self._choose_random_target()
-                    self.state = 'moving'
-                    
-            elif self.state == 'moving':
-                if self.target_pos:
-                    dx = self.target_pos[0] - self.x
-                    dy = self.target_pos[1] - self.y
-                    dist = math.sqrt(dx * dx + dy * dy)
-                    
-                    if dist < 5:  # Close enough to target
-                        self.state = 'idle'
-                        self.target_pos = None
-                    else:
-                        # Update velocity towards target
-                        speed = self._get_current_speed()
-                        self.velocity[0] = (dx / dist) * speed
-                        self.velocity[1] = (dy / dist) * speed
-                        
-            elif self.state == 'hunting':
-                self._execute_hunting_behavior()
-                
-            elif self.state == 'fleeing':
-                self._execute_fleeing_behavior()
-                
-            elif self.state == 'resting':
-                self._execute_resting_behavior(dt)
-                
-            elif self.state == 'drinking':
-                self._execute_drinking_behavior(dt)
-                
-            elif self.state == 'returning_home':
-                self._move_towards(self.home_location)
-                
-        except Exception as e:
-            print(f"Error updating animal behavior: {e}")
-            traceback.print_exc()
-            
-    def _decide_behavior(self) -> str:
-        """Decide next behavior based on current state and needs"""
-        try:
-            # Check for immediate threats
-            threats = self._assess_threats()
-            if threats and self.needs['safety'] > 50:
-                return 'fleeing'
+        """Execute the current behavior"""
+        # Execute current behavior
+        state = self.system.state[self.idx]
+        if state == IDLE:
+            if self.wander_timer >= self.wander_interval:
+                self.wander_timer = 0
+                self._choose_random_target()
+                self.state = 'moving'
                 
-            # Check if it's appropriate time of day
-            is_day = 6 < self.world.day_time < 20
-            if self.preferred_time != 'any':
-                if (self.preferred_time == 'day' and not is_day) or \
-                   (self.preferred_time == 'night' and is_day):
-                    return 'resting'
-                    
-            # Check critical needs
-            if self.needs['rest'] > 80 or self.energy < 20:
-                return 'resting'
+        elif state == MOVING:
+            target_pos = self.target_pos
+            if target_pos:
+                dx = target_pos[0] - self.x
+                dy = target_pos[1] - self.y
+                dist_sq = dx * dx + dy * dy
                 
-            if self.needs['thirst'] > 80:
-                if self.known_water_sources:
-                    return 'drinking'
-                    
-            if self.needs['hunger'] > 70:
-                if self.is_predator:
-                    nearby_prey = self._find_nearby_prey()
-                    if nearby_prey:
-                        return 'hunting'
+                if dist_sq < 25:  # Close enough to target
+                    self.state = 'idle'
+                    self.target_pos = None
                 else:
-                    if self.known_food_sources:
-                        return 'moving'
-                        
-            # Return home if far away and getting dark
-            if not is_day and self._distance_to(self.home_location) > self.vision_range * TILE_SIZE:
-                return 'returning_home'
-                
-            # Default behaviors
-            if random.random() < 0.3:
-                return 'idle'
-            return 'moving'
-            
-        except Exception as e:
-            print(f"Error deciding behavior: {e}")
-            traceback.print_exc()
-            return 'idle'
-            
-    def _update_movement(self, dt: float):
-        """Update animal position with enhanced movement"""
-        try:
-            # Get current terrain and weather effects
-            current_tile = self._get_current_tile()
-            weather_effects = WEATHER_EFFECTS.get(self.world.current_weather, {})
-            
-            # Apply movement modifiers
-            speed_modifier = 1.0
-            if current_tile:
-                # Slow down in non-preferred biomes
-                if current_tile['biome'] not in self.preferred_biomes:
-                    speed_modifier *= 0.7
-                # Apply terrain walkability
-                if not current_tile.get('walkable', True):
-                    speed_modifier *= 0.3
+                    # Update velocity towards target
+                    scale = self._get_current_speed() / math.sqrt(dist_sq)
+                    velocity = self.velocity
+                    velocity[0] = dx * scale
+                    velocity[1] = dy * scale
                     
-            # Apply weather effects
-            if 'movement_speed' in weather_effects:
-                speed_modifier *= weather_effects['movement_speed']
-                
-            # Update position with modifiers
-            self.x += self.velocity[0] * dt * speed_modifier
-            self.y += self.velocity[1] * dt * speed_modifier
-            
-            # Keep within world bounds
-            self.x = max(0, min(self.world.width, self.x))
-            self.y = max(0, min(self.world.height, self.y))
-            
-            # Energy cost based on movement
-            if self.velocity[0] != 0 or self.velocity[1] != 0:
-                energy_cost = 0.5  # Base cost
-                if self.state == 'fleeing':
-                    energy_cost *= 2
-                elif self.state == 'hunting':
-                    energy_cost *= 1.5
-                self.energy = max(0, self.energy - dt * energy_cost)
-                
-        except Exception as e:
-            print(f"Error updating animal movement: {e}")
-            traceback.print_exc()
-            
-    def _update_status_effects(self, dt: float):
-        """Update active status effects"""
-        try:
-            # Update existing effects
-            for effect_name in list(self.status_effects.keys()):
-                effect_data = self.status_effects[effect_name]
-                
-                # Update duration
-                if effect_data['duration'] > 0:
-                    effect_data['duration'] -= dt
-                    if effect_data['duration'] <= 0:
-                        self._remove_status_effect(effect_name)
-                        continue
-                        
-                # Apply effect
-                self._apply_status_effect(effect_name, effect_data)
-                
-        except Exception as e:
-            print(f"Error updating status effects: {e}")
-            traceback.print_exc()
-            
+        elif state == HUNTING:
+            self._execute_hunting_behavior()
+            
+        elif state == FLEEING:
+            self._execute_fleeing_behavior()
+            
+        elif state == RESTING:
+            self._execute_resting_behavior(dt)
+            
+        elif state == DRINKING:
+            self._execute_drinking_behavior(dt)
+            
+        elif state == RETURNING_HOME:
+            self._move_towards(self.home_location)
+        
+    def _choose_random_target(self):
+        """Pick a wander target within vision range, clamped to the world bounds"""
+        rng = self.system.rng
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        distance = rng.uniform(0.25, 1.0) * self.vision_radius
+        self.target_pos = (
+            min(max(self.x + math.cos(angle) * distance, 0.0), float(self.world.width)),
+            min(max(self.y + math.sin(angle) * distance, 0.0), float(self.world.height))
+        )
+        
+    def _get_speed_modifier(self) -> float:
+        """Get the terrain movement multiplier at the current position"""
+        # Weather is applied once for every animal in AnimalSystem._update_movement
+        current_tile = self._get_current_tile()
+        
+        # Apply movement modifiers
+        speed_modifier = 1.0
+        if current_tile:
+            # Slow down in non-preferred biomes
+            biome_id = current_tile.get('biome_id')
+            if biome_id is None:
+                biome_id = BIOME_ID.get(current_tile['biome'], _UNKNOWN_BIOME)
+            if not (self.preferred_biome_mask >> biome_id) & 1:
+                speed_modifier *= 0.7
+            # Apply terrain walkability
+            if not current_tile.get('walkable', True):
+                speed_modifier *= 0.3
+                
+        return speed_modifier
+        
     def _update_awareness(self, dt: float):
         """Update animal's awareness of surroundings"""
-        try:
-            # Clear old information
-            self.known_food_sources = [
-                source for source in self.known_food_sources
-                if self._distance_to(source) <= self.vision_range * TILE_SIZE
-            ]
-            self.known_water_sources = [
-                source for source in self.known_water_sources
-                if self._distance_to(source) <= self.vision_range * TILE_SIZE
-            ]
-            
-            # Scan for new resources
-            nearby_resources = self.world.get_resources_in_range(
-                self.x, self.y, self.vision_range * TILE_SIZE
-            )
-            for resource in nearby_resources:
-                if resource.type == 'water' and resource not in self.known_water_sources:
-                    self.known_water_sources.append((resource.x, resource.y))
-                elif resource.type == 'food' and resource not in self.known_food_sources:
-                    self.known_food_sources.append((resource.x, resource.y))
-                    
-        except Exception as e:
-            print(f"Error updating awareness: {e}")
-            traceback.print_exc()
-            
+        # Clear old information
+        x, y = self.x, self.y
+        self.known_food_xy = _sources_within(self.known_food_xy, x, y, self.vision_sq)
+        self.known_water_xy = _sources_within(self.known_water_xy, x, y, self.vision_sq)
+        
+        # Scan for new resources
+        nearby_resources = self.world.get_resources_in_range(
+            x, y, self.vision_radius
+        )
+        if not nearby_resources:
+            return
+            
+        found_food = []
+        found_water = []
+        for resource in nearby_resources:
+            if resource.type == 'water':
+                found_water.append((resource.x, resource.y))
+            elif resource.type == 'food':
+                found_food.append((resource.x, resource.y))
+        if found_food:
+            self.known_food_xy = _merge_sources(self.known_food_xy, found_food)
+        if found_water:
+            self.known_water_xy = _merge_sources(self.known_water_xy, found_water)
+        
     def _get_display_color(self, effects: Dict = None) -> Tuple[int, int, int]:
         """Get the display color based on status"""
-        try:
-            base_color = self.color
-            
-            # Apply status effect colors
-            if self.status_effects:
-                if 'injured' in self.status_effects:
-                    return (min(255, base_color[0] * 1.2),
-                           max(0, base_color[1] * 0.8),
-                           max(0, base_color[2] * 0.8))
-                    
-            # Apply environmental effects
-            if effects and 'visibility' in effects:
-                visibility = effects['visibility']
-                return tuple(int(c * visibility) for c in base_color)
-                
-            return base_color
-            
-        except Exception as e:
-            print(f"Error getting display color: {e}")
-            traceback.print_exc()
-            return (255, 255, 255)
-            
-    def _draw_status_indicators(self, surface: pygame.Surface, pos: Tuple[float, float], zoom: float):
-        """Draw status effect indicators"""
-        try:
-            y_offset = -20 * zoom
-            for effect_name in self.status_effects:
-                if effect_name in STATUS_EFFECTS:
-                    # Draw effect icon or symbol
-                    font = pygame.font.SysFont('segoe ui emoji', int(12 * zoom))
-                    text = font.render('💢' if effect_name == 'injured' else '💫',
-                                     True, (255, 255, 255))
-                    surface.blit(text, (pos[0], pos[1] + y_offset))
-                    y_offset -= 15 * zoom
-                    
-        except Exception as e:
-            print(f"Error drawing status indicators: {e}")
-            traceback.print_exc()
-            
-    def _draw_health_bar(self, surface: pygame.Surface, pos: Tuple[float, float], zoom: float):
-        """Draw health and energy bars"""
-        try:
-            bar_width = 30 * zoom
-            bar_height = 4 * zoom
-            y_offset = -10 * zoom
-            
-            # Health bar
-            health_percent = self.health / self.max_health
-            pygame.draw.rect(surface, (200, 0, 0),
-                           (pos[0], pos[1] + y_offset, bar_width, bar_height))
-            pygame.draw.rect(surface, (0, 200, 0),
-                           (pos[0], pos[1] + y_offset, bar_width * health_percent, bar_height))
-                           
-            # Energy bar
-            energy_percent = self.energy / self.max_energy
-            y_offset -= bar_height + 2
-            pygame.draw.rect(surface, (100, 100, 100),
-                           (pos[0], pos[1] + y_offset, bar_width, bar_height))
-            pygame.draw.rect(surface, (0, 100, 200),
-                           (pos[0], pos[1] + y_offset, bar_width * energy_percent, bar_height))
-                           
-        except Exception as e:
-            print(f"Error drawing health bar: {e}")
-            traceback.print_exc()
-            
-    def _determine_preferred_biomes(self) -> List[str]:
-        """Determine preferred biomes based on animal type"""
+        base_color = self.color
+        
+        # Apply status effect colors
+        if self.system.status_flags[self.idx] & INJURED:
+            return (min(255, int(base_color[0] * 1.2)),
+                   int(base_color[1] * 0.8),
+                   int(base_color[2] * 0.8))
+                
+        # Apply environmental effects
+        if effects and 'visibility' in effects:
+            visibility = effects['visibility']
+            return tuple(int(c * visibility) for c in base_color)
+            
+        return base_color
+        
+    def _draw_status_indicators(self, blit_sequence: List[tuple], pos: Tuple[float, float], zoom: float):
+        """Queue status effect indicators"""
+        y_offset = -20 * zoom
+        flags = int(self.system.status_flags[self.idx]) & _INDICATOR_MASK
+        while flags:
+            # Lowest set bit first
+            bit = flags & -flags
+            flags ^= bit
+            
+            # Draw effect icon or symbol
+            text = render_emoji('💢' if bit == INJURED else '💫',
+                                int(12 * zoom), (255, 255, 255))
+            blit_sequence.append((text, (pos[0], pos[1] + y_offset)))
+            y_offset -= 15 * zoom
+        
+    def _draw_health_bar(self, blit_sequence: List[tuple], pos: Tuple[float, float], zoom: float):
+        """Queue health and energy bars; the filled part blits a sub-area of the full bar"""
+        bar_width = 30 * zoom
+        bar_height = 4 * zoom
+        y_offset = -10 * zoom
+        width, height = int(bar_width), int(bar_height)
+        if width <= 0 or height <= 0:
+            return
+            
+        # Health bar
+        health_percent = self.health / self.max_health
+        health_pos = (pos[0], pos[1] + y_offset)
+        blit_sequence.append((_bar_surface(width, height, (200, 0, 0)), health_pos))
+        blit_sequence.append((_bar_surface(width, height, (0, 200, 0)), health_pos,
+                              (0, 0, int(bar_width * health_percent), height)))
+                              
+        # Energy bar
+        energy_percent = self.energy / self.max_energy
+        y_offset -= bar_height + 2
+        energy_pos = (pos[0], pos[1] + y_offset)
+        blit_sequence.append((_bar_surface(width, height, (100, 100, 100)), energy_pos))
+        blit_sequence.append((_bar_surface(width, height, (0, 100, 200)), energy_pos,
+                              (0, 0, int(bar_width * energy_percent), height)))
+        
+    def _determine_preferred_biomes(self) -> int:
+        """Determine preferred biomes based on animal type, as a BIOME_ID bitmask"""
         try:
             if 'wolf' in self.type or 'fox' in self.type:
-                return ['forest', 'plains']
+                return _biome_mask(('forest', 'plains'))
             elif 'bear' in self.type:
-                return ['forest', 'mountain']
+                return _biome_mask(('forest', 'mountain'))
             elif 'deer' in self.type or 'rabbit' in self.type:
-                return ['forest', 'plains']
+                return _biome_mask(('forest', 'plains'))
             elif 'fish' in self.type:
-                return ['water']
+                return _biome_mask(('water',))
             elif 'bird' in self.type:
-                return ['forest', 'plains', 'mountain']
+                return _biome_mask(('forest', 'plains', 'mountain'))
             else:
-                return ['plains']  # Default
+                return _biome_mask(('plains',))  # Default
                 
         except Exception as e:
             print(f"Error determining preferred biomes: {e}")
             traceback.print_exc()
-            return ['plains']
+            return _biome_mask(('plains',))
             
     def _get_current_speed(self) -> float:
         """Get current movement speed based on state and conditions"""
-        try:
-            base_speed = self.speed
-            
-            # State modifiers
-            if self.state == 'fleeing':
-                base_speed *= 1.5
-            elif self.state == 'hunting':
-                base_speed *= 1.3
-            elif self.state == 'resting':
-                base_speed *= 0.5
-                
-            # Energy modifier
-            if self.energy < 30:
-                base_speed *= 0.7
-                
-            # Weather modifier
-            weather_effects = WEATHER_EFFECTS.get(self.world.current_weather, {})
-            if 'movement_speed' in weather_effects:
-                base_speed *= weather_effects['movement_speed']
-                
-            return base_speed
-            
-        except Exception as e:
-            print(f"Error getting current speed: {e}")
-            traceback.print_exc()
-            return self.speed
-            
+        base_speed = self.speed
+        system = self.system
+        
+        # State modifiers
+        state = system.state[self.idx]
+        if state == FLEEING:
+            base_speed *= 1.5
+        elif state == HUNTING:
+            base_speed *= 1.3
+        elif state == RESTING:
+            base_speed *= 0.5
+            
+        # Energy modifier
+        if self.energy < 30:
+            base_speed *= 0.7
+            
+        # Weather modifier, cached by AnimalSystem for this tick
+        base_speed *= system.weather_speed
+        
+        return base_speed
+        
     def _get_current_tile(self) -> Optional[Dict]:
         """Get the tile at current position"""
-        try:
-            chunk_x = int(self.x // (TILE_SIZE * self.world.chunk_size))
-            chunk_y = int(self.y // (TILE_SIZE * self.world.chunk_size))
-            
-            if (chunk_x, chunk_y) in self.world.chunks:
-                chunk = self.world.chunks[(chunk_x, chunk_y)]
-                tile_x = int((self.x % (TILE_SIZE * self.world.chunk_size)) // TILE_SIZE)
-                tile_y = int((self.y % (TILE_SIZE * self.world.chunk_size)) // TILE_SIZE)
-                return chunk.tiles[tile_y][tile_x]
-                
-            return None
-            
-        except Exception as e:
-            print(f"Error getting current tile: {e}")
-            traceback.print_exc()
-            return None
-            
+        chunk_span = self.system.chunk_span
+        chunk_x, local_x = divmod(float(self.x), chunk_span)
+        chunk_y, local_y = divmod(float(self.y), chunk_span)
+        
+        chunk = self.world.chunks.get((int(chunk_x), int(chunk_y)))
+        if chunk is not None:
+            return chunk.tiles[int(local_y // TILE_SIZE)][int(local_x // TILE_SIZE)]
+            
+        return None
+        
     def _distance_to(self, pos: Tuple[float, float]) -> float:
         """Calculate distance to a position"""
-        try:
-            dx = pos[0] - self.x
-            dy = pos[1] - self.y
-            return math.sqrt(dx * dx + dy * dy)
-            
-        except Exception as e:
-            print(f"Error calculating distance: {e}")
-            traceback.print_exc()
-            return float('inf')
-            
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        return math.sqrt(dx * dx + dy * dy)
+        
+    def _distance_sq_to(self, pos: Tuple[float, float]) -> float:
+        """Calculate squared distance to a position, for comparisons against squared ranges"""
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        return dx * dx + dy * dy
+        
     def _move_towards(self, target_pos: Tuple[float, float]):
         """Move towards a target position"""
-        try:
-            dx = target_pos[0] - self.x
-            dy = target_pos[1] - self.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            
-            if dist > 1:
-                speed = self._get_current_speed()
-                self.velocity[0] = (dx / dist) * speed
-                self.velocity[1] = (dy / dist) * speed
-            else:
-                self.velocity = [0, 0]
-                
-        except Exception as e:
-            print(f"Error moving towards target: {e}")
-            traceback.print_exc()
-            
-    def _assess_threats(self) -> List[Dict]:
+        dx = target_pos[0] - self.x
+        dy = target_pos[1] - self.y
+        dist_sq = dx * dx + dy * dy
+        
+        if dist_sq > 1:
+            # One root and one division scale both components
+            scale = self._get_current_speed() / math.sqrt(dist_sq)
+            velocity = self.velocity
+            velocity[0] = dx * scale
+            velocity[1] = dy * scale
+        else:
+            self.velocity = [0, 0]
+        
+    def _assess_threats(self) -> List[Threat]:
         """Assess nearby threats"""
         threats = []
-        try:
-            # Check for dangerous weather
-            if self.world.current_weather in ['storm']:
-                threats.append({
-                    'type': 'weather',
-                    'danger_level': 0.7
-                })
-                
-            # Check for predators if prey
-            if self.is_prey:
-                nearby_entities = self.world.get_entities_in_range(
-                    self.x, self.y, self.vision_range * TILE_SIZE
-                )
-                for entity in nearby_entities:
-                    if isinstance(entity, Animal) and entity.is_predator:
-                        threats.append({
-                            'type': 'predator',
-                            'source': entity,
-                            'danger_level': 0.9
-                        })
-                        
-            # Check for environmental hazards
-            current_tile = self._get_current_tile()
-            if current_tile:
-                if not current_tile['walkable']:
-                    threats.append({
-                        'type': 'terrain',
-                        'danger_level': 0.5
-                    })
-                    
-        except Exception as e:
-            print(f"Error assessing threats: {e}")
-            traceback.print_exc()
-            
+        # Check for dangerous weather
+        if self.world.current_weather == 'storm':
+            threats.append(_WEATHER_THREAT)
+            
+        # Check for predators if prey
+        if self.is_prey:
+            system = self.system
+            nearby = system.indices_in_range(self.x, self.y, self.vision_radius)
+            for i in nearby[system.is_predator[nearby]]:
+                threats.append(Threat('predator', 0.9, system.animals[i]))
+                
+        # Check for environmental hazards
+        current_tile = self._get_current_tile()
+        if current_tile:
+            if not current_tile['walkable']:
+                threats.append(_TERRAIN_THREAT)
+        
         return threats
-            
+        
+    def _count_threats(self) -> int:
+        """Count nearby threats without building the threat list"""
+        count = int(self.world.current_weather == 'storm')
+        
+        if self.is_prey:
+            system = self.system
+            nearby = system.indices_in_range(self.x, self.y, self.vision_radius)
+            count += int(system.is_predator[nearby].sum())
+            
+        current_tile = self._get_current_tile()
+        if current_tile and not current_tile['walkable']:
+            count += 1
+            
+        return count
+        
     def _find_nearby_prey(self) -> Optional['Animal']:
         """Find nearby prey for predators"""
-        try:
-            if not self.is_predator:
-                return None
-                
-            nearby_entities = self.world.get_entities_in_range(
-                self.x, self.y, self.vision_range * TILE_SIZE
-            )
-            
-            prey = [
-                entity for entity in nearby_entities
-                if isinstance(entity, Animal) and entity.is_prey
-            ]
-            
-            return random.choice(prey) if prey else None
-            
-        except Exception as e:
-            print(f"Error finding nearby prey: {e}")
-            traceback.print_exc()
+        if not self.is_predator:
             return None
             
+        system = self.system
+        nearby = system.indices_in_range(self.x, self.y, self.vision_radius)
+        prey = nearby[~system.is_predator[nearby]]
+        
+        return system.animals[prey[system.rng.integers(prey.size)]] if prey.size else None
+        
+    def _has_nearby_prey(self) -> bool:
+        """Check whether any prey is within vision range"""
+        system = self.system
+        nearby = system.indices_in_range(self.x, self.y, self.vision_radius)
+        return not system.is_predator[nearby].all()
+        
     def _execute_hunting_behavior(self):
         """Execute hunting behavior for predators"""
-        try:
-            if not self.is_predator:
-                self.state = 'idle'
-                return
-                
-            target = self._find_nearby_prey()
-            if target:
-                self._move_towards((target.x, target.y))
-                
-                # Attack if close enough
-                if self._distance_to((target.x, target.y)) < self.interaction_range:
-                    self._attack(target)
-            else:
-                self.state = 'moving'
-                
-        except Exception as e:
-            print(f"Error executing hunting behavior: {e}")
-            traceback.print_exc()
-            
+        if not self.is_predator:
+            self.state = 'idle'
+            return
+            
+        target = self._find_nearby_prey()
+        if target:
+            self._move_towards((target.x, target.y))
+            
+            # Attack if close enough
+            if self._distance_sq_to((target.x, target.y)) < self.interaction_range_sq:
+                self._attack(target)
+        else:
+            self.state = 'moving'
+        
     def _execute_fleeing_behavior(self):
         """Execute fleeing behavior"""
-        try:
-            threats = self._assess_threats()
-            if not threats:
-                self.state = 'moving'
-                return
-                
-            # Find safest direction away from threats
-            dx = dy = 0
-            for threat in threats:
-                if 'source' in threat:
-                    threat_pos = (threat['source'].x, threat['source'].y)
-                    dist = self._distance_to(threat_pos)
-                    if dist > 0:
-                        dx += (self.x - threat_pos[0]) / dist
-                        dy += (self.y - threat_pos[1]) / dist
-                        
-            if dx != 0 or dy != 0:
-                # Normalize direction
-                mag = math.sqrt(dx * dx + dy * dy)
-                dx /= mag
-                dy /= mag
-                
-                # Set target position away from threats
-                flee_distance = self.vision_range * TILE_SIZE
-                self.target_pos = (
-                    self.x + dx * flee_distance,
-                    self.y + dy * flee_distance
-                )
-                
-        except Exception as e:
-            print(f"Error executing fleeing behavior: {e}")
-            traceback.print_exc()
-            
+        threats = self._assess_threats()
+        if not threats:
+            self.state = 'moving'
+            return
+            
+        # Find safest direction away from threats
+        dx = dy = 0
+        for threat in threats:
+            if threat.source is not None:
+                threat_pos = (threat.source.x, threat.source.y)
+                dist = self._distance_to(threat_pos)
+                if dist > 0:
+                    dx += (self.x - threat_pos[0]) / dist
+                    dy += (self.y - threat_pos[1]) / dist
+                    
+        if dx != 0 or dy != 0:
+            # Normalize direction
+            mag = math.sqrt(dx * dx + dy * dy)
+            dx /= mag
+            dy /= mag
+            
+            # Set target position away from threats
+            flee_distance = self.vision_radius
+            self.target_pos = (
+                self.x + dx * flee_distance,
+                self.y + dy * flee_distance
+            )
+        
     def _execute_resting_behavior(self, dt: float):
         """Execute resting behavior"""
-        try:
-            # Regenerate energy while resting
-            self.energy = min(self.max_energy,
-                            self.energy + dt * 5)
-            self.needs['rest'] = max(0,
-                                   self.needs['rest'] - dt * 10)
-                                   
-            # Stop resting if energy is full or there are threats
-            if (self.energy >= self.max_energy or
-                self.needs['rest'] <= 20 or
-                self._assess_threats()):
-                self.state = 'idle'
-                
-        except Exception as e:
-            print(f"Error executing resting behavior: {e}")
-            traceback.print_exc()
-            
+        # Regenerate energy while resting
+        self.energy = min(self.max_energy,
+                        self.energy + dt * 5)
+        self.needs[REST] = max(0,
+                               self.needs[REST] - dt * 10)
+                               
+        # Stop resting if energy is full or there are threats
+        if (self.energy >= self.max_energy or
+            self.needs[REST] <= 20 or
+            self._count_threats()):
+            self.state = 'idle'
+        
     def _execute_drinking_behavior(self, dt: float):
         """Execute drinking behavior"""
+        water = self.known_water_xy
+        if not len(water):
+            self.state = 'moving'
+            return
+            
+        # Move to nearest water source
+        dx = water[:, 0] - self.x
+        dy = water[:, 1] - self.y
+        dist_sq = dx * dx + dy * dy
+        nearest = int(np.argmin(dist_sq))
+        self._move_towards(water[nearest])
+        
+        # Drink if close enough
+        if dist_sq[nearest] < self.interaction_range_sq:
+            self.needs[THIRST] = max(0,
+                                     self.needs[THIRST] - dt * 20)
+                                     
+            # Stop drinking if thirst is satisfied
+            if self.needs[THIRST] <= 20:
+                self.state = 'idle'
+        
+    def _attack(self, target: 'Animal'):
+        """Attack another animal"""
+        # Damage based on predator type
+        base_damage = _DAMAGE_BY_CLASS[self.system.damage_class[self.idx]]
+        
+        # Apply damage
+        target.health = max(0, target.health - base_damage)
+        
+        # Add injured status effect to target
+        self.system.add_status_effect(target.idx, INJURED, 10.0)
+        
+        # Energy cost for attacking
+        self.energy = max(0, self.energy - 10)
+        
+    def cleanup(self):
+        """Clean up animal resources"""
         try:
-            if not self.known_water_sources:
-                self.state = 'moving'
-                return
-                
-            # Move to nearest water source
-            nearest_water = min(self.known_water_sources,
-                              key=lambda pos: self._distance_to(pos))
-            self._move_towards(nearest_water)
-            
-            # Drink if close enough
-            if self._distance_to(nearest_water) < self.interaction_range:
-                self.needs['thirst'] = max(0,
-                                         self.needs['thirst'] - dt * 20)
-                                         
-                # Stop drinking if thirst is satisfied
-                if self.needs['thirst'] <= 20:
-                    self.state = 'idle'
-                    
+            # Release this animal's row in the shared columns
+            self.system.remove(self)
+            
+            # Clear references
+            self.world = None
+            self.target_pos = None
+            self.known_food_xy = _NO_SOURCES
+            self.known_water_xy = _NO_SOURCES
+            self.known_threats.clear()
+            
         except Exception as e:
-            print(f"Error executing drinking behavior: {e}")
+            print(f"Error cleaning up animal: {e}")
             traceback.print_exc()
-            
-    def _attack(self, target: 'Animal'):
-        """Attack another animal"""
+
+
+class AnimalSystem:
+    """Structure-of-arrays storage for every Animal in a world, with batched needs and movement"""
+    
+    def __init__(self, world, capacity: int = 64, seed: Optional[int] = None):
+        """Allocate empty columns for up to capacity animals; they grow on demand"""
+        self.world = world
+        self.rng = np.random.default_rng(seed)
+        self.animals: List[Animal] = []
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.health = np.zeros(capacity)
+        self.max_health = np.zeros(capacity)
+        self.energy = np.zeros(capacity)
+        self.max_energy = np.zeros(capacity)
+        self.speed_modifier = np.ones(capacity)
+        self.needs = np.zeros((capacity, len(_NEED_RATES)), dtype=np.float32)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.behavior_cooldown = np.zeros(capacity)
+        self.last_behavior_change = np.zeros(capacity)
+        self.home = np.zeros((capacity, 2))
+        self.vision_radius = np.zeros(capacity)
+        self.is_predator = np.zeros(capacity, dtype=np.bool_)
+        self.preferred_time = np.zeros(capacity, dtype=np.int8)
+        self.damage_class = np.zeros(capacity, dtype=np.int8)
+        self.status_flags = np.zeros(capacity, dtype=np.uint32)
+        self.status_duration = np.zeros((capacity, len(ANIMAL_EFFECTS)))
+        
+        # World-space width of one chunk, for tile lookups
+        self.chunk_span = TILE_SIZE * world.chunk_size
+        
+        # Weather movement multiplier, shared by every animal and refreshed each tick
+        self.weather_speed = 1.0
+        
+        # Spatial hash over positions, rebuilt once per tick: row indices
+        # sorted by cell key, with the sorted keys for searchsorted
+        self._cell_size = float(TILE_SIZE)
+        self._grid_order = np.zeros(0, dtype=np.intp)
+        self._grid_keys = np.zeros(0, dtype=np.int64)
+        
+    @property
+    def count(self) -> int:
+        return len(self.animals)
+        
+    def _columns(self) -> Tuple[str, ...]:
+        return ('pos', 'vel', 'health', 'max_health', 'energy', 'max_energy',
+                'speed_modifier', 'needs', 'state', 'behavior_cooldown',
+                'last_behavior_change', 'home', 'vision_radius', 'is_predator',
+                'preferred_time', 'damage_class', 'status_flags', 'status_duration')
+        
+    def _grow(self):
+        """Double the capacity of every column, keeping the live rows"""
+        for name in self._columns():
+            column = getattr(self, name)
+            grown = np.zeros((column.shape[0] * 2,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+        
+    def add(self, animal: Animal, pos: Tuple[float, float], max_health: float,
+            max_energy: float) -> int:
+        """Claim a row for a new animal and return its index"""
+        idx = self.count
+        if idx == self.pos.shape[0]:
+            self._grow()
+        self.pos[idx] = self.home[idx] = pos
+        self.vel[idx] = 0
+        self.health[idx] = self.max_health[idx] = max_health
+        self.energy[idx] = self.max_energy[idx] = max_energy
+        self.speed_modifier[idx] = 1.0
+        self.needs[idx] = 0
+        self.state[idx] = IDLE
+        self.behavior_cooldown[idx] = self.last_behavior_change[idx] = 0
+        self.status_flags[idx] = 0
+        self.status_duration[idx] = 0
+        self.animals.append(animal)
+        return idx
+        
+    def remove(self, animal: Animal):
+        """Free an animal's row by moving the last row into it"""
+        idx = animal.idx
+        last = self.count - 1
+        if idx != last:
+            for name in self._columns():
+                column = getattr(self, name)
+                column[idx] = column[last]
+            moved = self.animals[last]
+            moved.idx = idx
+            self.animals[idx] = moved
+        self.animals.pop()
+        
+    def update(self, dt: float):
+        """Advance every animal by one tick"""
         try:
-            # Calculate damage based on predator type
-            base_damage = 20
-            if 'wolf' in self.type:
-                base_damage = 25
-            elif 'bear' in self.type:
-                base_damage = 30
+            n = self.count
+            if not n:
+                return
                 
-            # Apply damage
-            target.health = max(0, target.health - base_damage)
+            weather = WEATHER_TYPES.get(self.world.current_weather)
+            self.weather_speed = weather.movement_speed if weather is not None else 1.0
             
-            # Add injured status effect to target
-            target.status_effects['injured'] = {
-                'duration': 10.0,
-                'start_time': self.world.time
-            }
+            self._update_needs(n, dt)
+            self._update_status_effects(n, dt)
+            self._rebuild_grid(n)
             
-            # Energy cost for attacking
-            self.energy = max(0, self.energy - 10)
+            for animal in self.animals:
+                animal._prepare_tick(dt)
+                
+            ready = self._update_behaviors(n, dt)
+            
+            for animal, act in zip(self.animals, ready):
+                animal._finish_tick(dt, act)
+                
+            self._update_movement(n, dt)
             
         except Exception as e:
-            print(f"Error attacking target: {e}")
+            print(f"Error updating animals: {e}")
             traceback.print_exc()
             
-    def cleanup(self):
-        """Clean up animal resources"""
+    def draw(self, surface: pygame.Surface, camera_pos: Tuple[float, float], zoom: float,
+             effects: Dict = None):
+        """Draw every animal with a single Surface.blits call"""
         try:
-            print(f"Cleaning up animal {self.type}")
-            # Clear references
-            self.world = None
-            self.target_pos = None
-            self.velocity = [0, 0]
-            self.known_food_sources.clear()
-            self.known_water_sources.clear()
-            self.known_threats.clear()
-            self.status_effects.clear()
+            n = self.count
+            if not n:
+                return
+                
+            screen = ((self.pos[:n] - camera_pos) * zoom).tolist()
+            blit_sequence = []
+            for animal, (screen_x, screen_y) in zip(self.animals, screen):
+                animal._collect_draw(blit_sequence, screen_x, screen_y, zoom, effects)
+            surface.blits(blit_sequence, doreturn=False)
             
         except Exception as e:
-            print(f"Error cleaning up animal: {e}")
-            traceback.print_exc()
\ No newline at end of file
+            print(f"Error drawing animals: {e}")
+            traceback.print_exc()
+            
+    def _rebuild_grid(self, n: int):
+        """Bucket every animal by cell; positions only change in the batched movement step"""
+        self._cell_size = max(float(self.vision_radius[:n].max()), float(TILE_SIZE))
+        cells = np.floor_divide(self.pos[:n], self._cell_size).astype(np.int64)
+        keys = cells[:, 0] * _GRID_STRIDE + cells[:, 1]
+        self._grid_order = np.argsort(keys, kind='stable')
+        self._grid_keys = keys[self._grid_order]
+        
+    def indices_in_range(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Get the row indices of animals within radius of a point"""
+        cell_x = int(x // self._cell_size)
+        cell_y = int(y // self._cell_size)
+        reach = int(radius // self._cell_size) + 1
+        
+        # Each cell column is one contiguous key range in the sorted keys
+        first = np.arange(cell_x - reach, cell_x + reach + 1, dtype=np.int64) * _GRID_STRIDE
+        starts = np.searchsorted(self._grid_keys, first + (cell_y - reach), side='left')
+        stops = np.searchsorted(self._grid_keys, first + (cell_y + reach), side='right')
+        candidates = np.concatenate([self._grid_order[start:stop]
+                                     for start, stop in zip(starts, stops)])
+        
+        offset = self.pos[candidates] - (x, y)
+        return candidates[(offset * offset).sum(axis=1) <= radius * radius]
+        
+    def add_status_effect(self, idx: int, effect: int, duration: float):
+        """Set an effect bit on row idx; a duration <= 0 never expires"""
+        self.status_flags[idx] |= effect
+        self.status_duration[idx, effect.bit_length() - 1] = duration
+        
+    def _update_status_effects(self, n: int, dt: float):
+        """Count down timed effects and clear the bits of those that ran out"""
+        flags = self.status_flags[:n]
+        duration = self.status_duration[:n]
+        timed = ((flags[:, None] & _EFFECT_BITS) != 0) & (duration > 0)
+        duration[timed] -= dt
+        expired = timed & (duration <= 0)
+        flags &= ~(expired * _EFFECT_BITS).sum(axis=1, dtype=np.uint32)
+        
+    def _update_needs(self, n: int, dt: float):
+        """Grow hunger, thirst and rest and apply their health and energy penalties"""
+        needs = self.needs[:n]
+        needs += _NEED_RATES * np.float32(dt)
+        np.minimum(needs, 100, out=needs)
+        
+        starving = (needs[:, HUNGER] > 80) | (needs[:, THIRST] > 80)
+        health = self.health[:n]
+        health[starving] -= dt * 5
+        np.maximum(health, 0, out=health)
+        
+        exhausted = needs[:, REST] > 90
+        energy = self.energy[:n]
+        energy[exhausted] -= dt * 3
+        np.maximum(energy, 0, out=energy)
+        
+    def _update_behaviors(self, n: int, dt: float) -> np.ndarray:
+        """Pick new behaviors for every animal that is due and return the mask of animals off cooldown"""
+        cooldown = self.behavior_cooldown[:n]
+        cooldown -= dt
+        np.maximum(cooldown, 0, out=cooldown)
+        ready = cooldown <= 0
+        
+        # Minimum 5 seconds between changes
+        now = self.world.time
+        due = np.flatnonzero(ready & (now - self.last_behavior_change[:n] > 5.0))
+        if not due.size:
+            return ready
+            
+        is_day = 6 < self.world.day_time < 20
+        animals = [self.animals[i] for i in due]
+        needs = self.needs[due]
+        is_predator = self.is_predator[due]
+        
+        # World queries only for the animals whose decision can depend on them
+        hunting = (needs[:, HUNGER] > 70) & is_predator
+        has_prey = np.array([hunt and animal._has_nearby_prey()
+                             for animal, hunt in zip(animals, hunting)], dtype=np.bool_)
+        has_water = np.array([len(animal.known_water_xy) > 0 for animal in animals], dtype=np.bool_)
+        has_food = np.array([len(animal.known_food_xy) > 0 for animal in animals], dtype=np.bool_)
+        
+        # Return home if far away and getting dark
+        offset = self.pos[due] - self.home[due]
+        far_from_home = (not is_day) & ((offset * offset).sum(axis=1) > self.vision_radius[due] ** 2)
+        
+        new_state = np.empty(due.size, dtype=np.int8)
+        _decide_behaviors(needs[:, SAFETY], self.preferred_time[due], is_day, needs[:, REST],
+                          self.energy[due], needs[:, THIRST], has_water, needs[:, HUNGER],
+                          is_predator, has_prey, has_food, far_from_home,
+                          self.rng.random(due.size), new_state)
+                          
+        changed = new_state != self.state[due]
+        changed_idx = due[changed]
+        self.state[changed_idx] = new_state[changed]
+        self.last_behavior_change[changed_idx] = now
+        self.behavior_cooldown[changed_idx] = self.rng.uniform(2.0, 5.0, changed_idx.size)
+        return ready
+        
+    def _update_movement(self, n: int, dt: float):
+        """Integrate positions, clamp them to the world and charge movement energy"""
+        step = dt * self.weather_speed * self.speed_modifier[:n]
+        _integrate_movement(self.pos[:n], self.vel[:n], step,
+                            float(self.world.width), float(self.world.height),
+                            self.energy[:n], self.state[:n], dt)
@@ -1,26 +1,138 @@
+import pygame
+import traceback
+import numpy as np
+from collections import UserDict
+from functools import lru_cache
+from typing import Final, List, Optional, Tuple
+from ..constants import WINDOW_WIDTH, WINDOW_HEIGHT, THOUGHT_INTERVAL, load_font
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional (the "fast" extra)
+    njit = prange = None
+
+# Draw debug_info under each entity
+DEBUG: Final[bool] = False
+
+@lru_cache(maxsize=64)
+def _solid_surface(size: Tuple[int, int], color: Tuple[int, ...]) -> pygame.Surface:
+    """Solid rectangle of one color; partial bars blit a sub-area of it"""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+@lru_cache(maxsize=512)
+def _scaled_surface(surface: pygame.Surface, size: Tuple[int, int], alpha: int) -> pygame.Surface:
+    """Scale a sprite once per (surface, size, alpha); callers must not draw on the result"""
+    scaled = pygame.transform.scale(surface, size)
+    if alpha < 255:
+        scaled.set_alpha(alpha)
+    return scaled
+
+def _step_entities_numpy(x, y, velocity_x, velocity_y, speed, active, thought_wait, dt):
+    step = speed * dt
+    step *= active
+    x += velocity_x * step
+    y += velocity_y * step
+    thought_wait -= dt
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _step_entities(x, y, velocity_x, velocity_y, speed, active, thought_wait, dt):
+        for i in prange(x.shape[0]):
+            if active[i]:
+                step = speed[i] * dt
+                x[i] += velocity_x[i] * step
+                y[i] += velocity_y[i] * step
+            thought_wait[i] -= dt
+else:
+    _step_entities = _step_entities_numpy
+
+def _update_effects(effects: list, dt: float):
+    """Update effects and compact the ones still running to the front of the same list"""
+    live = 0
+    for effect in effects:
+        if effect.update(dt):
+            effects[live] = effect
+            live += 1
+    del effects[live:]
+
+def _process_thoughts(thought_system, contexts: List[dict]) -> list:
+    """Thoughts for contexts from one process_batch call, or per-context process calls without it"""
+    process_batch = getattr(thought_system, 'process_batch', None)
+    if process_batch is not None:
+        return process_batch(contexts)
+    return [thought_system.process(context) for context in contexts]
+
+class _Systems(UserDict):
+    """Entity systems by name, with the bound update methods kept in step on every change"""
+    
+    def __init__(self, *args, **kwargs):
+        self.updaters = ()
+        super().__init__(*args, **kwargs)
+        
+    def __setitem__(self, name, system):
+        super().__setitem__(name, system)
+        self._refresh()
+        
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._refresh()
+        
+    def _refresh(self):
+        self.updaters = tuple(system.update for system in self.data.values() if hasattr(system, 'update'))
+
+class _PoolColumn:
+    """Entity attribute stored in its row of the EntityPool column of the same name"""
+    
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        return getattr(entity.pool, self.name)[entity.idx]
+        
+    def __set__(self, entity, value):
+        getattr(entity.pool, self.name)[entity.idx] = value
+
 class Entity:
     """Base class for all entities in the game world"""
     
-    def __init__(self, x: float, y: float, width: int = 32, height: int = 32):
-        # Position and dimensions
-        self.x = x
-        self.y = y
-        self.last_x = x  # Track last position for chunk updates
-        self.last_y = y
-        self.width = width
-        self.height = height
-        
-        # Movement
-        self.velocity_x = 0
-        self.velocity_y = 0
-        self.speed = 2.0
+    # Position, dimensions, movement and core stats live in the pool columns;
+    # last_x/last_y track the last position for chunk updates; thought_wait is
+    # the time left until the thought system is polled again
+    x = _PoolColumn()
+    y = _PoolColumn()
+    last_x = _PoolColumn()
+    last_y = _PoolColumn()
+    width = _PoolColumn()
+    height = _PoolColumn()
+    velocity_x = _PoolColumn()
+    velocity_y = _PoolColumn()
+    speed = _PoolColumn()
+    active = _PoolColumn()
+    health = _PoolColumn()
+    max_health = _PoolColumn()
+    thought_wait = _PoolColumn()
+    
+    @property
+    def systems(self) -> _Systems:
+        return self._systems
+        
+    @systems.setter
+    def systems(self, value):
+        self._systems = value if isinstance(value, _Systems) else _Systems(value)
+        
+    def __init__(self, x: float, y: float, width: int = 32, height: int = 32,
+                 pool: Optional['EntityPool'] = None):
+        # Claim a row in the pool; an entity built without one gets a private pool
+        self.pool = pool if pool is not None else EntityPool(capacity=1)
+        self.idx = self.pool.add(self, x, y, width, height)
         
         # State
-        self.active = True
         self.selected = False
         self.visible = True
-        self.health = 100
-        self.max_health = 100
         
         # Visual properties
         self.color = (255, 255, 255)  # Default white
@@ -31,157 +143,192 @@ class Entity:
         self.status_effects = []  # Status effects (buffs/debuffs)
         
         # Systems
-        self.systems = {}
+        self.systems = _Systems()
         self.thought_system = None
         self.current_thought = None
         self.thought_timer = 0
         self.thought_duration = 3.0  # How long thoughts are displayed
+        self.thought_interval = THOUGHT_INTERVAL  # Seconds between thought system polls
+        self._thought_cache = (None, 0, None)  # (thought, font size, rendered text)
         
         # Debug
         self.debug_info = {}
         
     def update(self, world, dt: float):
-        """Update entity state"""
+        """Update entity state; EntityPool.update does this for a whole pool with batched thoughts"""
         try:
             # Update position based on velocity
-            self.x += self.velocity_x * self.speed * dt
-            self.y += self.velocity_y * self.speed * dt
+            if self.active:
+                step = self.speed * dt
+                self.x += self.velocity_x * step
+                self.y += self.velocity_y * step
+                
+            self._update_systems(world, dt)
             
-            # Update systems
-            for system in self.systems.values():
-                if hasattr(system, 'update'):
-                    system.update(world, dt)
-                    
-            # Update thought system
-            if self.thought_system:
+            # Update thought system once its poll interval has passed
+            self.thought_wait -= dt
+            if self.thought_system and self.thought_wait <= 0:
+                self.thought_wait = self.thought_interval
                 context = world._generate_entity_context(self)
-                thought = self.thought_system.process(context)
-                if thought:
-                    self.current_thought = thought
-                    self.thought_timer = self.thought_duration
-                    world._process_entity_action(self, thought)
-                    
-            # Update thought timer
-            if self.thought_timer > 0:
-                self.thought_timer -= dt
-                if self.thought_timer <= 0:
-                    self.current_thought = None
-                    
-            # Update effects
-            self.effects = [effect for effect in self.effects if effect.update(dt)]
-            self.status_effects = [effect for effect in self.status_effects if effect.update(dt)]
+                self._receive_thought(world, self.thought_system.process(context))
+                
+            self._update_timers(dt)
             
         except Exception as e:
             print(f"Error updating entity {self}: {e}")
             traceback.print_exc()
             
+    def _update_systems(self, world, dt: float):
+        """Update attached systems"""
+        for update in self.systems.updaters:
+            update(world, dt)
+                
+    def _receive_thought(self, world, thought):
+        """Show a thought from the thought system and let the world act on it"""
+        if thought:
+            self.current_thought = thought
+            self.thought_timer = self.thought_duration
+            world._process_entity_action(self, thought)
+            
+    def _update_timers(self, dt: float):
+        """Count down the thought timer and drop finished effects"""
+        # Update thought timer
+        if self.thought_timer > 0:
+            self.thought_timer -= dt
+            if self.thought_timer <= 0:
+                self.current_thought = None
+                
+        # Update effects
+        _update_effects(self.effects, dt)
+        _update_effects(self.status_effects, dt)
+            
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, zoom: float = 1.0):
         """Draw entity on screen"""
         try:
-            if not self.visible:
-                return
+            blit_sequence = []
+            screen_pos = self.collect_draw(blit_sequence, camera_x, camera_y, zoom)
+            if screen_pos is not None:
+                screen.blits(blit_sequence, doreturn=False)
+                self._draw_overlays(screen, screen_pos[0], screen_pos[1], zoom)
                 
-            # Calculate screen position
-            screen_x = int((self.x - camera_x) * zoom + WINDOW_WIDTH / 2)
-            screen_y = int((self.y - camera_y) * zoom + WINDOW_HEIGHT / 2)
+        except Exception as e:
+            print(f"Error drawing entity {self}: {e}")
+            traceback.print_exc()
             
-            # Skip if off screen (with padding)
-            padding = 100
-            if (screen_x + self.width * zoom < -padding or 
-                screen_x > WINDOW_WIDTH + padding or
-                screen_y + self.height * zoom < -padding or
-                screen_y > WINDOW_HEIGHT + padding):
-                return
+    def collect_draw(self, blit_sequence: List[tuple], camera_x: float, camera_y: float,
+                     zoom: float) -> Optional[Tuple[int, int]]:
+        """Append the sprite and health bar to a Surface.blits sequence; return the screen position, or None if culled"""
+        if not self.visible:
+            return None
+            
+        # Calculate screen position
+        screen_x = int((self.x - camera_x) * zoom + WINDOW_WIDTH / 2)
+        screen_y = int((self.y - camera_y) * zoom + WINDOW_HEIGHT / 2)
+        
+        # Skip if off screen (with padding)
+        padding = 100
+        if (screen_x + self.width * zoom < -padding or 
+            screen_x > WINDOW_WIDTH + padding or
+            screen_y + self.height * zoom < -padding or
+            screen_y > WINDOW_HEIGHT + padding):
+            return None
+            
+        self._collect_at(blit_sequence, screen_x, screen_y, zoom)
+        return screen_x, screen_y
+        
+    def _collect_at(self, blit_sequence: List[tuple], screen_x: int, screen_y: int, zoom: float):
+        """Append the sprite and health bar for an entity already known to be on screen"""
+        # Draw entity surface or rectangle
+        if self.surface:
+            # Scale surface
+            scaled_width = int(self.width * zoom * self.scale)
+            scaled_height = int(self.height * zoom * self.scale)
+            if scaled_width > 0 and scaled_height > 0:
+                # Scaled with alpha applied, shared by entities using the same sprite
+                scaled_surface = _scaled_surface(self.surface, (scaled_width, scaled_height), self.alpha)
                 
-            # Draw entity surface or rectangle
-            if self.surface:
-                # Scale surface
-                scaled_width = int(self.width * zoom * self.scale)
-                scaled_height = int(self.height * zoom * self.scale)
-                if scaled_width > 0 and scaled_height > 0:
-                    scaled_surface = pygame.transform.scale(self.surface, (scaled_width, scaled_height))
-                    
-                    # Apply alpha
-                    if self.alpha < 255:
-                        scaled_surface.set_alpha(self.alpha)
-                        
-                    # Draw centered
-                    screen.blit(scaled_surface, 
-                              (screen_x - scaled_width // 2,
-                               screen_y - scaled_height // 2))
-            else:
-                # Draw colored rectangle
-                pygame.draw.rect(screen, self.color,
-                               (screen_x - self.width * zoom * self.scale // 2,
-                                screen_y - self.height * zoom * self.scale // 2,
-                                self.width * zoom * self.scale,
-                                self.height * zoom * self.scale))
-                                
-            # Draw health bar if damaged
-            if self.health < self.max_health:
-                bar_width = 40 * zoom
-                bar_height = 5 * zoom
-                bar_x = screen_x - bar_width / 2
-                bar_y = screen_y - self.height * zoom * self.scale / 2 - bar_height - 5
+                # Draw centered
+                blit_sequence.append((scaled_surface,
+                                      (screen_x - scaled_width // 2,
+                                       screen_y - scaled_height // 2)))
+        else:
+            # Draw colored rectangle
+            rect = pygame.Rect(screen_x - self.width * zoom * self.scale // 2,
+                               screen_y - self.height * zoom * self.scale // 2,
+                               self.width * zoom * self.scale,
+                               self.height * zoom * self.scale)
+            if rect.width > 0 and rect.height > 0:
+                blit_sequence.append((_solid_surface(rect.size, tuple(self.color)), rect))
+                
+        # Draw health bar if damaged
+        if self.health < self.max_health:
+            bar_width = 40 * zoom
+            bar_height = 5 * zoom
+            bar_x = screen_x - bar_width / 2
+            bar_y = screen_y - self.height * zoom * self.scale / 2 - bar_height - 5
+            
+            # Background
+            bar = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+            if bar.width > 0 and bar.height > 0:
+                blit_sequence.append((_solid_surface(bar.size, (255, 0, 0)), bar))
                 
-                # Background
-                pygame.draw.rect(screen, (255, 0, 0),
-                               (bar_x, bar_y, bar_width, bar_height))
-                               
-                # Health
+                # Health, as a sub-area of a full-width bar
                 health_width = (self.health / self.max_health) * bar_width
                 if health_width > 0:
-                    pygame.draw.rect(screen, (0, 255, 0),
-                                   (bar_x, bar_y, health_width, bar_height))
-                                   
-            # Draw status effects
-            effect_y = screen_y - self.height * zoom * self.scale / 2 - 25
-            for effect in self.status_effects:
-                effect.draw(screen, screen_x, effect_y, zoom)
-                effect_y -= 20 * zoom
-                
-            # Draw thought bubble if thinking
-            if self.current_thought:
-                font = pygame.font.Font(None, int(24 * zoom))
-                text = font.render(self.current_thought, True, (0, 0, 0))
-                bubble_width = text.get_width() + 20
-                bubble_height = text.get_height() + 10
-                bubble_x = screen_x - bubble_width / 2
-                bubble_y = screen_y - self.height * zoom * self.scale / 2 - bubble_height - 30
-                
-                # Draw bubble
-                pygame.draw.ellipse(screen, (255, 255, 255),
-                                  (bubble_x, bubble_y, bubble_width, bubble_height))
-                pygame.draw.ellipse(screen, (0, 0, 0),
-                                  (bubble_x, bubble_y, bubble_width, bubble_height), 2)
-                                  
-                # Draw text
-                screen.blit(text, (bubble_x + 10, bubble_y + 5))
-                
-            # Draw selection highlight
-            if self.selected:
-                pygame.draw.circle(screen, (255, 255, 0),
-                                 (screen_x, screen_y),
-                                 self.width * zoom * self.scale / 2 + 5,
-                                 3)
-                                 
-            # Draw effects
-            for effect in self.effects:
-                effect.draw(screen, screen_x, screen_y, zoom)
-                
-            # Draw debug info
-            if DEBUG:
-                debug_y = screen_y + self.height * zoom * self.scale / 2 + 5
-                font = pygame.font.Font(None, int(20 * zoom))
-                for key, value in self.debug_info.items():
-                    text = font.render(f"{key}: {value}", True, (255, 255, 255))
-                    screen.blit(text, (screen_x - text.get_width() / 2, debug_y))
-                    debug_y += 20 * zoom
-                    
-        except Exception as e:
-            print(f"Error drawing entity {self}: {e}")
-            traceback.print_exc()
+                    health = pygame.Rect(bar_x, bar_y, health_width, bar_height)
+                    blit_sequence.append((_solid_surface(bar.size, (0, 255, 0)), health,
+                                          (0, 0, health.width, health.height)))
+        
+    def _draw_overlays(self, screen: pygame.Surface, screen_x: int, screen_y: int, zoom: float):
+        """Draw status effects, thought bubble, selection, effects and debug info over the sprites"""
+        # Draw status effects
+        effect_y = screen_y - self.height * zoom * self.scale / 2 - 25
+        for effect in self.status_effects:
+            effect.draw(screen, screen_x, effect_y, zoom)
+            effect_y -= 20 * zoom
+            
+        # Draw thought bubble if thinking
+        if self.current_thought:
+            # Re-render only when the thought or the font size changes
+            size = int(24 * zoom)
+            if self._thought_cache[:2] != (self.current_thought, size):
+                self._thought_cache = (self.current_thought, size,
+                                       load_font(size).render(self.current_thought, True, (0, 0, 0)))
+            text = self._thought_cache[2]
+            bubble_width = text.get_width() + 20
+            bubble_height = text.get_height() + 10
+            bubble_x = screen_x - bubble_width / 2
+            bubble_y = screen_y - self.height * zoom * self.scale / 2 - bubble_height - 30
             
+            # Draw bubble
+            pygame.draw.ellipse(screen, (255, 255, 255),
+                              (bubble_x, bubble_y, bubble_width, bubble_height))
+            pygame.draw.ellipse(screen, (0, 0, 0),
+                              (bubble_x, bubble_y, bubble_width, bubble_height), 2)
+                              
+            # Draw text
+            screen.blit(text, (bubble_x + 10, bubble_y + 5))
+            
+        # Draw selection highlight
+        if self.selected:
+            pygame.draw.circle(screen, (255, 255, 0),
+                             (screen_x, screen_y),
+                             self.width * zoom * self.scale / 2 + 5,
+                             3)
+                             
+        # Draw effects
+        for effect in self.effects:
+            effect.draw(screen, screen_x, screen_y, zoom)
+            
+        # Draw debug info
+        if DEBUG:
+            debug_y = screen_y + self.height * zoom * self.scale / 2 + 5
+            font = load_font(int(20 * zoom))
+            for key, value in self.debug_info.items():
+                text = font.render(f"{key}: {value}", True, (255, 255, 255))
+                screen.blit(text, (screen_x - text.get_width() / 2, debug_y))
+                debug_y += 20 * zoom
+                
     def add_effect(self, effect):
         """Add a visual effect to the entity"""
         self.effects.append(effect)
@@ -193,4 +340,146 @@ class Entity:
     def set_thought(self, thought: str):
         """Set the current thought and reset timer"""
         self.current_thought = thought
-        self.thought_timer = self.thought_duration 
\ No newline at end of file
+        self.thought_timer = self.thought_duration 
+        
+    def cleanup(self):
+        """Release this entity's row in its pool"""
+        self.pool.remove(self)
+
+
+class EntityPool:
+    """Structure-of-arrays storage for Entity positions, movement and health"""
+    
+    def __init__(self, capacity: int = 256):
+        """Allocate empty columns for up to capacity entities; they grow on demand"""
+        self.entities: List[Entity] = []
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.last_x = np.zeros(capacity)
+        self.last_y = np.zeros(capacity)
+        self.width = np.zeros(capacity)
+        self.height = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self.health = np.zeros(capacity)
+        self.max_health = np.zeros(capacity)
+        self.thought_wait = np.zeros(capacity)
+        
+    @property
+    def count(self) -> int:
+        return len(self.entities)
+        
+    def _columns(self):
+        return ('x', 'y', 'last_x', 'last_y', 'width', 'height', 'velocity_x',
+                'velocity_y', 'speed', 'active', 'health', 'max_health', 'thought_wait')
+        
+    def _grow(self):
+        """Double the capacity of every column, keeping the live rows"""
+        for name in self._columns():
+            column = getattr(self, name)
+            grown = np.zeros(column.shape[0] * 2, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+            
+    def add(self, entity: Entity, x: float, y: float, width: float, height: float) -> int:
+        """Claim a row with the Entity defaults and return its index"""
+        idx = self.count
+        if idx == self.x.shape[0]:
+            self._grow()
+        self.x[idx] = self.last_x[idx] = x
+        self.y[idx] = self.last_y[idx] = y
+        self.width[idx] = width
+        self.height[idx] = height
+        self.velocity_x[idx] = self.velocity_y[idx] = 0
+        self.speed[idx] = 2.0
+        self.active[idx] = True
+        self.health[idx] = self.max_health[idx] = 100
+        self.thought_wait[idx] = 0
+        self.entities.append(entity)
+        return idx
+        
+    def remove(self, entity: Entity):
+        """Free an entity's row by moving the last row into it"""
+        idx = entity.idx
+        last = self.count - 1
+        if idx != last:
+            for name in self._columns():
+                column = getattr(self, name)
+                column[idx] = column[last]
+            moved = self.entities[last]
+            moved.idx = idx
+            self.entities[idx] = moved
+        self.entities.pop()
+        
+    def step(self, dt: float):
+        """Move every active entity by velocity * speed * dt and count down thought polls"""
+        n = self.count
+        _step_entities(self.x[:n], self.y[:n], self.velocity_x[:n], self.velocity_y[:n],
+                       self.speed[:n], self.active[:n], self.thought_wait[:n], float(dt))
+        
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, zoom: float = 1.0):
+        """Draw every entity's sprite and health bar with one Surface.blits call, then the overlays"""
+        try:
+            # Cull off-screen entities for the whole pool at once, with the
+            # same screen position and padding test as Entity.collect_draw
+            n = self.count
+            screen_x = np.trunc((self.x[:n] - camera_x) * zoom + WINDOW_WIDTH / 2)
+            screen_y = np.trunc((self.y[:n] - camera_y) * zoom + WINDOW_HEIGHT / 2)
+            padding = 100
+            on_screen = ((screen_x + self.width[:n] * zoom >= -padding) &
+                         (screen_x <= WINDOW_WIDTH + padding) &
+                         (screen_y + self.height[:n] * zoom >= -padding) &
+                         (screen_y <= WINDOW_HEIGHT + padding))
+                         
+            blit_sequence = []
+            drawn = []
+            entities = self.entities
+            for i in np.flatnonzero(on_screen).tolist():
+                entity = entities[i]
+                if entity.visible:
+                    screen_pos = (int(screen_x[i]), int(screen_y[i]))
+                    entity._collect_at(blit_sequence, screen_pos[0], screen_pos[1], zoom)
+                    drawn.append((entity, screen_pos))
+            screen.blits(blit_sequence, doreturn=False)
+            
+            for entity, (screen_x, screen_y) in drawn:
+                entity._draw_overlays(screen, screen_x, screen_y, zoom)
+                
+        except Exception as e:
+            print(f"Error drawing entities: {e}")
+            traceback.print_exc()
+            
+    def update(self, world, dt: float):
+        """Move every entity in one batch, then update systems, thoughts and timers"""
+        try:
+            self.step(dt)
+            
+            for entity in self.entities:
+                entity._update_systems(world, dt)
+                
+            # Gather contexts only from entities whose poll interval has passed,
+            # grouped by thought system
+            n = self.count
+            thought_wait = self.thought_wait[:n]
+            pending = {}
+            for i in np.flatnonzero(thought_wait <= 0).tolist():
+                entity = self.entities[i]
+                if entity.thought_system:
+                    thought_wait[i] = entity.thought_interval
+                    batch = pending.setdefault(id(entity.thought_system), (entity.thought_system, [], []))
+                    batch[1].append(entity)
+                    batch[2].append(world._generate_entity_context(entity))
+                    
+            # One call per thought system for all of its entities
+            for thought_system, entities, contexts in pending.values():
+                for entity, thought in zip(entities, _process_thoughts(thought_system, contexts)):
+                    entity._receive_thought(world, thought)
+                    
+            for entity in self.entities:
+                entity._update_timers(dt)
+                
+        except Exception as e:
+            print(f"Error updating entities: {e}")
+            traceback.print_exc()
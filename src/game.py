@@ -6,7 +6,7 @@ from .world import World
 from .constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, TARGET_FPS,
     DISPLAY_FLAGS, WINDOW_TITLE, VSYNC, SCREEN_STATES,
-    GRAPHICS_QUALITY, FONTS, FRAME_LENGTH
+    GRAPHICS_QUALITY, FRAME_LENGTH
 )
 from .ui.screen_manager import ScreenManager
 from .ui.screens.main_menu import MainMenuScreen
@@ -2,7 +2,7 @@ import pygame
 import traceback
 import math
 from typing import Tuple, Callable, Optional
-from ...constants import UI_COLORS, FONTS, BUTTON_STYLES
+from ...constants import UI_COLORS, BUTTON_STYLES
 from ..components.text import Text
 
 class Button:
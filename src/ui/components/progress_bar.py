@@ -1,7 +1,7 @@
 import pygame
 import math
 from typing import Tuple, Optional
-from ...constants import UI_COLORS, FONTS
+from ...constants import UI_COLORS, FontId, get_fonts
 
 class ProgressBar:
     def __init__(self, position: Tuple[int, int], size: Tuple[int, int],
@@ -34,7 +34,7 @@ class ProgressBar:
         self.shine_offset = 0.0
         
         # Create font for percentage text
-        self.font = FONTS['small']  # Use predefined small font
+        self.font = get_fonts()[FontId.SMALL]  # Use predefined small font
         
         # Create surfaces
         self._create_surfaces()
@@ -1,6 +1,6 @@
 import pygame
 from typing import Tuple, Callable
-from src.constants import UI_COLORS, FONTS
+from src.constants import UI_COLORS, FontId, get_fonts
 
 class Slider:
     def __init__(self, label: str, pos: Tuple[int, int], size: Tuple[int, int],
@@ -69,7 +69,7 @@ class Slider:
         """Create text surfaces"""
         try:
             # Create label text
-            self.label_surface = FONTS['normal'].render(
+            self.label_surface = get_fonts()[FontId.NORMAL].render(
                 self.label,
                 True,
                 UI_COLORS['text_normal']
@@ -111,7 +111,7 @@ class Slider:
     def _update_value_text(self):
         """Update value text surface"""
         try:
-            self.value_surface = FONTS['small'].render(
+            self.value_surface = get_fonts()[FontId.SMALL].render(
                 f"{int(self.value)}",
                 True,
                 UI_COLORS['text_normal']
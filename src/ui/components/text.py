@@ -1,6 +1,6 @@
 import pygame
 from typing import Tuple, Optional
-from ...constants import UI_COLORS, FONTS
+from ...constants import UI_COLORS, FONT_SIZES, get_font
 
 class Text:
     def __init__(self, text: str, pos: Tuple[int, int],
@@ -23,10 +23,10 @@ class Text:
             self.pos = pos
             
             # Get font with fallback
-            if font_name not in FONTS:
+            if font_name not in FONT_SIZES:
                 print(f"Warning: Font '{font_name}' not found, using 'normal' font")
                 font_name = 'normal'
-            self.font = FONTS[font_name]
+            self.font = get_font(font_name)
             if not self.font:
                 print(f"Error: Could not load font '{font_name}', using system default")
                 self.font = pygame.font.Font(None, 24)
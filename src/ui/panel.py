@@ -1,5 +1,5 @@
 import pygame
-from ..constants import UI_COLORS
+from ..constants import UI_COLORS, FontId, get_fonts, render_styled
 
 class UIPanel:
     def __init__(self, x, y, width, height, title=None, icon=None):
@@ -26,7 +26,7 @@ class UIPanel:
         self.rect = pygame.Rect(x, y, width, height)
         
         # Initialize font
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_fonts()[FontId.SMALL]
         
         # Create surfaces
         self.surface = None
@@ -71,12 +71,7 @@ class UIPanel:
                 
                 # Draw title text with shadow
                 title_text = f"{self.icon} {self.title}" if self.icon else self.title
-                # Shadow
-                title_shadow = self.font.render(title_text, True, (0, 0, 0))
-                shadow_rect = title_shadow.get_rect(centerx=self.width // 2 + 1, centery=title_height // 2 + 1)
-                self.surface.blit(title_shadow, shadow_rect)
-                # Main text
-                title_surface = self.font.render(title_text, True, UI_COLORS['text_highlight'])
+                title_surface = render_styled(title_text, FontId.SMALL, UI_COLORS['text_highlight'])
                 title_rect = title_surface.get_rect(centerx=self.width // 2, centery=title_height // 2)
                 self.surface.blit(title_surface, title_rect)
                 
@@ -217,12 +212,7 @@ class UIPanel:
                 
                 # Draw title text with shadow
                 title_text = f"{self.icon} {self.title}" if self.icon else self.title
-                # Shadow
-                title_shadow = self.font.render(title_text, True, (0, 0, 0))
-                shadow_rect = title_shadow.get_rect(centerx=self.width // 2 + 1, centery=title_height // 2 + 1)
-                self.surface.blit(title_shadow, shadow_rect)
-                # Main text
-                title_surface = self.font.render(title_text, True, UI_COLORS['text_highlight'])
+                title_surface = render_styled(title_text, FontId.SMALL, UI_COLORS['text_highlight'])
                 title_rect = title_surface.get_rect(centerx=self.width // 2, centery=title_height // 2)
                 self.surface.blit(title_surface, title_rect)
                 
@@ -1,6 +1,10 @@
 import pygame
+import numpy as np
 from ..panel import UIPanel
-from ...constants import UI_COLORS, WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE
+from ...constants import (
+    UI_COLORS, WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE, CHUNK_SIZE,
+    BIOME_ID, BIOME_COLOR_LUT
+)
 from ...world.entities.human import Human
 from ...world.entities.animal import Animal
 from ...world.entities.plant import Plant
@@ -28,10 +32,35 @@ class MinimapPanel(UIPanel):
             'player': UI_COLORS['minimap_player']
         }
         
+        # Biome colors by id, with trailing rows for unknown biomes and unloaded area
+        self.unknown_biome = len(BIOME_COLOR_LUT)
+        self.empty_tile = self.unknown_biome + 1
+        self.biome_lut = np.vstack((
+            BIOME_COLOR_LUT,
+            UI_COLORS['minimap_unknown'][:3],
+            UI_COLORS['minimap_bg'][:3]
+        )).astype(np.uint8)
+        
+        self.world = None
+        
+        # Terrain never changes after generation, so biome ids and the
+        # rendered terrain are cached until the visible chunks change
+        self._reset_terrain_cache()
+        
     def initialize(self, world):
         """Initialize panel with world reference"""
         self.world = world
         
+        # Cached chunks and terrain belong to the previous world
+        self._reset_terrain_cache()
+        
+    def _reset_terrain_cache(self):
+        """Drop the cached biome ids and terrain image"""
+        self.chunk_biome_ids = {}
+        self.terrain_key = None
+        self.terrain_surface = None
+        self.terrain_pos = (0, 0)
+        
     def draw(self, screen, world):
         """Draw the minimap panel"""
         try:
@@ -40,6 +69,8 @@ class MinimapPanel(UIPanel):
             
             if not world:
                 return
+            if world is not self.world:
+                self.initialize(world)
                 
             # Clear minimap surface
             self.map_surface.fill(UI_COLORS['minimap_bg'])
@@ -49,20 +80,9 @@ class MinimapPanel(UIPanel):
             scale_y = self.map_height / world.height
             
             # Draw terrain
-            for chunk in world.visible_chunks:
-                chunk_x, chunk_y = chunk
-                for tile_x in range(TILE_SIZE):
-                    for tile_y in range(TILE_SIZE):
-                        world_x = chunk_x * TILE_SIZE + tile_x
-                        world_y = chunk_y * TILE_SIZE + tile_y
-                        
-                        if 0 <= world_x < world.width and 0 <= world_y < world.height:
-                            tile = world.get_tile(world_x, world_y)
-                            if tile:
-                                color = self.colors.get(tile['biome'], UI_COLORS['minimap_unknown'])
-                                x = int(world_x * scale_x)
-                                y = int(world_y * scale_y)
-                                pygame.draw.rect(self.map_surface, color, (x, y, max(1, scale_x), max(1, scale_y)))
+            terrain_surface = self._get_terrain_surface(world, scale_x, scale_y)
+            if terrain_surface:
+                self.map_surface.blit(terrain_surface, self.terrain_pos)
             
             # Draw entities
             for entity in world.active_entities:
@@ -88,6 +108,58 @@ class MinimapPanel(UIPanel):
             print(f"Error drawing minimap: {e}")
             traceback.print_exc()
             
+    def _get_chunk_biome_ids(self, world, chunk_pos):
+        """Get a chunk's biome ids as an [x][y] array, converting it once"""
+        biome_ids = self.chunk_biome_ids.get(chunk_pos)
+        if biome_ids is None:
+            chunk = world.chunks.get(chunk_pos)
+            if not chunk or chunk.biome_map is None:
+                return None
+                
+            # biome_map is indexed [y][x]; surfarray pixels are indexed [x][y]
+            biome_ids = np.array([
+                [BIOME_ID.get(biome, self.unknown_biome) for biome in row]
+                for row in chunk.biome_map
+            ], dtype=np.intp).T
+            self.chunk_biome_ids[chunk_pos] = biome_ids
+        return biome_ids
+        
+    def _get_terrain_surface(self, world, scale_x, scale_y):
+        """Get the cached minimap image of the visible chunks' biomes"""
+        visible = frozenset(world.visible_chunks)
+        key = (visible, scale_x, scale_y)
+        if key == self.terrain_key:
+            return self.terrain_surface
+        self.terrain_key = key
+        self.terrain_surface = None
+        
+        chunks = [pos for pos in visible if self._get_chunk_biome_ids(world, pos) is not None]
+        if not chunks:
+            return None
+            
+        # Lay every visible chunk into one biome id grid
+        min_x = min(x for x, _ in chunks)
+        min_y = min(y for _, y in chunks)
+        max_x = max(x for x, _ in chunks)
+        max_y = max(y for _, y in chunks)
+        grid = np.full(((max_x - min_x + 1) * CHUNK_SIZE, (max_y - min_y + 1) * CHUNK_SIZE),
+                       self.empty_tile, dtype=np.intp)
+        for chunk_x, chunk_y in chunks:
+            biome_ids = self.chunk_biome_ids[(chunk_x, chunk_y)]
+            grid_x = (chunk_x - min_x) * CHUNK_SIZE
+            grid_y = (chunk_y - min_y) * CHUNK_SIZE
+            grid[grid_x:grid_x + biome_ids.shape[0], grid_y:grid_y + biome_ids.shape[1]] = biome_ids
+            
+        # One LUT gather and one array blit for the whole map
+        tile_surface = pygame.Surface(grid.shape)
+        pygame.surfarray.blit_array(tile_surface, self.biome_lut[grid])
+        
+        chunk_world_size = CHUNK_SIZE * TILE_SIZE
+        self.terrain_pos = (int(min_x * chunk_world_size * scale_x), int(min_y * chunk_world_size * scale_y))
+        size = (max(1, int(grid.shape[0] * TILE_SIZE * scale_x)), max(1, int(grid.shape[1] * TILE_SIZE * scale_y)))
+        self.terrain_surface = pygame.transform.scale(tile_surface, size)
+        return self.terrain_surface
+        
     def handle_event(self, event, world):
         """Handle mouse events for map navigation"""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
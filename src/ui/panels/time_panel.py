@@ -2,7 +2,8 @@ import pygame
 import math
 from ..panel import UIPanel
 from ..components.button import Button
-from ...constants import UI_COLORS, SEASONS, TIME_SPEEDS, SEASON_ORDER, FONTS
+from ...constants import (UI_COLORS, SEASONS, SEASON_ORDER, TIME_SPEED_NAMES, TIME_SPEED_INDEX,
+                          FontId, get_fonts, render_styled)
 
 class TimePanel(UIPanel):
     def __init__(self, x, y, width, height, title="Time & Weather", icon="⏰"):
@@ -55,8 +56,8 @@ class TimePanel(UIPanel):
         }
         
         # Initialize fonts
-        self.font = FONTS['normal']
-        self.small_font = FONTS['small']
+        self.font = get_fonts()[FontId.NORMAL]
+        self.small_font = get_fonts()[FontId.SMALL]
         
         # World reference
         self.world = None
@@ -77,10 +78,9 @@ class TimePanel(UIPanel):
             return
             
         current_speed = self.world.time_system.speed
-        speeds = list(TIME_SPEEDS.values())
-        current_index = speeds.index(current_speed)
+        current_index = TIME_SPEED_INDEX[current_speed]
         if current_index > 0:
-            speed_name = list(TIME_SPEEDS.keys())[current_index - 1]
+            speed_name = TIME_SPEED_NAMES[current_index - 1]
             self.world.set_time_speed(speed_name)
         
     def _increase_speed(self):
@@ -89,10 +89,9 @@ class TimePanel(UIPanel):
             return
             
         current_speed = self.world.time_system.speed
-        speeds = list(TIME_SPEEDS.values())
-        current_index = speeds.index(current_speed)
-        if current_index < len(speeds) - 1:
-            speed_name = list(TIME_SPEEDS.keys())[current_index + 1]
+        current_index = TIME_SPEED_INDEX[current_speed]
+        if current_index < len(TIME_SPEED_NAMES) - 1:
+            speed_name = TIME_SPEED_NAMES[current_index + 1]
             self.world.set_time_speed(speed_name)
         
     def update(self, world, dt: float):
@@ -133,7 +132,8 @@ class TimePanel(UIPanel):
             text_y = self.y + 40  # Start below title
             line_spacing = 25
             
-            # Draw time text with shadow for better visibility
+            # Draw time text with shadow for better visibility; the clock and
+            # temperature change constantly, so they bypass the label cache
             def draw_text_with_shadow(text, y_pos):
                 # Draw shadow
                 shadow_surface = self.font.render(text, True, (0, 0, 0))
@@ -142,12 +142,17 @@ class TimePanel(UIPanel):
                 text_surface = self.font.render(text, True, UI_COLORS['text_highlight'])
                 surface.blit(text_surface, (text_x, y_pos))
                 return y_pos + line_spacing
+                
+            # Season and weather labels rarely change, so they come from the cache
+            def draw_cached_label(text, y_pos):
+                surface.blit(render_styled(text, FontId.NORMAL, UI_COLORS['text_highlight']), (text_x, y_pos))
+                return y_pos + line_spacing
             
             # Draw each text line
             current_y = text_y
             current_y = draw_text_with_shadow(self.time_text, current_y)
-            current_y = draw_text_with_shadow(self.season_text, current_y)
-            current_y = draw_text_with_shadow(self.weather_text, current_y)
+            current_y = draw_cached_label(self.season_text, current_y)
+            current_y = draw_cached_label(self.weather_text, current_y)
             current_y = draw_text_with_shadow(self.temperature_text, current_y)
             
             # Draw time control buttons
@@ -1,7 +1,7 @@
 import pygame
 import traceback
 from typing import Dict, Optional
-from ..constants import SCREEN_STATES, UI_COLORS, WINDOW_WIDTH, WINDOW_HEIGHT, FONTS
+from ..constants import SCREEN_STATES, UI_COLORS, WINDOW_WIDTH, WINDOW_HEIGHT
 from .screens.main_menu_screen import MainMenuScreen
 from .screens.world_gen_screen import WorldGenScreen
 from .screens.game_screen import GameScreen
@@ -1,6 +1,6 @@
 import pygame
 from typing import Optional, Dict
-from ...constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, FONTS, GRAPHICS_QUALITY
+from ...constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, GRAPHICS_QUALITY, SHOW_FPS
 from ..screen import Screen
 from ...world import World
 import traceback
@@ -205,7 +205,7 @@ class GameScreen(Screen):
                     self.pause_button.draw(surface)
                 
                 # Draw debug info if enabled
-                if self.show_debug:
+                if __debug__ and self.show_debug:
                     self._draw_debug_info(surface)
             else:
                 # Draw loading message if world is not ready
@@ -234,7 +234,7 @@ class GameScreen(Screen):
                 self.pause_button.draw(surface)
             
             # Draw FPS counter
-            if hasattr(self, 'fps_text'):
+            if __debug__ and SHOW_FPS and hasattr(self, 'fps_text'):
                 self.fps_text.draw(surface)
             
             # Draw time display
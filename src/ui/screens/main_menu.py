@@ -5,7 +5,7 @@ import traceback
 from typing import List, Tuple
 from src.ui.screens.screen import Screen
 from src.ui.components.button import Button
-from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, FONTS
+from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS
 
 class MainMenuScreen(Screen):
     def __init__(self, game):
@@ -34,10 +34,10 @@ class MainMenuScreen(Screen):
         """Initialize fonts"""
         try:
             # Title font
-            self.title_font = pygame.font.Font(FONTS['title'], 72)
+            self.title_font = pygame.font.Font(None, 72)
             
             # Button font
-            self.button_font = pygame.font.Font(FONTS['ui'], 32)
+            self.button_font = pygame.font.Font(None, 32)
             
         except Exception as e:
             print(f"Error initializing fonts: {e}")
@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 from typing import Optional
-from ...constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, FONTS
+from ...constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS
 from ..components.button import Button
 from ..components.text import Text
 from ..screen import Screen
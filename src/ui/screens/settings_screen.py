@@ -1,6 +1,6 @@
 import pygame
 from typing import Optional, Dict
-from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, FONTS
+from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS
 from src.ui.screen import Screen
 from src.ui.components.button import Button
 from src.ui.components.text import Text
@@ -4,7 +4,7 @@ import math
 import traceback
 from typing import Optional, Dict, Any
 from ...constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, FONTS,
+    WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS,
     GRAPHICS_QUALITY, SCREEN_STATES
 )
 from ..components.text import Text
@@ -4,7 +4,7 @@ from .panels.selection_panel import SelectionPanel
 from .notifications import NotificationSystem
 from .particles import ParticleSystem
 from ..world.entities.human import Human
-from ..constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, TILE_SIZE, FONTS
+from ..constants import WINDOW_WIDTH, WINDOW_HEIGHT, UI_COLORS, TILE_SIZE, FontId, get_fonts
 
 class UISystem:
     def __init__(self):
@@ -22,9 +22,9 @@ class UISystem:
             # Selection system
             self.selection = SelectionPanel()
             
-            # Font settings - use FONTS from constants
-            self.font = FONTS['normal']
-            self.tooltip_font = FONTS['small']
+            # Font settings - use shared fonts from constants
+            self.font = get_fonts()[FontId.NORMAL]
+            self.tooltip_font = get_fonts()[FontId.SMALL]
             if not self.font or not self.tooltip_font:
                 print("Warning: Could not load fonts, using system default")
                 self.font = pygame.font.Font(None, 24)
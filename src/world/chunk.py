@@ -1,15 +1,22 @@
 import pygame
-import random
 import traceback
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from typing import Dict, Final, List, Optional, Tuple
 from ..constants import (
-    CHUNK_SIZE, TILE_SIZE, BIOMES,
+    CHUNK_SIZE, TILE_SIZE,
     RESOURCE_TYPES, ENTITY_TYPES,
-    WINDOW_WIDTH, WINDOW_HEIGHT
+    WINDOW_WIDTH, WINDOW_HEIGHT,
+    BIOME_ID, BIOME_COLOR_LUT, colorize_biomes
 )
 
 # Grid display setting
-SHOW_GRID = False  # Can be toggled for debugging
+SHOW_GRID: Final[bool] = False  # Can be toggled for debugging
+
+_TILE_RNG = np.random.default_rng()
+
+# Biome colours plus a trailing gray row for biomes missing from BIOMES
+_UNKNOWN_BIOME = len(BIOME_COLOR_LUT)
+_TERRAIN_LUT = np.vstack([BIOME_COLOR_LUT, (100, 100, 100)]).astype(np.uint8)
 
 class Chunk:
     def __init__(self, world, pos: Tuple[int, int]):
@@ -39,6 +46,7 @@ class Chunk:
                     self.tiles[tile_pos] = {
                         'height': heightmap[y][x],
                         'biome': biome_map[y][x],
+                        'biome_id': BIOME_ID.get(biome_map[y][x], _UNKNOWN_BIOME),
                         'walkable': True  # Default to walkable
                     }
                     
@@ -131,7 +139,7 @@ class Chunk:
                         print(f"Error scaling chunk surface: {e}")
                     
             # Draw grid for debugging if enabled
-            if SHOW_GRID:
+            if __debug__ and SHOW_GRID:
                 grid_color = (100, 100, 100, 128)
                 pygame.draw.rect(screen, grid_color, 
                                (screen_x, screen_y, scaled_size, scaled_size), 1)
@@ -158,40 +166,31 @@ class Chunk:
             if not self.surface:
                 self.surface = pygame.Surface((CHUNK_SIZE * TILE_SIZE, CHUNK_SIZE * TILE_SIZE))
                 
-            # Draw terrain
-            for y in range(CHUNK_SIZE):
-                for x in range(CHUNK_SIZE):
-                    tile = self.tiles.get((x, y))
-                    if not tile:
-                        continue
-                        
-                    # Get tile color based on biome and height
-                    biome = tile['biome']
-                    height = tile['height']
-                    
-                    if biome in BIOMES:
-                        base_color = BIOMES[biome]['color']
-                        # Adjust color based on height
-                        color = [
-                            min(255, int(c * (0.7 + height * 0.6)))
-                            for c in base_color
-                        ]
-                    else:
-                        color = (100, 100, 100)  # Default gray
-                        
-                    # Draw tile with slight variation
-                    variation = random.uniform(0.95, 1.05)
-                    final_color = [min(255, int(c * variation)) for c in color]
-                    
-                    # Draw tile
-                    tile_rect = pygame.Rect(
-                        x * TILE_SIZE, y * TILE_SIZE,
-                        TILE_SIZE, TILE_SIZE
-                    )
-                    pygame.draw.rect(self.surface, final_color, tile_rect)
-                    
-                    # Add border for better visibility
-                    pygame.draw.rect(self.surface, [c * 0.8 for c in final_color], tile_rect, 1)
+            # Gather tile biomes and heights into (x, y) grids
+            biome_ids = np.full((CHUNK_SIZE, CHUNK_SIZE), _UNKNOWN_BIOME, dtype=np.intp)
+            heights = np.zeros((CHUNK_SIZE, CHUNK_SIZE))
+            present = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=bool)
+            for (x, y), tile in self.tiles.items():
+                present[x, y] = True
+                biome_ids[x, y] = tile['biome_id']
+                heights[x, y] = tile['height']
+                
+            # Tile color based on biome, adjusted for height
+            colors = colorize_biomes(biome_ids, _TERRAIN_LUT).astype(np.float64)
+            known = biome_ids != _UNKNOWN_BIOME
+            colors[known] = np.floor(np.minimum(255, colors[known] * (0.7 + heights[known, np.newaxis] * 0.6)))
+            
+            # Slight per-tile variation, with a darker border for better visibility
+            variation = _TILE_RNG.uniform(0.95, 1.05, (CHUNK_SIZE, CHUNK_SIZE, 1))
+            colors = np.floor(np.minimum(255, colors * variation))
+            fill_colors = colors[present].astype(np.uint8).tolist()
+            border_colors = (colors[present] * 0.8).astype(np.uint8).tolist()
+            
+            # Draw tiles
+            for (x, y), fill_color, border_color in zip(np.argwhere(present).tolist(), fill_colors, border_colors):
+                tile_rect = (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                self.surface.fill(fill_color, tile_rect)
+                pygame.draw.rect(self.surface, border_color, tile_rect, 1)
                     
             self.needs_update = False
             
@@ -2,11 +2,13 @@ import random
 import math
 import pygame
 from .entity import Entity
-from ...constants import ANIMAL_TYPES, ANIMAL_BEHAVIORS, TILE_SIZE
+from ...constants import ANIMAL_TYPES, ANIMAL_BEHAVIORS, TILE_SIZE, render_emoji
 import traceback
 from typing import Dict, List, Tuple, Optional
 
 class Animal(Entity):
+    KIND = 1
+    
     def __init__(self, world, x: float, y: float, animal_type: str = 'wolf'):
         """Initialize an animal entity"""
         # Initialize type before super().__init__
@@ -14,7 +16,7 @@ class Animal(Entity):
         self.subtype = animal_type
         
         # Get properties from ANIMAL_TYPES
-        self.properties = ANIMAL_TYPES[animal_type].copy()
+        self.properties = ANIMAL_TYPES[animal_type]
         
         # Set basic attributes
         self.sprite = self.properties.get('sprite', '🐾')  # Default animal footprint emoji
@@ -59,7 +61,7 @@ class Animal(Entity):
         # Set behavior-specific properties
         self.is_predator = self.behavior == 'predator'
         self.is_prey = self.behavior == 'prey'
-        self.diet = self.properties.get('diet', ['grass'])
+        self.diet = self.properties.get('diet', ('grass',))
         self.pack_animal = self.properties.get('pack_animal', False)
         self.nocturnal = self.properties.get('nocturnal', False)
         
@@ -144,7 +146,7 @@ class Animal(Entity):
         nearby = world.get_entities_in_range(self.x, self.y, self.vision_range * TILE_SIZE)
         
         for entity in nearby:
-            if (isinstance(entity, Animal) and 
+            if (entity.KIND == Animal.KIND and 
                 entity.behavior == 'predator' and 
                 entity != self):
                 threats.append(entity)
@@ -182,7 +184,7 @@ class Animal(Entity):
         nearby = world.get_entities_in_range(self.x, self.y, self.vision_range)
         
         for entity in nearby:
-            if (isinstance(entity, Animal) and 
+            if (entity.KIND == Animal.KIND and 
                 entity.behavior == 'prey' and 
                 entity != self):
                 prey.append(entity)
@@ -257,9 +259,7 @@ class Animal(Entity):
             if self.state in ANIMAL_BEHAVIORS and 'emoji' in ANIMAL_BEHAVIORS[self.state]:
                 try:
                     behavior_emoji = ANIMAL_BEHAVIORS[self.state]['emoji']
-                    emoji_size = int(16 * zoom)
-                    emoji_font = pygame.font.SysFont('segoe ui emoji', emoji_size)
-                    emoji_surface = emoji_font.render(behavior_emoji, True, (0, 0, 0))
+                    emoji_surface = render_emoji(behavior_emoji, int(16 * zoom))
                     emoji_rect = emoji_surface.get_rect(
                         centerx=screen_x,
                         bottom=screen_y - int(self.size * zoom)
@@ -2,13 +2,16 @@ import pygame
 import math
 from ...constants import (
     ENTITY_TYPES, UI_COLORS, TILE_SIZE,
-    ANIMAL_TYPES  # Add ANIMAL_TYPES import
+    ANIMAL_TYPES, render_emoji
 )
 import random
 from typing import Dict, Optional, Tuple
 import traceback
 
 class Entity:
+    # Type tag for hot filters, cheaper than isinstance; subclasses override it
+    KIND = 0
+    
     def __init__(self, world, x: float, y: float):
         """Initialize entity"""
         self.world = world
@@ -54,15 +57,8 @@ class Entity:
             elif hasattr(self, 'subtype') and self.subtype in ANIMAL_TYPES:
                 self.sprite = ANIMAL_TYPES[self.subtype].get('sprite', '🐾')
                 
-            # Create surface for sprite
-            font_size = int(self.size * 0.8)  # Slightly smaller than entity size
-            try:
-                font = pygame.font.SysFont('segoe ui emoji', font_size)
-            except:
-                font = pygame.font.Font(None, font_size)  # Fallback to default font
-                
-            # Render sprite
-            text_surface = font.render(self.sprite, True, (0, 0, 0))
+            # Render sprite slightly smaller than entity size
+            text_surface = render_emoji(self.sprite, int(self.size * 0.8))
             
             # Create entity surface with alpha
             self.surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
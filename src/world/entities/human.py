@@ -14,13 +14,26 @@ from ...constants import (
     INTERACTION_TYPES,
     HUMAN_TYPES,
     THOUGHT_TYPES,
-    UI_COLORS
+    UI_COLORS,
+    render_emoji
 )
 from .entity import Entity
 from ..systems.thought_system import ThoughtSystem
 from ..systems.action_system import ActionSystem
 from ..systems.language_system import LanguageSystem
 
+# Mood indicator colors; built once instead of on every draw call
+_MOOD_INDICATOR_COLORS = {
+    'happy': (50, 220, 50),
+    'content': (220, 220, 50),
+    'neutral': (200, 200, 200),
+    'sad': (220, 50, 50),
+    'angry': (255, 0, 0)
+}
+
+# Activities the daily schedule picks from; HumanTypeSpec has no per-type routines
+_DAILY_ROUTINES = ('work', 'socialize', 'rest')
+
 class Human(Entity):
     def __init__(self, world, x: float, y: float, human_type: str = 'villager'):
         """Initialize a human entity with thoughts and behaviors"""
@@ -35,15 +48,15 @@ class Human(Entity):
         self.subtype = human_type
         
         # Get properties from HUMAN_TYPES
-        self.properties = HUMAN_TYPES[human_type].copy()
+        self.properties = HUMAN_TYPES[human_type]
         
         # Set basic attributes
-        self.sprite = self.properties.get('sprite', '👤')  # Default sprite if not specified
-        self.speed = self.properties.get('speed', 2.0)
-        self.size = self.properties.get('size', TILE_SIZE)
-        self.vision_range = self.properties.get('vision_range', 8)
-        self.intelligence = self.properties.get('intelligence', 1.0)
-        self.skills = self.properties.get('starting_skills', {}).copy()
+        self.sprite = self.properties.sprite
+        self.speed = self.properties.speed
+        self.size = TILE_SIZE
+        self.vision_range = self.properties.vision_range
+        self.intelligence = self.properties.intelligence
+        self.skills = dict(self.properties.starting_skills)
         
         # Initialize stats
         self.health = 100
@@ -238,8 +251,7 @@ class Human(Entity):
     def _create_daily_schedule(self):
         """Create a daily schedule based on human type"""
         try:
-            # Get daily routines from properties
-            routines = self.properties.get('daily_routines', ['work', 'socialize', 'rest'])
+            routines = _DAILY_ROUTINES
             
             # Create schedule with time slots
             schedule = {
@@ -333,14 +345,7 @@ class Human(Entity):
             
             # Draw mood indicator
             if hasattr(self, 'state') and 'mood' in self.state:
-                mood_colors = {
-                    'happy': (50, 220, 50),
-                    'content': (220, 220, 50),
-                    'neutral': (200, 200, 200),
-                    'sad': (220, 50, 50),
-                    'angry': (255, 0, 0)
-                }
-                mood_color = mood_colors.get(self.state['mood'], (200, 200, 200))
+                mood_color = _MOOD_INDICATOR_COLORS.get(self.state['mood'], (200, 200, 200))
                 mood_size = int(4 * zoom)
                 mood_x = screen_x + int(self.size * zoom / 2) + mood_size
                 mood_y = screen_y - int(self.size * zoom / 2)
@@ -372,9 +377,7 @@ class Human(Entity):
                         'sleeping': '💤'
                     }.get(self.state['current'], '❓')
                     
-                    emoji_size = int(16 * zoom)
-                    emoji_font = pygame.font.SysFont('segoe ui emoji', emoji_size)
-                    emoji_surface = emoji_font.render(state_emoji, True, (0, 0, 0))
+                    emoji_surface = render_emoji(state_emoji, int(16 * zoom))
                     emoji_rect = emoji_surface.get_rect(
                         centerx=screen_x,
                         bottom=screen_y - int(self.size * zoom)
@@ -2,7 +2,7 @@ import pygame
 import math
 import random
 from typing import Dict, List, Optional, Tuple
-from ..constants import ENTITY_TYPES, ENTITY_STATES, ENTITY_NEEDS, THOUGHT_TYPES, ANIMAL_TYPES
+from ..constants import ENTITY_TYPES, ENTITY_STATES, ENTITY_NEEDS, THOUGHT_TYPES, ANIMAL_TYPES, render_emoji
 from .systems.thought_system import ThoughtSystem
 
 class Entity:
@@ -33,12 +33,8 @@ class Entity:
     def _init_surface(self):
         """Initialize entity surface with emoji sprite"""
         try:
-            # Create surface for emoji
-            font_size = int(self.size * 0.8)  # Slightly smaller than entity size
-            font = pygame.font.SysFont('segoe ui emoji', font_size)
-            
-            # Render emoji
-            text_surface = font.render(self.emoji, True, (0, 0, 0))
+            # Render emoji slightly smaller than entity size
+            text_surface = render_emoji(self.emoji, int(self.size * 0.8))
             
             # Create entity surface with alpha
             self.surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
@@ -71,7 +67,7 @@ class Entity:
             # Update needs
             for need, value in self.needs.items():
                 if need in ENTITY_NEEDS:
-                    decay = ENTITY_NEEDS[need]['decay_rate'] * dt
+                    decay = ENTITY_NEEDS[need].decay_rate * dt
                     self.needs[need] = max(0, min(100, value - decay))
             
             # Update systems
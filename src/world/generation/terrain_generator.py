@@ -275,7 +275,7 @@ class TerrainGenerator:
             
             # Add color variation based on biome
             if tile_data['biome'] in BIOMES:
-                base_color = BIOMES[tile_data['biome']]['color']
+                base_color = BIOMES[tile_data['biome']].color
                 variation = random.uniform(0.9, 1.1)
                 tile_data['color'] = tuple(
                     min(255, max(0, int(c * variation)))
@@ -283,11 +283,12 @@ class TerrainGenerator:
                 )
                 
             # Add fertility variation
-            base_fertility = BIOMES.get(tile_data['biome'], {}).get('base_fertility', 0.5)
+            biome_spec = BIOMES.get(tile_data['biome'])
+            base_fertility = biome_spec.base_fertility if biome_spec else 0.5
             tile_data['fertility'] = min(1.0, max(0.0, base_fertility + random.uniform(-0.1, 0.1)))
             
             # Add moisture retention
-            base_moisture = BIOMES.get(tile_data['biome'], {}).get('moisture_retention', 0.5)
+            base_moisture = biome_spec.moisture_retention if biome_spec else 0.5
             tile_data['moisture_retention'] = min(1.0, max(0.0, base_moisture + random.uniform(-0.1, 0.1)))
             
         except Exception as e:
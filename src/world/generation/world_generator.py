@@ -15,7 +15,7 @@ from ...constants import (
     WORLD_WIDTH, WORLD_HEIGHT, CHUNK_SIZE, ENTITY_TYPES,
     WORLD_CHUNKS_X, WORLD_CHUNKS_Y, TILE_SIZE,
     BIOMES, RESOURCE_TYPES, SEASONS, SEASON_ORDER,
-    WEATHER_TYPES, TIME_SPEEDS
+    WEATHER_TYPES, TIME_SPEEDS, BIOME_ID
 )
 
 class WorldGenerator:
@@ -263,7 +263,7 @@ class WorldGenerator:
                         # Get valid plant types for this biome
                         valid_plants = [
                             plant_type for plant_type, props in BIOMES.items()
-                            if biome in props.get('biomes', [])
+                            if biome in getattr(props, 'biomes', ())
                         ]
                         
                         if not valid_plants:
@@ -767,6 +767,7 @@ class WorldGenerator:
                     'x': x,
                     'y': y,
                     'biome': biome,
+                    'biome_id': BIOME_ID.get(biome, len(BIOME_ID)),
                     'elevation': elevation[y][x],
                     'moisture': moisture[y][x],
                     'temperature': temperature[y][x],
@@ -0,0 +1,100 @@
+"""Vectorized per-entity kernels over the constant tables"""
+
+import numpy as np
+
+from ..constants import (PERSONALITY_EFFECT_MATRIX, NEED_DECAY_RATE, NEED_CRITICAL,
+                         STATE_NEED_DELTA, TRAIT_LOW, TRAIT_HIGH)
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional (the "fast" extra)
+    njit = prange = None
+
+# Offsets from neutral, so a trait strength of 0 leaves stats unchanged
+_PERSONALITY_EFFECT_DELTA = PERSONALITY_EFFECT_MATRIX - np.float32(1.0)
+
+def _apply_personality_numpy(trait_strength, base, effect_delta):
+    return base * (1.0 + trait_strength @ effect_delta)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _apply_personality(trait_strength, base, effect_delta):
+        result = np.empty_like(base)
+        for i in range(base.shape[0]):
+            for effect in range(base.shape[1]):
+                scale = np.float32(1.0)
+                for trait in range(trait_strength.shape[1]):
+                    scale += trait_strength[i, trait] * effect_delta[trait, effect]
+                result[i, effect] = base[i, effect] * scale
+        return result
+else:
+    _apply_personality = _apply_personality_numpy
+
+def apply_personality(trait_strength, base):
+    """Scale (N, EffectId) base stats by (N, TraitId) trait strengths for N entities"""
+    return _apply_personality(np.ascontiguousarray(trait_strength, dtype=np.float32),
+                              np.ascontiguousarray(base, dtype=np.float32),
+                              _PERSONALITY_EFFECT_DELTA)
+
+def tick_status_durations(durations, dt):
+    """Count down status durations in place and return the mask of expired ones
+
+    Permanent effects hold inf (see STATUS_DURATION), which never reaches zero.
+    """
+    durations -= dt
+    return durations <= 0
+
+def _decay_needs_numpy(needs, dt, decay_rate, critical):
+    needs -= decay_rate * dt
+    np.maximum(needs, 0, out=needs)
+    return needs < critical
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _decay_needs(needs, dt, decay_rate, critical):
+        is_critical = np.empty(needs.shape, dtype=np.bool_)
+        for i in prange(needs.shape[0]):
+            for need in range(needs.shape[1]):
+                value = max(needs[i, need] - decay_rate[need] * dt, np.float32(0.0))
+                needs[i, need] = value
+                is_critical[i, need] = value < critical[need]
+        return is_critical
+else:
+    _decay_needs = _decay_needs_numpy
+
+def decay_needs(needs, dt):
+    """Decay an (N, EntityNeedId) needs array in place, clamped at 0, and return the critical mask"""
+    return _decay_needs(needs, np.float32(dt), NEED_DECAY_RATE, NEED_CRITICAL)
+
+def _tick_state_needs_numpy(needs, states, dt, state_delta, critical):
+    needs += state_delta[states] * dt
+    np.clip(needs, 0, 100, out=needs)
+    return needs < critical
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _tick_state_needs(needs, states, dt, state_delta, critical):
+        is_critical = np.empty(needs.shape, dtype=np.bool_)
+        for i in prange(needs.shape[0]):
+            state = states[i]
+            for need in range(needs.shape[1]):
+                value = needs[i, need] + state_delta[state, need] * dt
+                value = min(max(value, np.float32(0.0)), np.float32(100.0))
+                needs[i, need] = value
+                is_critical[i, need] = value < critical[need]
+        return is_critical
+else:
+    _tick_state_needs = _tick_state_needs_numpy
+
+def tick_state_needs(needs, states, dt):
+    """Apply each entity's STATE_NEED_DELTA row to an (N, EntityNeedId) needs array in place
+
+    states holds one EntityStateId per entity; needs are clamped to [0, 100] and
+    the critical mask is returned.
+    """
+    return _tick_state_needs(needs, np.asarray(states, dtype=np.intp), np.float32(dt),
+                             STATE_NEED_DELTA, NEED_CRITICAL)
+
+def clip_traits(traits):
+    """Clamp an (N, TraitId) traits array in place to each trait's (min, max) range"""
+    return np.clip(traits, TRAIT_LOW, TRAIT_HIGH, out=traits)
@@ -16,7 +16,7 @@ class Resource:
         self.id = f"resource_{id(self)}"  # Unique identifier
         
         # Get base properties
-        self.properties = RESOURCE_TYPES[resource_type].copy()
+        self.properties = RESOURCE_TYPES[resource_type]
         self.sprite = self.properties['sprite']
         
         # Resource properties
@@ -230,7 +230,7 @@ class Resource:
             
             # Apply season-specific modifiers
             if self.type in ['wood', 'food']:
-                modifiers['growth_rate'] = season_data['growth_mod']
+                modifiers['growth_rate'] = season_data.growth_mod
                 if self.world.current_season == 'Winter':
                     modifiers['quality'] = 0.8
                 elif self.world.current_season == 'Summer':
@@ -238,7 +238,7 @@ class Resource:
                     
             elif self.type in ['stone', 'ore']:
                 # Less affected by seasons
-                modifiers['regeneration_rate'] = 0.9 + season_data['precipitation'] * 0.2
+                modifiers['regeneration_rate'] = 0.9 + season_data.precipitation * 0.2
                 
             return modifiers
             
@@ -256,7 +256,7 @@ class Resource:
             
             # Biome influence
             if self.biome in BIOMES:
-                rate *= BIOMES[self.biome].get('fertility', 1.0)
+                rate *= getattr(BIOMES[self.biome], 'fertility', 1.0)
                 
             return max(0, rate)
             
@@ -337,7 +337,7 @@ class Resource:
             
             # Season influence
             season_data = SEASONS[self.world.current_season]
-            season_factor = 1.0 / season_data['growth_mod']
+            season_factor = 1.0 / season_data.growth_mod
             
             return base_delay * harvest_factor * season_factor
             
@@ -7,9 +7,14 @@ from ...constants import (
     ENTITY_NEEDS,
     TILE_SIZE,
     RESOURCE_TYPES,
-    ENTITY_TYPES
+    ENTITY_TYPES,
+    EntityStateSpec
 )
 
+# EntityStateSpec carries no timing, so every action uses these
+_ACTION_DURATION = (5, 15)  # (min, max) seconds
+_ACTION_COOLDOWN = 0
+
 class ActionSystem:
     def __init__(self, entity):
         """Initialize action system for an entity"""
@@ -116,17 +121,13 @@ class ActionSystem:
                     
                 # Set current action
                 self.current_action = action
-                duration = state_data.get('duration', (5, 15))
-                if isinstance(duration, tuple):
-                    self.action_timer = random.uniform(duration[0], duration[1])
-                else:
-                    self.action_timer = duration
+                self.action_timer = random.uniform(*_ACTION_DURATION)
                     
                 # Apply initial effects
                 self._apply_action_effects(action_type, state_data)
                 
                 # Set cooldown
-                self.action_cooldowns[action_type] = state_data.get('cooldown', 0)
+                self.action_cooldowns[action_type] = _ACTION_COOLDOWN
                 
                 # Update entity state
                 self.entity.state['current'] = action_type
@@ -143,7 +144,7 @@ class ActionSystem:
             
             # Check energy requirements
             if action_type in ENTITY_STATES:
-                energy_cost = ENTITY_STATES[action_type].get('energy_cost', 0)
+                energy_cost = ENTITY_STATES[action_type].energy_cost
                 if self.entity.energy < energy_cost:
                     return False
                     
@@ -241,12 +242,11 @@ class ActionSystem:
             traceback.print_exc()
             return False
 
-    def _apply_action_effects(self, action_type: str, state_data: Dict):
+    def _apply_action_effects(self, action_type: str, state_data: EntityStateSpec):
         """Apply effects when starting an action"""
         try:
             # Apply energy cost
-            if 'energy_cost' in state_data:
-                self.entity.energy = max(0, self.entity.energy - state_data['energy_cost'])
+            self.entity.energy = max(0, self.entity.energy - state_data.energy_cost)
                 
             # Apply state-specific effects
             if action_type == 'moving':
@@ -354,19 +354,9 @@ class ActionSystem:
             print(f"Error completing action: {e}")
             traceback.print_exc()
             
-    def _apply_completion_effects(self, action_type: str, state_data: Dict):
+    def _apply_completion_effects(self, action_type: str, state_data: EntityStateSpec):
         """Apply effects when completing an action"""
         try:
-            # Apply energy gain
-            if 'energy_gain' in state_data:
-                self.entity.energy = min(100, self.entity.energy + state_data['energy_gain'])
-                
-            # Apply need reductions
-            if 'hunger_reduction' in state_data:
-                self.entity.needs['hunger'] = max(0, self.entity.needs['hunger'] - state_data['hunger_reduction'])
-            if 'thirst_reduction' in state_data:
-                self.entity.needs['thirst'] = max(0, self.entity.needs['thirst'] - state_data['thirst_reduction'])
-                
             # Apply action-specific completion effects
             if action_type == 'moving':
                 self._complete_movement()
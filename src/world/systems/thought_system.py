@@ -157,7 +157,7 @@ class ThoughtSystem:
             critical_needs = []
             for need, value in self.entity.needs.items():
                 if need in ENTITY_NEEDS:
-                    threshold = ENTITY_NEEDS[need]['critical_threshold']
+                    threshold = ENTITY_NEEDS[need].critical_threshold
                     if value <= threshold:
                         critical_needs.append(need)
                         
@@ -2,7 +2,8 @@ import math
 import traceback
 from ...constants import (
     DAY_LENGTH, SEASON_LENGTH, TIME_SCALE,
-    SEASON_ORDER, SEASONS, TIME_SPEEDS
+    SEASON_ORDER, SEASONS, TIME_SPEEDS,
+    SEASON_SPECS, NUM_SEASONS, SeasonSpec
 )
 
 class TimeSystem:
@@ -58,7 +59,7 @@ class TimeSystem:
             self.season_progress = self.season_day / days_per_season
             
             # Update season if needed
-            season_index = (self.day // days_per_season) % len(SEASON_ORDER)
+            season_index = (self.day // days_per_season) % NUM_SEASONS
             if self.season != season_index:
                 self.season = season_index
                 
@@ -70,6 +71,10 @@ class TimeSystem:
         """Get current season name"""
         return SEASON_ORDER[self.season]
         
+    def get_season_spec(self) -> SeasonSpec:
+        """Get current season properties"""
+        return SEASON_SPECS[self.season]
+        
     def get_time_of_day(self) -> float:
         """Get normalized time of day (0-1)"""
         return self.day_progress
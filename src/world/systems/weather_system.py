@@ -2,13 +2,18 @@ import math
 import random
 import pygame
 import traceback
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 from ...constants import (
-    WEATHER_TYPES, SEASONS, SEASON_ORDER,
+    WEATHER_TYPES, SEASON_ORDER, SEASON_SPECS, sample_weather,
+    get_weather_overlay,
     WINDOW_WIDTH, WINDOW_HEIGHT,
     TIME_SPEEDS
 )
 
+# Shared generator for batched particle sampling
+_RNG = np.random.default_rng()
+
 class WeatherSystem:
     def __init__(self):
         """Initialize weather system"""
@@ -107,11 +112,11 @@ class WeatherSystem:
                 return
                 
             # Get current season and hour
-            season = SEASON_ORDER[self.world.time_system.season]
+            season_spec = SEASON_SPECS[self.world.time_system.season]
             hour = self.world.time_system.hour
             
             # Get base temperature from season
-            base_temp = SEASONS[season]['base_temp']
+            base_temp = season_spec.base_temp
             
             # Apply time of day variation (coolest at 3am, warmest at 3pm)
             time_offset = (hour - 3) % 24  # Hours since 3am
@@ -119,7 +124,7 @@ class WeatherSystem:
             temp_range = 10  # ±10 degrees variation
             
             # Calculate final temperature with weather modifier
-            weather_temp_mod = WEATHER_TYPES[self.current_weather]['temperature_mod']
+            weather_temp_mod = WEATHER_TYPES[self.current_weather].temperature_mod
             self.temperature = (base_temp + 
                               time_factor * temp_range + 
                               weather_temp_mod)
@@ -141,21 +146,8 @@ class WeatherSystem:
             # Get current season
             season = SEASON_ORDER[self.world.time_system.season]
             
-            # Get possible weather types for this season
-            possible_weather = []
-            for weather, data in WEATHER_TYPES.items():
-                if season in data['possible_seasons']:
-                    # Add weather multiple times based on its probability
-                    probability = data['probability']
-                    if season in data['season_probability_mod']:
-                        probability *= data['season_probability_mod'][season]
-                    possible_weather.extend([weather] * int(probability * 10))
-                    
-            # Select random weather from possibilities
-            if possible_weather:
-                self.current_weather = random.choice(possible_weather)
-            else:
-                self.current_weather = 'clear'  # Default to clear if no weather is possible
+            # Pick from the precomputed seasonal weather table
+            self.current_weather = sample_weather(season)
                 
             # Set new duration
             self.weather_timer = 0
@@ -177,12 +169,12 @@ class WeatherSystem:
             
             # Update visual effects
             for effect in self.effects:
-                self.effects[effect] = weather_data.get(effect, 0.0)
+                self.effects[effect] = getattr(weather_data, effect, 0.0)
                 
             # Update environmental conditions
-            self.wind_speed = weather_data.get('wind_speed', 0.0)
+            self.wind_speed = weather_data.wind_speed
             self.wind_direction = random.uniform(0, 2 * math.pi)
-            self.humidity = weather_data.get('humidity', 0.5)
+            self.humidity = weather_data.humidity
             
             # Initialize particles if needed
             if not self.particles:
@@ -204,8 +196,8 @@ class WeatherSystem:
             
             # Interpolate between effects
             for effect in self.effects:
-                prev_value = prev_effects.get(effect, 0.0)
-                curr_value = curr_effects.get(effect, 0.0)
+                prev_value = getattr(prev_effects, effect, 0.0)
+                curr_value = getattr(curr_effects, effect, 0.0)
                 self.effects[effect] = prev_value + (curr_value - prev_value) * self.transition_progress
                 
         except Exception as e:
@@ -221,19 +213,25 @@ class WeatherSystem:
             weather_data = WEATHER_TYPES[self.current_weather]
             
             # Update regular particles
-            for particle in self.particles[:]:  # Copy list to allow removal
+            dx = (self.wind_speed * math.cos(self.wind_direction) + weather_data.wind_speed) * dt * 60
+            dy = (self.wind_speed * math.sin(self.wind_direction) + weather_data.wind_speed) * dt * 60
+            offscreen = []
+            for particle in self.particles:
                 # Update position based on wind and gravity
-                particle['x'] += (self.wind_speed * math.cos(self.wind_direction) + 
-                                weather_data['wind_speed']) * dt * 60
-                particle['y'] += (self.wind_speed * math.sin(self.wind_direction) + 
-                                weather_data['wind_speed']) * dt * 60
-                
-                # Reset particles that go off screen
+                particle['x'] += dx
+                particle['y'] += dy
                 if (particle['x'] < 0 or particle['x'] > WINDOW_WIDTH or
                     particle['y'] < 0 or particle['y'] > WINDOW_HEIGHT):
-                    particle['x'] = random.randint(0, WINDOW_WIDTH)
+                    offscreen.append(particle)
+                    
+            # Reset particles that went off screen back to the top edge
+            if offscreen:
+                xs = _RNG.integers(0, WINDOW_WIDTH + 1, len(offscreen)).tolist()
+                alphas = _RNG.integers(100, 256, len(offscreen)).tolist()
+                for particle, x, alpha in zip(offscreen, xs, alphas):
+                    particle['x'] = x
                     particle['y'] = 0
-                    particle['alpha'] = random.randint(100, 255)
+                    particle['alpha'] = alpha
             
             # Update glow particles
             for particle in self.glow_particles[:]:  # Copy list to allow removal
@@ -242,30 +240,30 @@ class WeatherSystem:
                     self.glow_particles.remove(particle)
                     
             # Add new particles if needed
-            while len(self.particles) < weather_data['particle_count']:
-                self._add_particle()
+            self._add_particles(weather_data.particle_count - len(self.particles))
                 
         except Exception as e:
             print(f"Error updating particles: {e}")
             traceback.print_exc()
             
-    def _add_particle(self):
-        """Add a new weather particle"""
+    def _add_particles(self, count: int):
+        """Add several weather particles, sampling all their properties at once"""
         try:
-            if not self.current_weather:
+            if not self.current_weather or count <= 0:
                 return
                 
-            particle = {
-                'x': random.randint(0, WINDOW_WIDTH),
-                'y': random.randint(0, WINDOW_HEIGHT),
-                'size': random.randint(2, 4),
-                'alpha': random.randint(100, 255),
-                'speed': random.uniform(2, 5)
-            }
-            self.particles.append(particle)
+            xs = _RNG.integers(0, WINDOW_WIDTH + 1, count).tolist()
+            ys = _RNG.integers(0, WINDOW_HEIGHT + 1, count).tolist()
+            sizes = _RNG.integers(2, 5, count).tolist()
+            alphas = _RNG.integers(100, 256, count).tolist()
+            speeds = _RNG.uniform(2, 5, count).tolist()
+            self.particles.extend(
+                {'x': x, 'y': y, 'size': size, 'alpha': alpha, 'speed': speed}
+                for x, y, size, alpha, speed in zip(xs, ys, sizes, alphas, speeds)
+            )
             
         except Exception as e:
-            print(f"Error adding particle: {e}")
+            print(f"Error adding particles: {e}")
             traceback.print_exc()
             
     def _add_glow_particle(self):
@@ -287,7 +285,7 @@ class WeatherSystem:
     def _update_wind(self, dt: float):
         """Update wind conditions"""
         # Get target wind speed based on weather
-        target_speed = random.uniform(0, WEATHER_TYPES[self.current_weather]['max_wind'])
+        target_speed = random.uniform(0, WEATHER_TYPES[self.current_weather].max_wind)
         
         # Smoothly interpolate current wind speed
         self.wind_speed += (target_speed - self.wind_speed) * dt
@@ -306,12 +304,12 @@ class WeatherSystem:
             self.lightning_flash = max(0, self.lightning_flash - dt * 5)
             
         # Update overlay alpha based on weather
-        target_alpha = WEATHER_TYPES[self.current_weather].get('overlay_alpha', 0)
+        target_alpha = WEATHER_TYPES[self.current_weather].overlay_alpha
         self.overlay_alpha += (target_alpha - self.overlay_alpha) * dt * 2
         
     def _update_status_effects(self, world):
         """Update and apply weather status effects"""
-        current_effects = set(WEATHER_TYPES[self.current_weather].get('status_effects', []))
+        current_effects = set(WEATHER_TYPES[self.current_weather].status_effects)
         
         # Remove expired effects
         self.active_effects = self.active_effects.intersection(current_effects)
@@ -328,13 +326,11 @@ class WeatherSystem:
         """Update particle systems based on current weather"""
         try:
             weather_data = WEATHER_TYPES[self.current_weather]
-            target_count = weather_data['particle_count']
+            target_count = weather_data.particle_count
             
             # Update regular particles
-            while len(self.particles) < target_count:
-                self._add_particle()
-            while len(self.particles) > target_count:
-                self.particles.pop()
+            self._add_particles(target_count - len(self.particles))
+            del self.particles[target_count:]
             
             # Update glow particles for lightning
             if self.effects['lightning'] > 0:
@@ -420,12 +416,12 @@ class WeatherSystem:
                 return {}
                 
             effects = {
-                'temperature_change': WEATHER_TYPES[self.current_weather].get('temperature_mod', 0),
+                'temperature_change': WEATHER_TYPES[self.current_weather].temperature_mod,
                 'wind_speed': self.wind_speed,
                 'wind_direction': self.wind_direction,
                 'humidity': self.humidity,
-                'visibility': WEATHER_TYPES[self.current_weather].get('visibility', 1.0),
-                'movement_speed': WEATHER_TYPES[self.current_weather].get('movement_speed', 1.0)
+                'visibility': WEATHER_TYPES[self.current_weather].visibility,
+                'movement_speed': WEATHER_TYPES[self.current_weather].movement_speed
             }
             
             # Add visual effects
@@ -452,19 +448,16 @@ class WeatherSystem:
             weather_data = WEATHER_TYPES[self.current_weather]
             
             # Draw weather overlay
-            if weather_data['overlay_alpha'] > 0:
-                overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-                overlay_color = (*weather_data['graphics']['sky_color'], 
-                               int(weather_data['overlay_alpha'] * 255))
-                overlay.fill(overlay_color)
+            if weather_data.overlay_alpha > 0:
+                overlay = get_weather_overlay(self.current_weather, surface.get_size())
                 surface.blit(overlay, (0, 0))
             
             # Draw particles if enabled
-            if weather_data['graphics']['particle_effects']:
+            if weather_data.graphics.particle_effects:
                 self._draw_particles(surface)
             
             # Draw lightning flash
-            if self.lightning_flash > 0 and 'lightning' in weather_data['graphics']:
+            if self.lightning_flash > 0 and weather_data.graphics.lightning is not None:
                 flash = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
                 alpha = int(self.lightning_flash * 255)
                 flash.fill((255, 255, 255, alpha))
@@ -484,7 +477,7 @@ class WeatherSystem:
             
             # Draw regular particles (rain/snow)
             for particle in self.particles:
-                color = weather_data['particle_color']
+                color = weather_data.particle_color
                 if color:
                     pos = (int(particle['x']), int(particle['y']))
                     size = particle['size']
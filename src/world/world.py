@@ -14,7 +14,7 @@ from .entities.plant import Plant
 from .chunk import Chunk
 from ..constants import (
     WORLD_WIDTH, WORLD_HEIGHT, CHUNK_SIZE, TILE_SIZE,
-    ENTITY_TYPES, WEATHER_TYPES, SEASONS, SEASON_ORDER,
+    ENTITY_TYPES, WEATHER_TYPES, SEASON_ORDER,
     DAY_LENGTH, SEASON_LENGTH, TIME_SCALE,
     WINDOW_WIDTH, WINDOW_HEIGHT,
     BIOMES, UI_COLORS, TIME_SPEEDS,
@@ -342,7 +342,7 @@ class World:
                 print(f"Season changed to {self.current_season}")
                 
                 # Update season effects
-                self.season_effects = SEASONS.get(self.current_season, {})
+                self.season_effects = self.time_system.get_season_spec()
                 
                 # Notify entities of season change
                 for entity in self.entities:
@@ -1373,7 +1373,7 @@ class World:
                         
                     # Get resource types for this biome
                     biome_data = BIOMES[biome]
-                    resource_types = biome_data.get('resources', [])
+                    resource_types = biome_data.resources
                     
                     # Random chance to spawn resource
                     if resource_types and random.random() < 0.1:  # 10% chance per tile
@@ -0,0 +1,49 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+# Headless pygame for surfaces and fonts
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'numba: compares a numba kernel with its NumPy form')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked numba when the fast extra is not installed"""
+    if HAS_NUMBA:
+        return
+    skip = pytest.mark.skip(reason='numba is not installed')
+    for item in items:
+        if 'numba' in item.keywords:
+            item.add_marker(skip)
+
+
+def assert_kernels_match(compiled, reference, *args, rtol=1e-5):
+    """Run both kernels on their own copies of the array arguments and compare
+    the return values and every array argument afterwards, so in-place results
+    are checked too"""
+    results = []
+    for kernel in (compiled, reference):
+        copies = [arg.copy() if isinstance(arg, np.ndarray) else arg for arg in args]
+        returned = kernel(*copies)
+        results.append([returned] + [arg for arg in copies if isinstance(arg, np.ndarray)])
+        
+    for got, expected in zip(*results):
+        if expected is None:
+            assert got is None
+        elif expected.dtype == np.bool_ or np.issubdtype(expected.dtype, np.integer):
+            assert np.array_equal(got, expected)
+        else:
+            assert np.allclose(got, expected, rtol=rtol)
+
+
+@pytest.fixture
+def kernels_match():
+    return assert_kernels_match
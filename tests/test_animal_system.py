@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pygame
+import pytest
+
+from src.constants import TILE_SIZE
+from src.entities import animal as animal_module
+from src.entities.animal import (
+    ANIMAL_STATES, INJURED, Animal, AnimalSystem, HUNGER, THIRST
+)
+
+
+class FakeWorld:
+    """Just the attributes and queries Animal and AnimalSystem read"""
+    
+    def __init__(self, chunk_size=4):
+        self.chunk_size = chunk_size
+        self.width = self.height = TILE_SIZE * chunk_size * 2
+        self.current_weather = 'storm'
+        self.time = 0.0
+        self.day_time = 12.0
+        tiles = [[{'biome': 'forest', 'walkable': (x + y) % 5 != 0} for x in range(chunk_size)]
+                 for y in range(chunk_size)]
+        self.chunks = {(0, 0): SimpleNamespace(tiles=tiles)}
+        self.resources = [SimpleNamespace(type='water', x=40.0, y=40.0),
+                          SimpleNamespace(type='food', x=80.0, y=60.0)]
+        
+    def get_resources_in_range(self, x, y, radius):
+        return [r for r in self.resources if (r.x - x) ** 2 + (r.y - y) ** 2 <= radius ** 2]
+
+
+@pytest.fixture
+def world():
+    world = FakeWorld()
+    world.animal_system = AnimalSystem(world, capacity=2, seed=7)
+    return world
+
+
+def spawn(world, count):
+    kinds = ('wolf', 'deer', 'rabbit')
+    rng = np.random.default_rng(3)
+    return [Animal(world, tuple(rng.uniform(0, world.width, 2)), kinds[i % len(kinds)])
+            for i in range(count)]
+
+
+def test_animal_reads_species_properties(world, capsys):
+    wolf, deer = spawn(world, 2)
+    assert capsys.readouterr().out == ''
+    assert wolf.sprite == '🐺' and deer.sprite == '🦌'
+    assert wolf.is_predator and not deer.is_predator
+    assert len(wolf.color) == 3
+    assert world.animal_system.is_predator[:2].tolist() == [True, False]
+
+
+def test_choose_random_target_stays_in_world(world):
+    animal, = spawn(world, 1)
+    for _ in range(50):
+        animal._choose_random_target()
+        x, y = animal.target_pos
+        assert 0 <= x <= world.width and 0 <= y <= world.height
+
+
+def test_update_and_draw_over_several_ticks(world, capsys):
+    animals = spawn(world, 12)
+    system = world.animal_system
+    system.add_status_effect(animals[1].idx, INJURED, 0.5)
+    surface = pygame.Surface((world.width, world.height))
+    
+    dt = 0.5
+    states = set()
+    for _ in range(40):
+        world.time += dt
+        system.update(dt)
+        system.draw(surface, (0.0, 0.0), 1.0, {'visibility': 0.8})
+        states.update(animal.state for animal in animals)
+        
+    assert capsys.readouterr().out == ''
+    n = system.count
+    assert n == 12
+    assert np.all((system.pos[:n] >= 0) & (system.pos[:n] <= (world.width, world.height)))
+    assert np.all(system.needs[:n, [HUNGER, THIRST]] > 0)
+    assert np.all(system.energy[:n] >= 0) and np.all(system.health[:n] >= 0)
+    assert not system.status_flags[animals[1].idx] & INJURED
+    assert len(states) > 1 and states <= set(ANIMAL_STATES)
+    
+    
+def test_animal_update_steps_system_once(world):
+    animals = spawn(world, 3)
+    system = world.animal_system
+    system.behavior_cooldown[:3] = 10.0
+    for animal in animals:
+        animal.update(1.0)
+    assert np.allclose(system.behavior_cooldown[:3], 9.0)
+    
+    
+def test_cleanup_swaps_last_row_in(world):
+    animals = spawn(world, 3)
+    system = world.animal_system
+    last_pos = system.pos[2].copy()
+    animals[0].cleanup()
+    assert system.count == 2
+    assert animals[2].idx == 0
+    assert np.array_equal(system.pos[0], last_pos)
+    
+    
+@pytest.mark.numba
+def test_integrate_movement_matches_numpy(kernels_match):
+    rng = np.random.default_rng(11)
+    n = 257
+    vel = rng.uniform(-50, 50, (n, 2))
+    vel[::4] = 0
+    kernels_match(animal_module._integrate_movement, animal_module._integrate_movement_numpy,
+                  rng.uniform(-10, 110, (n, 2)), vel, rng.uniform(0, 0.2, n), 100.0, 100.0,
+                  rng.uniform(0, 5, n), rng.integers(len(ANIMAL_STATES), size=n).astype(np.int8), 0.5)
+    
+    
+@pytest.mark.numba
+@pytest.mark.parametrize('is_day', [True, False])
+def test_decide_behaviors_matches_numpy(is_day, kernels_match):
+    rng = np.random.default_rng(5)
+    n = 512
+    kernels_match(animal_module._decide_behaviors, animal_module._decide_behaviors_numpy,
+                  rng.uniform(0, 100, n), rng.integers(3, size=n).astype(np.int8), is_day,
+                  rng.uniform(0, 100, n), rng.uniform(0, 100, n), rng.uniform(0, 100, n),
+                  rng.random(n) < 0.5, rng.uniform(0, 100, n), rng.random(n) < 0.5,
+                  rng.random(n) < 0.5, rng.random(n) < 0.5, rng.random(n) < 0.5, rng.random(n),
+                  np.empty(n, dtype=np.int8))
@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.constants import (
+    ANIMAL_BEHAVIORS, ANIMAL_TYPES, BEHAVIOR_DURATION_HI, BEHAVIOR_DURATION_LO, AnimalId,
+    BehaviorId, NEXT_SEASON_ID, NEXT_SEASON_NAME, SEASON_ORDER, SeasonId, get_animal_sprites,
+    render_emoji, sample_behavior_durations
+)
+
+
+def test_behavior_duration_columns_follow_behavior_ids():
+    for behavior_id in BehaviorId:
+        low, high = ANIMAL_BEHAVIORS[behavior_id.name.lower()]['duration']
+        assert (BEHAVIOR_DURATION_LO[behavior_id], BEHAVIOR_DURATION_HI[behavior_id]) == (low, high)
+        
+        
+def test_sample_behavior_durations_within_each_range():
+    ids = np.random.default_rng(0).integers(len(BehaviorId), size=1000)
+    durations = sample_behavior_durations(ids, np.random.default_rng(1))
+    assert durations.shape == ids.shape
+    assert np.all(durations >= BEHAVIOR_DURATION_LO[ids])
+    assert np.all(durations <= BEHAVIOR_DURATION_HI[ids])
+    
+    
+def test_sample_behavior_durations_matches_seeded_reference():
+    ids = np.arange(len(BehaviorId)).repeat(3)
+    expected = np.random.default_rng(2).uniform(BEHAVIOR_DURATION_LO[ids], BEHAVIOR_DURATION_HI[ids])
+    assert np.array_equal(sample_behavior_durations(ids, np.random.default_rng(2)), expected)
+    assert sample_behavior_durations(ids).shape == ids.shape
+    
+    
+def test_get_animal_sprites_follow_animal_ids():
+    sprites = get_animal_sprites(24)
+    assert len(sprites) == len(AnimalId) == len(ANIMAL_TYPES)
+    for animal_id in AnimalId:
+        expected = render_emoji(ANIMAL_TYPES[animal_id.name.lower()]['sprite'], 24)
+        assert sprites[animal_id] is expected
+    assert get_animal_sprites(24) is sprites
+
+    
+def test_next_season_tables_wrap_around():
+    expected = [(season + 1) % len(SEASON_ORDER) for season in range(len(SEASON_ORDER))]
+    assert NEXT_SEASON_ID.tolist() == expected
+    assert NEXT_SEASON_NAME == tuple(SEASON_ORDER[season] for season in expected)
+    assert NEXT_SEASON_ID[SeasonId(len(SEASON_ORDER) - 1)] == SeasonId(0)
+    assert not NEXT_SEASON_ID.flags.writeable
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from src.entities import entity as entity_module
+
+from src.entities.entity import Entity, EntityPool
+
+
+def test_entity_update_moves_without_a_shared_pool(capsys):
+    entity = Entity(10.0, 20.0)
+    other = Entity(0.0, 0.0)
+    assert entity.pool is not other.pool
+    
+    entity.velocity_x, entity.velocity_y = 1.0, -0.5
+    entity.update(None, 2.0)
+    assert capsys.readouterr().out == ''
+    assert (entity.x, entity.y) == (14.0, 18.0)
+    assert (other.x, other.y) == (0.0, 0.0)
+    
+    
+def test_pool_update_moves_active_entities_once():
+    pool = EntityPool(capacity=2)
+    entities = [Entity(float(i), 0.0, pool=pool) for i in range(5)]
+    for entity in entities:
+        entity.velocity_x = 1.0
+    entities[3].active = False
+    
+    pool.update(None, 0.5)
+    assert pool.x[:pool.count].tolist() == [1.0, 2.0, 3.0, 3.0, 5.0]
+    
+    entities[0].cleanup()
+    assert pool.count == 4 and entities[4].idx == 0 and entities[4].x == 5.0
+
+
+@pytest.mark.numba
+def test_step_entities_matches_numpy(kernels_match):
+    rng = np.random.default_rng(2)
+    n = 301
+    kernels_match(entity_module._step_entities, entity_module._step_entities_numpy,
+                  rng.uniform(-100, 100, n), rng.uniform(-100, 100, n),
+                  rng.uniform(-1, 1, n), rng.uniform(-1, 1, n), rng.uniform(0, 5, n),
+                  rng.random(n) < 0.7, rng.uniform(-1, 3, n), 0.25)
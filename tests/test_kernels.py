@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from src.constants import (
+    NEED_CRITICAL, NEED_DECAY_RATE, PERSONALITY_EFFECT_MATRIX, STATE_NEED_DELTA,
+    STATUS_DURATION, STATUS_EFFECTS, TRAIT_HIGH, TRAIT_LOW, EffectId, TraitId
+)
+from src.world import kernels
+
+
+def random_needs(rng, n=200):
+    return rng.uniform(0, 100, (n, len(NEED_DECAY_RATE))).astype(np.float32)
+
+
+@pytest.mark.numba
+def test_decay_needs_matches_numpy(kernels_match):
+    needs = random_needs(np.random.default_rng(1))
+    needs[::7] = 0.01
+    kernels_match(kernels._decay_needs, kernels._decay_needs_numpy,
+                  needs, np.float32(2.5), NEED_DECAY_RATE, NEED_CRITICAL)
+
+
+@pytest.mark.numba
+def test_tick_state_needs_matches_numpy(kernels_match):
+    rng = np.random.default_rng(4)
+    needs = random_needs(rng)
+    needs[::5] = 99.9
+    states = rng.integers(len(STATE_NEED_DELTA), size=len(needs)).astype(np.intp)
+    kernels_match(kernels._tick_state_needs, kernels._tick_state_needs_numpy,
+                  needs, states, np.float32(3.0), STATE_NEED_DELTA, NEED_CRITICAL)
+
+
+def test_apply_personality_matches_reference():
+    rng = np.random.default_rng(8)
+    n = 50
+    strength = rng.uniform(0, 1, (n, len(TraitId))).astype(np.float32)
+    base = rng.uniform(1, 10, (n, len(EffectId))).astype(np.float32)
+    
+    expected = np.empty_like(base)
+    for i in range(n):
+        for effect in range(len(EffectId)):
+            scale = 1.0 + sum(strength[i, trait] * (PERSONALITY_EFFECT_MATRIX[trait, effect] - 1.0)
+                              for trait in range(len(TraitId)))
+            expected[i, effect] = base[i, effect] * scale
+    assert np.allclose(kernels.apply_personality(strength, base), expected, rtol=1e-5)
+    
+    
+def test_apply_personality_zero_strength_leaves_stats_unchanged():
+    base = np.random.default_rng(9).uniform(1, 10, (6, len(EffectId))).astype(np.float32)
+    strength = np.zeros((6, len(TraitId)), dtype=np.float32)
+    assert np.array_equal(kernels.apply_personality(strength, base), base)
+    
+    
+def test_apply_personality_single_trait_uses_its_multiplier():
+    strength = np.zeros((1, len(TraitId)), dtype=np.float32)
+    strength[0, 0] = 1.0
+    base = np.ones((1, len(EffectId)), dtype=np.float32)
+    assert np.allclose(kernels.apply_personality(strength, base)[0], PERSONALITY_EFFECT_MATRIX[0])
+    
+    
+@pytest.mark.numba
+def test_apply_personality_compiled_matches_numpy(kernels_match):
+    rng = np.random.default_rng(10)
+    kernels_match(kernels._apply_personality, kernels._apply_personality_numpy,
+                  rng.uniform(0, 1, (40, len(TraitId))).astype(np.float32),
+                  rng.uniform(1, 10, (40, len(EffectId))).astype(np.float32),
+                  kernels._PERSONALITY_EFFECT_DELTA)
+    
+    
+def test_tick_status_durations_never_expires_inf():
+    durations = np.array([[5.0, np.inf, 0.5], [np.inf, 1.0, 3.0]], dtype=np.float32)
+    expired = kernels.tick_status_durations(durations, np.float32(1.0))
+    assert expired.tolist() == [[False, False, True], [False, True, False]]
+    assert np.isinf(durations[[0, 1], [1, 0]]).all()
+    assert durations[0, 0] == 4.0
+    
+    
+def test_status_duration_table_marks_permanent_effects_inf():
+    permanent = [effect['duration'] <= 0 for effect in STATUS_EFFECTS.values()]
+    assert np.isinf(STATUS_DURATION).tolist() == permanent
+    
+    
+def test_decay_needs_clamps_and_flags_critical():
+    needs = random_needs(np.random.default_rng(12))
+    needs[0] = 0.0
+    expected = np.maximum(needs - NEED_DECAY_RATE * np.float32(4.0), 0)
+    critical = kernels.decay_needs(needs, 4.0)
+    assert np.allclose(needs, expected)
+    assert (needs[0] == 0).all()
+    assert np.array_equal(critical, expected < NEED_CRITICAL)
+    
+    
+def test_tick_state_needs_clamps_to_range():
+    rng = np.random.default_rng(13)
+    needs = random_needs(rng)
+    needs[:10] = 100.0
+    needs[10:20] = 0.0
+    states = rng.integers(len(STATE_NEED_DELTA), size=len(needs))
+    expected = np.clip(needs + STATE_NEED_DELTA[states] * np.float32(5.0), 0, 100)
+    critical = kernels.tick_state_needs(needs, states, 5.0)
+    assert np.allclose(needs, expected)
+    assert needs.min() >= 0 and needs.max() <= 100
+    assert np.array_equal(critical, expected < NEED_CRITICAL)
+    
+    
+def test_clip_traits_in_place():
+    rng = np.random.default_rng(14)
+    traits = rng.uniform(-2, 2, (30, len(TraitId))).astype(np.float32)
+    expected = np.minimum(np.maximum(traits, TRAIT_LOW), TRAIT_HIGH)
+    result = kernels.clip_traits(traits)
+    assert result is traits
+    assert np.array_equal(traits, expected)
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from src.constants import BIOMES, CHUNK_SIZE, TILE_SIZE, UI_COLORS
+from src.ui.panels.minimap_panel import MinimapPanel
+
+
+def test_initialize_drops_previous_world_caches():
+    panel = MinimapPanel(0, 0, 200, 200)
+    panel.initialize(object())
+    panel.chunk_biome_ids[(0, 0)] = object()
+    panel.terrain_key = (frozenset({(0, 0)}), 1.0, 1.0)
+    panel.terrain_surface = object()
+    
+    panel.initialize(object())
+    assert panel.chunk_biome_ids == {}
+    assert panel.terrain_key is None and panel.terrain_surface is None
+
+
+def test_terrain_surface_colors_match_biomes():
+    biome_names = list(BIOMES)
+    
+    def biome_map(offset):
+        # [y][x] like Chunk.biome_map, with one unknown biome name
+        rows = [[biome_names[(x + y + offset) % len(biome_names)] for x in range(CHUNK_SIZE)]
+                for y in range(CHUNK_SIZE)]
+        rows[0][1] = 'not_a_biome'
+        return rows
+        
+    chunks = {(0, 0): SimpleNamespace(biome_map=biome_map(0)),
+              (1, 1): SimpleNamespace(biome_map=biome_map(3))}
+    world = SimpleNamespace(chunks=chunks, visible_chunks=[(0, 0), (1, 1), (5, 5)])
+    
+    panel = MinimapPanel(0, 0, 200, 200)
+    panel.initialize(world)
+    # One pixel per tile
+    terrain = panel._get_terrain_surface(world, 1 / TILE_SIZE, 1 / TILE_SIZE)
+    assert terrain.get_size() == (2 * CHUNK_SIZE, 2 * CHUNK_SIZE)
+    assert panel.terrain_pos == (0, 0)
+    
+    for (chunk_x, chunk_y), chunk in chunks.items():
+        for y, row in enumerate(chunk.biome_map):
+            for x, name in enumerate(row):
+                expected = BIOMES[name].color if name in BIOMES else UI_COLORS['minimap_unknown'][:3]
+                pixel = terrain.get_at((chunk_x * CHUNK_SIZE + x, chunk_y * CHUNK_SIZE + y))
+                assert tuple(pixel)[:3] == tuple(expected)
+                
+    # Chunks that are not loaded show the background
+    assert tuple(terrain.get_at((CHUNK_SIZE, 0)))[:3] == tuple(UI_COLORS['minimap_bg'][:3])
+    assert panel._get_terrain_surface(world, 1 / TILE_SIZE, 1 / TILE_SIZE) is terrain
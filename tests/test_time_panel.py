@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+import pygame
+
+from src.constants import render_styled
+from src.ui.panels.time_panel import TimePanel
+
+
+def test_clock_and_temperature_bypass_label_cache():
+    panel = TimePanel(0, 0, 300, 200)
+    world = SimpleNamespace(time_system=object())
+    surface = pygame.Surface((400, 300))
+    panel.draw(surface, world)
+    
+    before = render_styled.cache_info().currsize
+    for minute in range(30):
+        panel.time_text = f"Day 1 - 00:{minute:02d}"
+        panel.temperature_text = f"Temperature: {minute}.0°C"
+        panel.draw(surface, world)
+    assert render_styled.cache_info().currsize == before